@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+search_index 레이아웃 비교: 일반 FTS5 (title/content 사본 저장) vs external content (nodes 참조)
+  external 쪽은 현재 schema.sql 그대로 (접두어 색인 + search_ids trigram 포함)
+- 같은 nodes 행으로 DB 두 개를 만들어 VACUUM 후 파일 크기 / FTS 테이블 크기 비교
+- 적재 시간 (nodes INSERT + 색인), 검색 지연 (rank 상위 20개, snippet 포함 / 미포함)
+- 두 레이아웃의 검색 결과 (node_id 순서)가 같은지 먼저 확인
+
+노드 입력:
+    --db data/obc.db   : 기존 DB의 nodes
+    (기본)             : codevault/public/data/partN.json 전체 (import_part_json과 같은 행)
+
+사용법:
+    python _experiments/bench_fts_layout.py
+    python _experiments/bench_fts_layout.py --db ../data/obc.db
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db_utils import SCHEMA_PATH, FTS_TABLES, with_content_hash, suspend_triggers, resume_triggers
+from fts_index import table_sizes
+from import_part_json import DATA_DIR, iter_part_rows
+
+# 이전 레이아웃 (schema.sql 4-5절의 external content 적용 전)
+PLAIN_FTS_DDL = """
+CREATE VIRTUAL TABLE search_index USING fts5(
+    node_id, title, content, tokenize='porter unicode61'
+);
+"""
+
+QUERIES = [
+    'ventilation', 'fire separation', 'guard* height', 'smoke alarm', 'footing',
+    'stair riser', '"means of egress"', 'insulation NEAR vapour', 'sewage tank', 'handrail',
+]
+
+
+def load_source_rows(db_path: Path) -> list:
+    """(id, type, part, parent_id, title, content, page, seq)"""
+    if db_path:
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT id, type, part, parent_id, title, content, page, seq FROM nodes ORDER BY rowid").fetchall()
+        conn.close()
+        return rows
+
+    rows = {}
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, 'part*.json'))):
+        if not re.fullmatch(r'part\d+\.json', os.path.basename(path)):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for row in iter_part_rows(data):
+            rows[row[0]] = row
+    return list(rows.values())
+
+
+def build(path: str, rows: list, external: bool) -> dict:
+    """schema.sql (external) 또는 이전 FTS 레이아웃으로 DB 생성 → 적재 시간 / 크기"""
+    conn = sqlite3.connect(path, isolation_level=None)
+    schema = SCHEMA_PATH.read_text(encoding='utf-8')
+    if not external:
+        # search_index / 동기화 트리거만 이전 정의로
+        schema = re.sub(r'CREATE VIEW IF NOT EXISTS search_source.*?;', '', schema, flags=re.S)
+        schema = re.sub(r'CREATE VIRTUAL TABLE IF NOT EXISTS search_index.*?\);', PLAIN_FTS_DDL, schema, flags=re.S)
+        schema = re.sub(r'CREATE VIRTUAL TABLE IF NOT EXISTS search_ids.*?\);', '', schema, flags=re.S)
+        schema = re.sub(r'CREATE TRIGGER IF NOT EXISTS nodes_(id_)?a[iud] .*?END;', '', schema, flags=re.S)
+    conn.executescript(schema)
+
+    # save_to_db와 같은 대량 적재: 트리거 없이 nodes INSERT 후 색인 1회
+    t0 = time.perf_counter()
+    conn.execute("BEGIN")
+    trigger_sqls = suspend_triggers(conn.cursor())
+    conn.executemany('''
+        INSERT INTO nodes (id, type, part, parent_id, title, content, page, seq, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', with_content_hash(rows))
+    if external:
+        for table in FTS_TABLES:
+            conn.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+    else:
+        conn.execute("INSERT INTO search_index (node_id, title, content) SELECT id, title, content FROM nodes")
+    resume_triggers(conn.cursor(), trigger_sqls)
+    conn.execute("COMMIT")
+    load_time = time.perf_counter() - t0
+
+    for table in FTS_TABLES if external else ('search_index',):
+        conn.execute(f"INSERT INTO {table} ({table}) VALUES ('optimize')")
+    conn.execute("VACUUM")
+    sizes = table_sizes(conn)
+    conn.close()
+    return {
+        'load_time': load_time,
+        'file': os.path.getsize(path),
+        'nodes': sizes.get('nodes', 0),
+        'fts': sum(size for name, size in sizes.items() if name.startswith('search_')),
+    }
+
+
+def run_queries(path: str, with_snippet: bool, repeat: int):
+    """→ (쿼리별 결과 node_id 목록, 쿼리 1회 평균 ms (가장 빠른 반복 기준))"""
+    conn = sqlite3.connect(path)
+    cols = "node_id, snippet(search_index, 2, '[', ']', '...', 12)" if with_snippet else "node_id"
+    sql = f"SELECT {cols} FROM search_index WHERE search_index MATCH ? ORDER BY rank LIMIT 20"
+
+    results = [[row[0] for row in conn.execute(sql, (q,))] for q in QUERIES]  # warm-up + 비교용
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for q in QUERIES:
+            conn.execute(sql, (q,)).fetchall()
+        best = min(best, time.perf_counter() - t0)
+    conn.close()
+    return results, best / len(QUERIES) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='search_index 레이아웃 크기 / 지연 비교')
+    parser.add_argument('--db', type=Path, help='nodes를 가져올 SQLite DB (기본: Part JSON 전체)')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rows = load_source_rows(args.db)
+    text_bytes = sum(len((r[4] or '').encode()) + len((r[5] or '').encode()) for r in rows)
+    print(f"Nodes: {len(rows):,} ({text_bytes / 1024 / 1024:.1f} MB title+content)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain_path, external_path = os.path.join(tmp, 'plain.db'), os.path.join(tmp, 'external.db')
+        plain = build(plain_path, rows, external=False)
+        external = build(external_path, rows, external=True)
+
+        # 1. 결과 동일성
+        for with_snippet in (False, True):
+            plain_res, plain['q_snip' if with_snippet else 'q'] = run_queries(plain_path, with_snippet, args.repeat)
+            ext_res, external['q_snip' if with_snippet else 'q'] = run_queries(external_path, with_snippet, args.repeat)
+            if plain_res != ext_res:
+                print("[ERROR] query results differ")
+                sys.exit(1)
+        print(f"[OK] identical results for {len(QUERIES)} queries")
+
+    # 2. 크기 / 시간
+    kb = 1024
+    print(f"  {'':10} {'file':>10} {'nodes':>10} {'fts':>10} {'load':>8} {'query':>9} {'+snippet':>9}")
+    for label, r in (('plain', plain), ('external', external)):
+        print(f"  {label:10} {r['file'] / kb:8.0f}KB {r['nodes'] / kb:8.0f}KB {r['fts'] / kb:8.0f}KB "
+              f"{r['load_time']:7.3f}s {r['q']:7.3f}ms {r['q_snip']:7.3f}ms")
+    print(f"  file size: {plain['file'] / external['file']:.2f}x smaller, "
+          f"fts: {plain['fts'] / max(external['fts'], 1):.2f}x smaller")
+
+
+if __name__ == '__main__':
+    main()
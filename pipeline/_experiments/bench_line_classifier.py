@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+줄 분류기 벤치마크: 기존 re.match 캐스케이드 vs 단일 패스 분류기
+- 코퍼스: Part 9 전체 페이지의 정리된 줄 (페이지 캐시 사용)
+- 두 구현의 결과가 모든 줄에서 같은지 먼저 확인한 뒤 lines/s 비교
+
+사용법:
+    python _experiments/bench_line_classifier.py
+    python _experiments/bench_line_classifier.py --corpus lines.txt   # PDF 없이 텍스트 파일로
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from patterns import PATTERNS, detect_type, detect_id_only
+
+
+# === 기존 구현 (비교 기준) ===
+
+def detect_type_cascade(line: str):
+    """patterns.detect_type 이전 버전 (순차 re.match 캐스케이드)"""
+    line = line.strip()
+    if not line:
+        return None
+    if line.isdigit():
+        return None
+    if 'Building Code' in line or 'Division B' in line:
+        return None
+
+    if m := PATTERNS['sub_article'].match(line):
+        return ('sub_article', {'id': m.group(1), 'title': m.group(2).strip()})
+    if m := PATTERNS['article_0a'].match(line):
+        return ('article_0a', {'id': m.group(1) + '.0A', 'title': m.group(2).strip()})
+    if m := PATTERNS['article_suffix'].match(line):
+        return ('article_suffix', {'id': m.group(1), 'title': m.group(2).strip()})
+    if m := PATTERNS['alt_subsection'].match(line):
+        return ('alt_subsection', {'id': m.group(1), 'title': m.group(2).strip()})
+    if m := PATTERNS['article'].match(line):
+        return ('article', {'id': m.group(1), 'title': m.group(2).strip()})
+    if m := PATTERNS['subsection'].match(line):
+        return ('subsection', {'id': m.group(1), 'title': m.group(2).strip()})
+    if m := re.match(r'^\((\d+)\)\s+([A-Z].+)', line):
+        return ('clause', {'num': m.group(1), 'content': m.group(2).strip()})
+    if m := re.match(r'^\(([a-z])\)\s+(.+)', line):
+        return ('subclause', {'letter': m.group(1), 'content': m.group(2).strip()})
+    if m := re.match(r'^\(([ivx]+)\)\s+(.+)', line):
+        return ('subsubclause', {'numeral': m.group(1), 'content': m.group(2).strip()})
+    return None
+
+
+def is_id_only_cascade(line: str):
+    """parse_part9.is_id_only 이전 버전"""
+    for node_type, pattern in (
+        ('subsection', r'^(9\.\d+\.\d+)\.\s*$'),
+        ('article', r'^(9\.\d+\.\d+\.\d+)\.\s*$'),
+        ('alt_subsection', r'^(9\.\d+\.\d+[A-Z])\.\s*$'),
+        ('sub_article', r'^(9\.\d+\.\d+[A-Z]\.\d+)\.\s*$'),
+        ('article_suffix', r'^(9\.\d+\.\d+\.\d+[A-Z])\.\s*$'),
+    ):
+        m = re.match(pattern, line)
+        if m:
+            return (node_type, m.group(1))
+    return None
+
+
+def classify_cascade(line: str):
+    return is_id_only_cascade(line) or detect_type_cascade(line)
+
+
+def classify_single_pass(line: str):
+    return detect_id_only(line) or detect_type(line)
+
+
+# === 코퍼스 ===
+
+def load_part9_lines() -> list:
+    """Part 9 전체 페이지의 줄 목록 (parse_page가 보는 것과 같은 strip된 줄)"""
+    from parse_part9 import (PDF_PATH, PART9_START, PART9_END, EXTRACT_MODES,
+                             DEFAULT_EXTRACT_MODE, iter_page_texts)
+    from page_cache import PageTextCache
+
+    with PageTextCache(PDF_PATH, *EXTRACT_MODES[DEFAULT_EXTRACT_MODE]) as cache:
+        lines = []
+        for _, text in iter_page_texts(PDF_PATH, PART9_START, PART9_END, cache=cache):
+            lines.extend(l.strip() for l in text.split('\n') if l.strip())
+        cache.report()
+    return lines
+
+
+def bench(fn, lines: list, repeat: int) -> float:
+    """가장 빠른 반복의 lines/s"""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for line in lines:
+            fn(line)
+        best = min(best, time.perf_counter() - t0)
+    return len(lines) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='줄 분류기 벤치마크')
+    parser.add_argument('--corpus', type=Path, help='줄 단위 텍스트 파일 (기본: Part 9 PDF)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.corpus:
+        lines = [l.strip() for l in args.corpus.read_text(encoding='utf-8').split('\n') if l.strip()]
+    else:
+        lines = load_part9_lines()
+    print(f"Corpus: {len(lines):,} lines")
+
+    # 1. 결과 동일성 확인
+    mismatches = [l for l in lines if classify_cascade(l) != classify_single_pass(l)]
+    if mismatches:
+        print(f"[ERROR] {len(mismatches)} lines differ, e.g.:")
+        for line in mismatches[:10]:
+            print(f"  {line!r}")
+            print(f"    cascade:     {classify_cascade(line)}")
+            print(f"    single-pass: {classify_single_pass(line)}")
+        sys.exit(1)
+    print("[OK] identical (type, data) for every line")
+
+    # 2. 속도
+    before = bench(classify_cascade, lines, args.repeat)
+    after = bench(classify_single_pass, lines, args.repeat)
+    print(f"  cascade:     {before:12,.0f} lines/s")
+    print(f"  single-pass: {after:12,.0f} lines/s  ({after / before:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
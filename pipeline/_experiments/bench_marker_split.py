@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Marker Part 본문 → Section / Subsection 분할: 기존 줄 목록 + content += vs iter_subsections (버퍼 구간)
+- 입력 1: marker_output/section_9_4.md (Part 7로 재번호)를 Subsection 수만큼 반복 (일반적인 모양)
+- 입력 2: Subsection 1개에 파이프 테이블 행 N줄 (Part 7 배관 표처럼 긴 Subsection)
+- 결과가 같은지 먼저 확인 → 시간 / tracemalloc 피크 (입력 크기 대비)
+
+사용법:
+    python _experiments/bench_marker_split.py
+    python _experiments/bench_marker_split.py --rows 20000 80000
+"""
+
+import argparse
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from marker_engine import PART_CONFIGS, split_sections
+
+SAMPLE_PATH = Path(__file__).parent / "marker_output" / "section_9_4.md"
+PART = '7'
+
+
+# === 기존 구현 (비교 기준) ===
+
+def split_sections_lines(content: str, config: dict) -> list:
+    """marker_engine.split_sections 이전 버전 (split('\\n') 후 Subsection마다 content += line)"""
+    prefix = re.escape(config['id'])
+    section_titles = config['sections']
+    subsection_titles = config['subsections']
+    suffix = '[A-Z]?' if config['alt_subsections'] else ''
+    section_re = re.compile(rf'^#{{1,4}}\s*Section\s*({prefix}\.\d+)\.\s*(.*)$')
+    subsection_re = re.compile(rf'^#{{1,4}}\s*({prefix}\.\d+\.\d+{suffix})\.(?!\d)\s*(.*)$')
+
+    sections = []
+    current_section = None
+    current_subsection = None
+    for line in content.split('\n'):
+        section_match = section_re.match(line)
+        subsection_match = subsection_re.match(line)
+        if section_match:
+            section_id = section_match.group(1)
+            section_title = ''
+            if config['heading_titles']:
+                section_title = section_match.group(2).strip()
+                if config['strip_title_tags']:
+                    section_title = re.sub(r'<[^>]+>', '', section_title)
+            if current_section:
+                if current_subsection:
+                    current_section['subsections'].append(current_subsection)
+                sections.append(current_section)
+            current_section = {'id': section_id, 'title': section_titles.get(section_id, section_title),
+                               'subsections': []}
+            current_subsection = None
+            continue
+        if subsection_match:
+            subsection_id = subsection_match.group(1)
+            subsection_title = ''
+            if config['heading_titles']:
+                subsection_title = subsection_match.group(2).strip()
+                subsection_title = re.sub(r'\*{1,2}', '', subsection_title)
+                subsection_title = re.sub(r'\s*[er]\d+$', '', subsection_title)
+                if config['strip_title_tags']:
+                    subsection_title = re.sub(r'<[^>]+>', '', subsection_title)
+            if current_subsection and current_section:
+                current_section['subsections'].append(current_subsection)
+            if not current_section:
+                section_id = '.'.join(subsection_id.split('.')[:2])
+                current_section = {'id': section_id, 'title': section_titles.get(section_id, ''), 'subsections': []}
+            current_subsection = {'id': subsection_id, 'title': subsection_titles.get(subsection_id, subsection_title),
+                                  'content': ''}
+            continue
+        if current_subsection is not None:
+            current_subsection['content'] += line + '\n'
+
+    if current_subsection and current_section:
+        current_section['subsections'].append(current_subsection)
+    if current_section:
+        sections.append(current_section)
+    return sections
+
+
+# === 입력 ===
+
+def sample_part(copies: int) -> str:
+    text = SAMPLE_PATH.read_text(encoding='utf-8')
+    return '\n'.join(text.replace('9.4.', f'{PART}.{i}.') for i in range(1, copies + 1))
+
+
+def long_subsection(rows: int) -> str:
+    row = '| 7.2.5.15 | Water closet, flush tank | 1.8 | 32 | see Note (3) |'
+    return ('# Section 7.2. Materials\n# 7.2.5. Piping\n### Table 7.2.5.15. Fixture Units\n'
+            '| Item | Fixture | Load | Size | Notes |\n|---|---|---|---|---|\n' + '\n'.join([row] * rows) + '\n')
+
+
+def measure(split, content: str, config: dict) -> tuple:
+    """→ (결과, 초, tracemalloc 피크 바이트)"""
+    t0 = time.perf_counter()
+    result = split(content, config)
+    seconds = time.perf_counter() - t0
+    tracemalloc.start()
+    split(content, config)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='split_sections: content += vs 버퍼 구간')
+    parser.add_argument('--copies', type=int, nargs='+', default=[10, 40, 160])
+    parser.add_argument('--rows', type=int, nargs='+', default=[5000, 20000, 40000])
+    args = parser.parse_args()
+
+    config = PART_CONFIGS[PART]
+    inputs = [(f'sample x{n}', sample_part(n)) for n in args.copies]
+    inputs += [(f'table {n} rows', long_subsection(n)) for n in args.rows]
+
+    mb = 1024 * 1024
+    print(f"  {'input':18} {'MB':>6} {'lines+= s':>10} {'peak MB':>8} {'buffer s':>9} {'peak MB':>8}")
+    for label, content in inputs:
+        base, old_seconds, old_peak = measure(split_sections_lines, content, config)
+        result, new_seconds, new_peak = measure(split_sections, content, config)
+        if result != base:
+            print(f"[ERROR] {label}: split_sections differs from the line-based version")
+            sys.exit(1)
+        print(f"  {label:18} {len(content) / mb:6.1f} {old_seconds:10.3f} {old_peak / mb:8.1f} "
+              f"{new_seconds:9.3f} {new_peak / mb:8.1f}")
+    print("[OK] identical sections")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Subsection 후처리: transform_content (정규식 체인) vs transform_content_fused (단일 패스)
+- 입력: convert_part와 같은 전처리 (목차 건너뛰기 → clean_text → split_sections)를 거친 Subsection content
+    301880_full.md가 있으면 Part 6 / 7, 없으면 marker_output/section_9_4.md를 Part 6 / 7로 재번호
+- 결과가 같은지 먼저 확인 → 가장 빠른 반복 기준 subsections/s, MB/s
+
+사용법:
+    python _experiments/bench_marker_transform.py
+    python _experiments/bench_marker_transform.py --marker ../data/marker/301880_full.md --repeat 5
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from marker_engine import (MARKER_PATH, PART_CONFIGS, clean_text, extract_part, read_marker, split_sections,
+                           transform_content, transform_content_fused)
+
+SAMPLE_PATH = Path(__file__).parent / "marker_output" / "section_9_4.md"
+PARTS = ('6', '7')
+
+
+def subsections(part_id: str, marker: Path) -> list:
+    """Part → 변환 전 Subsection content 목록"""
+    config = PART_CONFIGS[part_id]
+    if marker.exists():
+        content = extract_part(read_marker(marker), part_id)
+    else:
+        content = SAMPLE_PATH.read_text(encoding='utf-8').replace('9.4.', f'{part_id}.1.')
+    for pattern in config['body_start']:
+        m = re.search(pattern, content, re.MULTILINE)
+        if m:
+            content = content[m.start():]
+            break
+    sections = split_sections(clean_text(content, **config['clean']), config)
+    return [sub['content'] for section in sections for sub in section['subsections']]
+
+
+def measure(transform, contents: list, config: dict, repeat: int) -> tuple:
+    """→ (결과 목록, 가장 빠른 반복 시간)"""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [transform(content, config) for content in contents]
+        best = min(best, time.perf_counter() - t0)
+    return results, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='transform_content vs transform_content_fused 처리량')
+    parser.add_argument('--marker', type=Path, default=MARKER_PATH)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scale', type=int, default=1, help='입력 반복 횟수 (샘플이 작을 때)')
+    args = parser.parse_args()
+
+    source = args.marker if args.marker.exists() else SAMPLE_PATH
+    print(f"Input: {source}")
+    print(f"  {'part':4} {'subs':>6} {'MB':>6} {'chain':>14} {'fused':>14} {'speedup':>8}")
+    for part_id in PARTS:
+        config = PART_CONFIGS[part_id]
+        contents = subsections(part_id, args.marker) * args.scale
+        mb = sum(len(content.encode('utf-8')) for content in contents) / 1e6
+
+        expected, chain = measure(transform_content, contents, config, args.repeat)
+        results, fused = measure(transform_content_fused, contents, config, args.repeat)
+        if results != expected:
+            print(f"[ERROR] Part {part_id}: fused output differs from transform_content")
+            sys.exit(1)
+
+        print(f"  {part_id:4} {len(contents):6} {mb:6.2f} "
+              f"{len(contents) / chain:8.0f} sub/s {len(contents) / fused:8.0f} sub/s {chain / fused:7.2f}x")
+        print(f"  {'':4} {'':6} {'':6} {mb / chain:9.2f} MB/s {mb / fused:9.2f} MB/s")
+    print("[OK] identical results")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+읽기 경로 비교: 스크립트마다 하던 방식 (호출마다 sqlite3.connect + SELECT) vs query.NodeStore
+- get_node: 모든 노드 1개씩
+- get_subtree: 모든 subsection 하위 트리 (기존 방식은 id LIKE 'X.%' 후 파이썬 정렬)
+- NodeStore는 cold (빈 캐시) / warm (같은 generation에서 다시 호출) 따로 측정
+- 같은 결과인지 먼저 확인
+
+사용법:
+    python _experiments/bench_query.py
+    python _experiments/bench_query.py --db ../data/obc.db --threads 4
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db_utils import DB_PATH
+from patterns import id_sort_key
+from query import NodeStore
+
+
+def adhoc_node(db_path: Path, node_id: str):
+    conn = sqlite3.connect(db_path)
+    row = conn.execute("SELECT id, title, content FROM nodes WHERE id = ?", (node_id,)).fetchone()
+    conn.close()
+    return row
+
+
+def adhoc_subtree(db_path: Path, root_id: str) -> list:
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT id FROM nodes WHERE id = ? OR id LIKE ?", (root_id, f'{root_id}.%')).fetchall()
+    conn.close()
+    return sorted((row[0] for row in rows), key=id_sort_key)
+
+
+def timed(fn, items, threads: int) -> float:
+    t0 = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(fn, items))
+    else:
+        for item in items:
+            fn(item)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='obc.db 읽기 경로 비교')
+    parser.add_argument('--db', type=Path, default=DB_PATH)
+    parser.add_argument('--threads', type=int, default=1)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    node_ids = [row[0] for row in conn.execute("SELECT id FROM nodes ORDER BY rowid")]
+    roots = [row[0] for row in conn.execute("SELECT id FROM nodes WHERE type = 'subsection'")]
+    conn.close()
+    print(f"DB: {args.db} ({len(node_ids):,} nodes, {len(roots)} subsections, {args.threads} threads)")
+
+    store = NodeStore(args.db, pool_size=max(args.threads, 1))
+
+    # 0. 결과 동일성 (문서 순서 = ID 정렬 순서인 하위 트리 기준)
+    for root in roots:
+        if [n['id'] for n in store.get_subtree(root)] != adhoc_subtree(args.db, root):
+            print(f"[ERROR] subtree differs: {root}")
+            sys.exit(1)
+    print(f"[OK] identical subtrees for {len(roots)} subsections")
+
+    results = []
+    for label, fn, items in (
+        ('get_node', lambda i: adhoc_node(args.db, i), node_ids),
+        ('get_subtree', lambda r: adhoc_subtree(args.db, r), roots),
+    ):
+        results.append((f'{label} (connect + SELECT)', timed(fn, items, args.threads), len(items)))
+
+    for label, fn, items in (
+        ('get_node', store.get_node, node_ids),
+        ('get_subtree', store.get_subtree, roots),
+    ):
+        store.cache.sync(None)  # cold: 캐시 비움
+        cold = timed(fn, items, args.threads)
+        warm = timed(fn, items, args.threads)
+        results.append((f'{label} (NodeStore cold)', cold, len(items)))
+        results.append((f'{label} (NodeStore warm)', warm, len(items)))
+
+    t0 = time.perf_counter()
+    store.cache.sync(None)
+    store.get_many(node_ids)
+    results.append(('get_many (all, cold)', time.perf_counter() - t0, 1))
+    store.close()
+
+    for label, seconds, n in results:
+        print(f"  {label:32} {seconds * 1000:9.1f}ms  {seconds / n * 1e6:9.1f}us/call")
+
+
+if __name__ == '__main__':
+    main()
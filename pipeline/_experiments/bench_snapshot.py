@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+작업 DB (obc.db, 기본 연결) vs publish.py 스냅샷 (immutable=1 + mmap) 조회 지연
+- 같은 작업량: get_node (PK), 하위 트리 (nested set 범위), search.search (FTS + ID)
+- cold: 쿼리마다 새 연결 (열기 + 스키마 파싱 + 빈 SQLite 페이지 캐시) - OS 파일 캐시는 따뜻한 상태
+- warm: 연결 1개로 반복, 가장 빠른 반복 기준
+- 스냅샷 page_size별 (4096 / 8192 / 16384) 파일 크기도 같이 비교
+- 결과가 작업 DB와 같은지 먼저 확인
+
+사용법:
+    python _experiments/bench_snapshot.py
+    python _experiments/bench_snapshot.py --db ../data/obc.db --repeat 10
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db_utils import DB_PATH
+from publish import publish, open_snapshot
+from query import NODE_SQL, SUBTREE_SQL
+import search
+
+PAGE_SIZES = (4096, 8192, 16384)
+SEARCHES = ['guard height', 'smoke alarm', '9.8.2', 'sewage tank', 'fire separation',
+            '2.4', 'ventilation', 'stair', '7.2.2.4', 'insulation']
+KINDS = ('node', 'subtree', 'search')
+
+
+def workload(db_path: Path, samples: int) -> list:
+    """[(kind, params)] (같은 시드 → 모든 DB에 같은 쿼리)"""
+    conn = sqlite3.connect(db_path)
+    ids = [row[0] for row in conn.execute("SELECT id FROM nodes ORDER BY id")]
+    roots = [row[0] for row in conn.execute("SELECT id FROM nodes WHERE type IN ('section', 'subsection') ORDER BY id")]
+    conn.close()
+    rng = random.Random(0)
+    items = [('node', (node_id,)) for node_id in rng.sample(ids, min(samples, len(ids)))]
+    items += [('subtree', {'root': root, 'max_depth': None}) for root in rng.sample(roots, min(samples // 4, len(roots)))]
+    items += [('search', q) for q in SEARCHES]
+    return items
+
+
+def run(conn: sqlite3.Connection, kind: str, params):
+    if kind == 'node':
+        return conn.execute(NODE_SQL, params).fetchall()
+    if kind == 'subtree':
+        return [row[0] for row in conn.execute(SUBTREE_SQL, params)]
+    return [r['id'] for r in search.search(conn, params, 20)]
+
+
+def measure(opener, items: list, repeat: int) -> tuple:
+    """→ (결과 목록, {kind: (cold us/query, warm us/query)})"""
+    times = {}
+    for kind in KINDS:
+        batch = [params for k, params in items if k == kind]
+        t0 = time.perf_counter()
+        for params in batch:
+            conn = opener()
+            run(conn, kind, params)
+            conn.close()
+        cold = (time.perf_counter() - t0) / len(batch) * 1e6
+
+        conn = opener()
+        for params in batch:  # warm-up
+            run(conn, kind, params)
+        best = float('inf')
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for params in batch:
+                run(conn, kind, params)
+            best = min(best, time.perf_counter() - t0)
+        conn.close()
+        times[kind] = (cold, best / len(batch) * 1e6)
+
+    conn = opener()
+    results = [run(conn, kind, params) for kind, params in items]
+    conn.close()
+    return results, times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='작업 DB vs 스냅샷 조회 지연 (cold / warm)')
+    parser.add_argument('--db', type=Path, default=DB_PATH)
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    items = workload(args.db, args.samples)
+    print(f"DB: {args.db} ({os.path.getsize(args.db) / 1024:.0f} KB), {len(items)} queries")
+
+    rows = []
+    base, times = measure(lambda: sqlite3.connect(args.db), items, args.repeat)
+    rows.append(('working (default)', os.path.getsize(args.db), times, None))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for page_size in PAGE_SIZES:
+            path = Path(tmp) / f'snapshot_{page_size}.db'
+            stats = publish(args.db, path, page_size)
+            results, times = measure(lambda: open_snapshot(path), items, args.repeat)
+            if results != base:
+                print(f"[ERROR] snapshot (page_size {page_size}) results differ from the working DB")
+                sys.exit(1)
+            rows.append((f'snapshot {page_size}', stats['snapshot_bytes'], times, stats['seconds']))
+    print("[OK] identical results")
+
+    header = ''.join(f" {kind + ' cold':>13} {kind + ' warm':>13}" for kind in KINDS)
+    print(f"  {'':18} {'file':>8}{header} {'publish':>8}")
+    for label, size, times, seconds in rows:
+        cells = ''.join(f" {times[kind][0]:11.1f}us {times[kind][1]:11.1f}us" for kind in KINDS)
+        publish_time = f"{seconds:7.2f}s" if seconds is not None else ''
+        print(f"  {label:18} {size / 1024:6.0f}KB{cells} {publish_time:>8}")
+
+
+if __name__ == '__main__':
+    main()
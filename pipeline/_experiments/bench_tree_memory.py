@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+TreeBuilder 메모리 벤치마크 (tracemalloc): 기존 dataclass Node vs __slots__ + 인덱스 배열
+- 트리 보관 메모리: 노드 전체를 add_node 한 뒤 남아 있는 크기
+- 저장 시 피크: 기존 to_dict() 복사 vs iter_rows() / iter_ref_rows() 스트리밍 (sqlite :memory:로 INSERT)
+- 참조: 기존은 add_node마다 extract_references, 새 방식은 구축 후 resolve_references 1회 (build 시간에 포함)
+
+노드 입력:
+    --db data/obc.db   : DB의 노드를 rowid 순서(= 저장 당시 add_node 순서)로 재생
+    (기본)             : Compendium 규모의 합성 트리 (--scale로 크기 조절)
+
+사용법:
+    python _experiments/bench_tree_memory.py
+    python _experiments/bench_tree_memory.py --db ../data/obc.db
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from patterns import extract_references
+from tree_builder import TreeBuilder, TYPE_LEVELS
+
+
+# === 기존 구현 (비교 기준) ===
+
+@dataclass
+class LegacyNode:
+    """tree_builder.Node 이전 버전"""
+    id: str
+    type: str
+    part: int = 9
+    parent_id: Optional[str] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    page: int = 0
+    seq: int = 0
+    children: List[str] = field(default_factory=list)
+    refs: Dict = field(default_factory=dict)
+
+
+class LegacyTreeBuilder(TreeBuilder):
+    """노드 저장만 이전 방식 (parent 탐색 / 스택은 TreeBuilder 그대로)"""
+
+    def add_node(self, node_type, node_id, title=None, content=None, page=0):
+        parent_id = self._find_parent(node_type, node_id)
+        seq = self._get_next_seq(parent_id)
+        node = LegacyNode(id=node_id, type=node_type, part=self.part_num, parent_id=parent_id,
+                          title=title, content=content, page=page, seq=seq)
+        if content:
+            node.refs = extract_references(content, self.part_num)
+        self.nodes[node_id] = node
+        if parent_id and parent_id in self.nodes:
+            self.nodes[parent_id].children.append(node_id)
+        self._update_stack(node_type, node_id)
+        return node
+
+    def resolve_references(self):
+        return {}  # 이전 방식은 add_node에서 노드별로 추출
+
+    def to_dict(self):
+        return {
+            node_id: {
+                'id': node.id, 'type': node.type, 'part': node.part,
+                'parent_id': node.parent_id, 'title': node.title, 'content': node.content,
+                'page': node.page, 'seq': node.seq, 'refs': node.refs,
+            }
+            for node_id, node in self.nodes.items()
+        }
+
+
+def save_legacy(builder: LegacyTreeBuilder, cursor):
+    """이전 save_to_db 방식: to_dict() 복사 후 행 단위 INSERT"""
+    for node_id, node in builder.to_dict().items():
+        cursor.execute('INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+            node['id'], node['type'], node['part'], node['parent_id'],
+            node['title'], node['content'], node['page'], node['seq']))
+        for ref_type, ref_list in node['refs'].items():
+            for ref in ref_list:
+                cursor.execute('INSERT INTO refs VALUES (?, ?, ?)', (node_id, ref, ref_type.rstrip('s')))
+
+
+def save_streaming(builder: TreeBuilder, cursor):
+    cursor.executemany('INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?)', builder.iter_rows())
+    cursor.executemany('INSERT INTO refs VALUES (?, ?, ?)', builder.iter_ref_rows())
+
+
+# === 입력 ===
+
+def synthetic_events(scale: int) -> list:
+    """(part, type, id, title, content, page) - Part 8~12 × Section/Subsection/Article/Clause"""
+    events = []
+    page = 0
+    for part in (8, 9, 10, 11, 12):
+        events.append((part, 'part', str(part), f'Part {part}', None, page))
+        for s in range(1, 4 * scale + 1):
+            sec = f'{part}.{s}'
+            events.append((part, 'section', sec, f'Section {sec}', None, page))
+            for ss in range(1, 9):
+                sub = f'{sec}.{ss}'
+                events.append((part, 'subsection', sub, f'Subsection title {sub}', None, page))
+                for a in range(1, 6):
+                    art = f'{sub}.{a}'
+                    page += 1
+                    events.append((part, 'article', art, f'Article title {art}', None, page))
+                    for c in range(1, 4):
+                        content = (f'Except as provided in Sentence ({c + 1}), the requirements of '
+                                   f'Article {art} and Table {sub}.{a}. shall apply to every '
+                                   f'building described in Subsection {sub}.\n(a) item one,\n(b) item two.')
+                        events.append((part, 'clause', f'{art}.({c})', None, content, page))
+    return events
+
+
+def db_events(db_path: Path) -> list:
+    """DB 노드를 rowid 순서로 (Part 9 파서가 저장한 순서)"""
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute('''
+        SELECT part, type, id, title, content, page FROM nodes ORDER BY part, rowid
+    ''').fetchall()
+    conn.close()
+    return [r for r in rows if r[1] in TYPE_LEVELS]
+
+
+# === 측정 ===
+
+def build(cls, events: list) -> dict:
+    builders = {}
+    for part, node_type, node_id, title, content, page in events:
+        builder = builders.get(part)
+        if builder is None:
+            builder = builders[part] = cls(part_num=part)
+        builder.add_node(node_type, node_id, title=title, content=content, page=page or 0)
+    for builder in builders.values():
+        builder.resolve_references()
+    return builders
+
+
+def measure(cls, save, events: list) -> dict:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    builders = build(cls, events)
+    build_time = time.perf_counter() - t0
+    retained, _ = tracemalloc.get_traced_memory()
+
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE nodes (id, type, part, parent_id, title, content, page, seq)')
+    conn.execute('CREATE TABLE refs (source_id, target_id, target_type)')
+    tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    for builder in builders.values():
+        save(builder, conn.cursor())
+    save_time = time.perf_counter() - t0
+    _, save_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rows = conn.execute('SELECT * FROM nodes ORDER BY id').fetchall()
+    refs = conn.execute('SELECT * FROM refs ORDER BY 1, 2, 3').fetchall()
+    conn.close()
+    return {'retained': retained, 'save_peak': save_peak - retained,
+            'build_time': build_time, 'save_time': save_time, 'rows': rows, 'refs': refs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TreeBuilder 메모리 벤치마크')
+    parser.add_argument('--db', type=Path, help='노드를 재생할 SQLite DB (기본: 합성 트리)')
+    parser.add_argument('--scale', type=int, default=10, help='합성 트리 크기 (Part당 Section 수 / 4)')
+    args = parser.parse_args()
+
+    events = db_events(args.db) if args.db else synthetic_events(args.scale)
+    print(f"Nodes: {len(events):,}")
+
+    legacy = measure(LegacyTreeBuilder, save_legacy, events)
+    compact = measure(TreeBuilder, save_streaming, events)
+
+    # 1. 저장 결과 동일성 (refs는 해석 방식이 달라 개수만 비교)
+    if legacy['rows'] != compact['rows']:
+        print("[ERROR] saved node rows differ")
+        sys.exit(1)
+    print(f"[OK] identical nodes rows ({len(compact['rows']):,}), "
+          f"refs {len(legacy['refs']):,} (per-node findall) / {len(compact['refs']):,} (resolved)")
+
+    # 2. 메모리 / 시간
+    mb = 1024 * 1024
+    print(f"  {'':10} {'tree':>10} {'save peak':>10} {'build':>8} {'save':>8}")
+    for label, r in (('dataclass', legacy), ('slots', compact)):
+        print(f"  {label:10} {r['retained'] / mb:8.1f}MB {r['save_peak'] / mb:8.1f}MB "
+              f"{r['build_time']:7.2f}s {r['save_time']:7.2f}s")
+    print(f"  tree memory: {legacy['retained'] / compact['retained']:.1f}x smaller, "
+          f"save peak: {legacy['save_peak'] / max(compact['save_peak'], 1):.1f}x smaller")
+
+
+if __name__ == '__main__':
+    main()
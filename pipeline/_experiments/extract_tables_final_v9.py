@@ -17,6 +17,9 @@ sys.stdout.reconfigure(encoding='utf-8')
 import fitz  # PyMuPDF for fast detection
 import pdfplumber  # backup option
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from page_cache import PageTextCache
+
 try:
     import camelot
     HAS_CAMELOT = True
@@ -178,12 +181,27 @@ def extract_with_camelot(pdf_path, page_num):
     return results
 
 
-def find_table_id_on_page(pdf_path, page_num):
-    """페이지에서 테이블 ID 찾기"""
+_page_caches = {}
+
+
+def get_page_cache(pdf_path):
+    """raw get_text() 결과용 페이지 캐시"""
+    if pdf_path not in _page_caches:
+        _page_caches[pdf_path] = PageTextCache(pdf_path, 'raw')
+    return _page_caches[pdf_path]
+
+
+def _extract_raw_text(pdf_path, page_idx):
     doc = fitz.open(pdf_path)
-    page = doc[page_num - 1]
-    text = page.get_text()
+    text = doc[page_idx].get_text()
     doc.close()
+    return text
+
+
+def find_table_id_on_page(pdf_path, page_num):
+    """페이지에서 테이블 ID 찾기"""
+    text = get_page_cache(pdf_path).get_or_extract(
+        page_num - 1, lambda i: _extract_raw_text(pdf_path, i))
 
     pattern = r'Table\s+(\d+\.\d+\.\d+\.\d+(?:-[A-Z])?)'
     matches = re.findall(pattern, text, re.IGNORECASE)
@@ -254,6 +272,7 @@ def extract_all_tables():
     for source, count in source_counts.items():
         if count > 0:
             print(f"   - {source}: {count}개")
+    get_page_cache(pdf_path).report()
 
     # 저장
     os.makedirs(output_path, exist_ok=True)
@@ -1,7 +1,11 @@
 """검증 테이블 페이지 위치 찾기"""
 import fitz
 import sys
+from pathlib import Path
 sys.stdout.reconfigure(encoding='utf-8')
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from page_cache import PageTextCache
 
 PDF_PATH = '../source/2024 Building Code Compendium/301880.pdf'
 
@@ -15,12 +19,11 @@ TARGET_TABLES = [
     'Table 9.20.5.2.-B',
 ]
 
-def find_table_pages(doc, table_id):
+def find_table_pages(doc, table_id, cache):
     """테이블이 있는 페이지 찾기"""
     pages = []
     for page_num in range(700, 1050):
-        page = doc[page_num]
-        text = page.get_text()
+        text = cache.get_or_extract(page_num, lambda i: doc[i].get_text())
         if table_id in text:
             # "Forming Part of" 확인 (테이블 정의)
             if 'Forming Part of' in text:
@@ -31,6 +34,7 @@ def find_table_pages(doc, table_id):
 
 def main():
     doc = fitz.open(PDF_PATH)
+    cache = PageTextCache(PDF_PATH, 'raw')
     print(f"PDF: {len(doc)} pages\n")
 
     for table_id in TARGET_TABLES:
@@ -38,7 +42,7 @@ def main():
         print(f"{table_id}")
         print('='*60)
 
-        pages = find_table_pages(doc, table_id)
+        pages = find_table_pages(doc, table_id, cache)
         if pages:
             for page_num, ptype, context in pages:
                 print(f"  Page {page_num} ({ptype})")
@@ -58,6 +62,9 @@ def main():
         else:
             print("  Not found in p.700-1050")
 
+    print()
+    cache.report()
+    cache.close()
     doc.close()
 
 if __name__ == "__main__":
@@ -1,83 +1,16 @@
 """
 Marker batch processing script
-Process 1260 pages in 100-page chunks
-"""
-import subprocess
-import os
-import time
-import shutil
-
-PDF_PATH = "source/2024 Building Code Compendium/301880.pdf"
-OUTPUT_DIR = "output_marker"
-MARKER_EXE = r"C:\Users\A\AppData\Local\Packages\PythonSoftwareFoundation.Python.3.13_qbz5n2kfra8p0\LocalCache\local-packages\Python313\Scripts\marker_single.exe"
-
-TOTAL_PAGES = 1260
-CHUNK_SIZE = 100
-
-def run_chunk(start, end, chunk_num):
-    """Process a chunk of pages"""
-    chunk_dir = os.path.join(OUTPUT_DIR, f"chunk_{chunk_num:02d}")
-    os.makedirs(chunk_dir, exist_ok=True)
-
-    page_range = f"{start}-{end}"
-    print(f"\n{'='*50}")
-    print(f"Processing chunk {chunk_num}: pages {start}-{end}")
-    print(f"Output: {chunk_dir}")
-    print(f"{'='*50}")
-
-    cmd = [
-        MARKER_EXE,
-        PDF_PATH,
-        "--output_dir", chunk_dir,
-        "--page_range", page_range,
-        "--layout_batch_size", "1"
-    ]
-
-    start_time = time.time()
-    result = subprocess.run(cmd, capture_output=False)
-    elapsed = time.time() - start_time
+→ pipeline/marker_chunks.py로 옮김 (병렬 워커 슬롯, 청크 캐시, 재개 / 재시도, 301880_full.md 병합)
 
-    if result.returncode == 0:
-        print(f"Chunk {chunk_num} completed in {elapsed:.1f}s")
-        return True
-    else:
-        print(f"Chunk {chunk_num} FAILED")
-        return False
-
-def main():
-    # Skip first chunk (already done)
-    # chunks = [(0, 99, 1)]  # Already completed
-
-    chunks = []
-    chunk_num = 1
-    for start in range(0, TOTAL_PAGES, CHUNK_SIZE):
-        end = min(start + CHUNK_SIZE - 1, TOTAL_PAGES - 1)
-        chunks.append((start, end, chunk_num))
-        chunk_num += 1
-
-    print(f"Total chunks: {len(chunks)}")
-    print(f"Pages per chunk: {CHUNK_SIZE}")
-
-    # Process each chunk
-    completed = 0
-    failed = 0
-
-    for start, end, num in chunks:
-        # Skip chunk 1 if already done
-        chunk_dir = os.path.join(OUTPUT_DIR, f"chunk_{num:02d}")
-        if os.path.exists(os.path.join(chunk_dir, "301880", "301880.md")):
-            print(f"Chunk {num} already exists, skipping...")
-            completed += 1
-            continue
+사용법:
+    python _experiments/marker_batch.py [marker_chunks.py 인자...]
+"""
+import sys
+from pathlib import Path
 
-        if run_chunk(start, end, num):
-            completed += 1
-        else:
-            failed += 1
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-    print(f"\n{'='*50}")
-    print(f"DONE! Completed: {completed}, Failed: {failed}")
-    print(f"{'='*50}")
+from marker_chunks import main
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+obc.db 변경 로그 / 읽기 캐시 테스트 (임시 DB, PDF 불필요)
+- begin_generation 없이 쓴 변경 (UPDATE 직접 실행, 이전 스크립트)도 changed_since에 나오는지
+- 해시 없이 title/content만 바꾸면 content_hash가 NULL → ensure_change_log가 다시 채움
+- 이전 schema (closed_at 없음, 이전 로그 트리거) DB 마이그레이션
+- query.NodeStore 캐시: begin_generation 없이 쓴 변경 뒤에도 새 값을 돌려주는지
+- number_tree 없이 넣거나 옮긴 노드도 get_subtree / get_children에 나오는지
+
+사용법:
+    python _experiments/test_change_log.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db_utils import (SCHEMA_PATH, begin_generation, changed_since, content_hash, current_generation,
+                      end_generation, ensure_schema, number_tree)
+from query import NodeStore, _numbered
+
+ROWS = [
+    ('7', 'part', 7, None, 'Plumbing', None, None, 1),
+    ('7.2', 'section', 7, '7', 'Materials', None, None, 1),
+    ('7.2.10', 'subsection', 7, '7.2', 'Fittings', 'text', None, 1),
+    ('7.2.10.7', 'article', 7, '7.2.10', 'Scope', 'old content', None, 1),
+]
+
+# 변경 로그 이전의 로그 트리거 (generation을 열지 않고 MAX(generation)에 기록)
+OLD_LOG_TRIGGER = '''
+    CREATE TRIGGER nodes_log_au AFTER UPDATE ON nodes
+    WHEN old.content IS NOT new.content
+    BEGIN
+        INSERT INTO node_changes(generation, node_id, op)
+        VALUES ((SELECT COALESCE(MAX(generation), 0) FROM generations), new.id, 'update');
+    END
+'''
+
+
+def new_db(tmp: Path, name: str) -> Path:
+    """schema.sql + ROWS (generation 1개 안에서, 해시 포함)"""
+    path = tmp / name
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+    ensure_schema(conn)
+    cursor = conn.cursor()
+    cursor.execute("BEGIN")
+    generation = begin_generation(cursor, 'test')
+    cursor.executemany('''
+        INSERT INTO nodes (id, type, part, parent_id, title, content, page, seq, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [row + (content_hash(row[4], row[5]),) for row in ROWS])
+    number_tree(cursor, 7)
+    end_generation(cursor, generation)
+    cursor.execute("COMMIT")
+    conn.close()
+    return path
+
+
+def test_raw_write_logged(tmp: Path):
+    conn = sqlite3.connect(new_db(tmp, 'raw.db'), isolation_level=None)
+    generation = current_generation(conn)
+    conn.execute("UPDATE nodes SET content = 'fixed' WHERE id = '7.2.10.7'")
+    assert changed_since(conn, generation) == {'7.2.10.7': 'update'}
+
+    # 다음 직접 쓰기도 같은 열린 generation → 기준 (닫힌 generation)은 그대로
+    conn.execute("INSERT INTO nodes (id, type, part, parent_id, title, content) "
+                 "VALUES ('7.2.10.99', 'article', 7, '7.2.10', 'New', 'x')")
+    assert current_generation(conn) == generation
+    assert changed_since(conn, generation) == {'7.2.10.7': 'update', '7.2.10.99': 'insert'}
+
+    # begin_generation이 열린 generation을 닫음 → 그 뒤 기준에서는 빠짐
+    cursor = conn.cursor()
+    cursor.execute("BEGIN")
+    closing = begin_generation(cursor, 'test 2')
+    end_generation(cursor, closing)
+    cursor.execute("COMMIT")
+    assert current_generation(conn) == closing
+    assert changed_since(conn, closing) == {}
+    conn.close()
+    print("[OK] writes without begin_generation are logged after current_generation()")
+
+
+def test_content_hash(tmp: Path):
+    path = new_db(tmp, 'hash.db')
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("UPDATE nodes SET content = 'fixed' WHERE id = '7.2.10.7'")
+    assert conn.execute("SELECT content_hash FROM nodes WHERE id = '7.2.10.7'").fetchone()[0] is None
+
+    # 해시를 같이 쓰면 그대로
+    conn.execute("UPDATE nodes SET title = 'T', content_hash = ? WHERE id = '7.2.10'",
+                 (content_hash('T', 'text'),))
+    assert conn.execute("SELECT content_hash FROM nodes WHERE id = '7.2.10'").fetchone()[0] == content_hash('T', 'text')
+
+    ensure_schema(conn)
+    assert conn.execute("SELECT content_hash FROM nodes WHERE id = '7.2.10.7'").fetchone()[0] == \
+        content_hash('Scope', 'fixed')
+    conn.close()
+    print("[OK] raw title/content update clears content_hash, ensure_schema refills it")
+
+
+def test_migrate_old_triggers(tmp: Path):
+    path = new_db(tmp, 'old.db')
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.executescript("DROP TRIGGER nodes_log_ai; DROP TRIGGER nodes_log_au; DROP TRIGGER nodes_log_ad;"
+                       "DROP TRIGGER nodes_hash_au; ALTER TABLE generations DROP COLUMN closed_at;"
+                       + OLD_LOG_TRIGGER)
+    ensure_schema(conn)
+    assert conn.execute("SELECT COUNT(*) FROM generations WHERE closed_at IS NULL").fetchone()[0] == 0
+    generation = current_generation(conn)
+    conn.execute("UPDATE nodes SET content = 'fixed' WHERE id = '7.2.10.7'")
+    assert changed_since(conn, generation) == {'7.2.10.7': 'update'}
+    conn.close()
+    print("[OK] old change-log triggers / generations table migrated")
+
+
+def test_store_cache(tmp: Path):
+    path = new_db(tmp, 'cache.db')
+    with NodeStore(path, pool_size=1) as store:
+        assert store.get_node('7.2.10.7')['content'] == 'old content'
+        writer = sqlite3.connect(path, isolation_level=None)
+        writer.execute("UPDATE nodes SET content = 'fixed' WHERE id = '7.2.10.7'")
+        assert store.get_node('7.2.10.7')['content'] == 'fixed'
+        # 같은 열린 generation에 이어서 쓴 변경도
+        writer.execute("UPDATE nodes SET content = 'fixed again' WHERE id = '7.2.10.7'")
+        assert store.get_node('7.2.10.7')['content'] == 'fixed again'
+        writer.close()
+    print("[OK] NodeStore cache sees writes made without begin_generation")
+
+
+def test_unnumbered_nodes(tmp: Path):
+    path = new_db(tmp, 'tree.db')
+    writer = sqlite3.connect(path, isolation_level=None)
+    with NodeStore(path, pool_size=1) as store:
+        assert [n['id'] for n in store.get_children('7.2.10')] == ['7.2.10.7']
+
+        writer.execute("INSERT INTO nodes (id, type, part, parent_id, title, content, seq) "
+                       "VALUES ('7.2.10.99', 'article', 7, '7.2.10', 'New', 'x', 2)")
+        assert [n['id'] for n in store.get_subtree('7.2.10')] == ['7.2.10', '7.2.10.7', '7.2.10.99']
+        assert [n['id'] for n in store.get_children('7.2.10')] == ['7.2.10.7', '7.2.10.99']
+
+        # 번호가 있던 노드를 다른 부모로 옮김 → 번호가 지워지고 CTE로
+        writer.execute("UPDATE nodes SET parent_id = '7.2' WHERE id = '7.2.10.7'")
+        assert [n['id'] for n in store.get_children('7.2.10')] == ['7.2.10.99']
+        assert '7.2.10.7' in [n['id'] for n in store.get_children('7.2')]
+
+        # 다음 쓰기의 ensure_schema가 번호를 다시 매기면 범위 조회로 돌아감
+        ensure_schema(writer)
+        with store.pool.connection() as conn:
+            assert _numbered(conn, '7.2.10')
+        assert [n['id'] for n in store.get_children('7.2.10')] == ['7.2.10.99']
+    writer.close()
+    print("[OK] nodes inserted / moved without number_tree stay visible in get_subtree / get_children")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        test_raw_write_logged(tmp)
+        test_content_hash(tmp)
+        test_migrate_old_triggers(tmp)
+        test_store_cache(tmp)
+        test_unnumbered_nodes(tmp)
+
+    print("\n=== All tests passed! ===")
+
+
+if __name__ == '__main__':
+    main()
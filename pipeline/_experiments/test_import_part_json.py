@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+import_part_json 테스트 (임시 DB, PDF 불필요)
+- JSON에 page가 없는 행 (Marker JSON)은 PDF 파서가 만든 page를 지우지 않는지
+- content_only (update_part8_db): 기존 행은 title/content만, Article 행은 만들지 않음
+- add_missing_articles (add_articles_to_db): DB의 Subsection 마커에서 없는 Article만 추가
+
+사용법:
+    python _experiments/test_import_part_json.py
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db_utils import SCHEMA_PATH, begin_generation, content_hash, end_generation, ensure_schema, number_tree
+from import_part_json import add_missing_articles, import_part_json
+
+# PDF 파서가 만든 행 (page, seq, Clause 포함)
+ROWS = [
+    ('8', 'part', 8, None, 'Sewage Systems', None, 679, 1),
+    ('8.2', 'section', 8, '8', 'Design', None, 690, 1),
+    ('8.2.1', 'subsection', 8, '8.2', 'Site', 'old text', 691, 3),
+    ('8.2.1.1', 'article', 8, '8.2.1', 'Scope', 'article text', 691, 2),
+    ('8.2.1.1.(1)', 'clause', 8, '8.2.1.1', None, 'clause text', 691, 1),
+]
+
+PART_JSON = {
+    'id': '8', 'title': 'Sewage Systems',
+    'sections': [{
+        'id': '8.2', 'title': 'Design',
+        'subsections': [{
+            'id': '8.2.1', 'title': 'Site',
+            'content': 'new text\n[ARTICLE:8.2.1.1:Scope]\narticle text\n[ARTICLE:8.2.1.2:Clearances]\nnew article',
+        }],
+    }],
+}
+
+
+def new_db(tmp: Path, name: str, rows: list = ROWS) -> Path:
+    path = tmp / name
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+    ensure_schema(conn)
+    cursor = conn.cursor()
+    cursor.execute("BEGIN")
+    generation = begin_generation(cursor, 'test')
+    cursor.executemany('''
+        INSERT INTO nodes (id, type, part, parent_id, title, content, page, seq, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [row + (content_hash(row[4], row[5]),) for row in rows])
+    number_tree(cursor, 8)
+    end_generation(cursor, generation)
+    cursor.execute("COMMIT")
+    conn.close()
+    return path
+
+
+def nodes(path: Path) -> dict:
+    conn = sqlite3.connect(path)
+    rows = {row[0]: row[1:] for row in conn.execute("SELECT id, parent_id, content, page, seq FROM nodes")}
+    conn.close()
+    return rows
+
+
+def test_keep_page(tmp: Path, json_path: Path):
+    path = new_db(tmp, 'page.db')
+    stats = import_part_json(str(json_path), str(path))
+    after = nodes(path)
+    # page 없는 JSON → page 그대로 (Part/Section은 바뀐 것이 없어 UPDATE도 없음)
+    assert stats['updated'] == 2, stats  # 8.2.1 (content), 8.2.1.1 (seq 2 → 1)
+    assert after['8'][2] == 679 and after['8.2'][2] == 690
+    assert after['8.2.1'][0] == '8.2' and after['8.2.1'][2:] == (691, 1)
+    assert after['8.2.1'][1].startswith('new text')
+    assert after['8.2.1.1'][2] == 691
+    assert after['8.2.1.2'][2] is None
+
+    # 재실행은 변경 없음
+    assert import_part_json(str(json_path), str(path))['updated'] == 0
+    print("[OK] rows without a page in the JSON keep the page from the DB")
+
+
+def test_content_only(tmp: Path, json_path: Path):
+    path = new_db(tmp, 'content.db')
+    stats = import_part_json(str(json_path), str(path), prune=True, content_only=True)
+    after = nodes(path)
+    assert (stats['inserted'], stats['updated'], stats['deleted']) == (0, 1, 0), stats
+    assert after['8.2.1'][1].startswith('new text')
+    assert after['8.2.1'][2:] == (691, 3)                  # page/seq 유지
+    assert '8.2.1.2' not in after                          # Article 행 안 만듦
+    assert '8.2.1.1' in after and '8.2.1.1.(1)' in after   # --prune도 Article/Clause는 그대로
+    print("[OK] content_only updates title/content only and leaves Articles alone")
+
+
+def test_missing_articles(tmp: Path):
+    # Subsection content에 마커가 있는 DB (8.2.1.1은 이미 있음, 8.2.1.2는 없음)
+    sub_content = PART_JSON['sections'][0]['subsections'][0]['content']
+    rows = [row[:5] + (sub_content,) + row[6:] if row[0] == '8.2.1' else row for row in ROWS]
+    path = new_db(tmp, 'articles.db', rows)
+    before = nodes(path)
+
+    stats = add_missing_articles(8, str(path))
+    after = nodes(path)
+    assert (stats['inserted'], stats['updated'], stats['deleted']) == (1, 0, 0), stats
+    assert after['8.2.1.2'][:2] == ('8.2.1', 'new article')
+    assert all(after[node_id] == before[node_id] for node_id in before)  # 기존 행 (seq 포함) 그대로
+
+    assert add_missing_articles(8, str(path))['inserted'] == 0
+    print("[OK] add_missing_articles inserts only Articles missing from the DB")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        json_path = tmp / 'part8.json'
+        json_path.write_text(json.dumps(PART_JSON), encoding='utf-8')
+        test_keep_page(tmp, json_path)
+        test_content_only(tmp, json_path)
+        test_missing_articles(tmp)
+
+    print("\n=== All tests passed! ===")
+
+
+if __name__ == '__main__':
+    main()
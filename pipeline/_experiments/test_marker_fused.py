@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+marker_engine.transform_content_fused 테스트 (golden output = transform_content)
+- Marker 샘플 (marker_output/section_9_4.md → Part 6/7로 재번호)의 Subsection 전부
+- 변환마다 경계 사례 (빈 줄 흡수, 줄 넘김 헤딩, Notes 구간, where 블록, 개정 표시 ...)
+- 줄 문법에서 뽑은 무작위 입력 (시드 고정)
+- Part 6 / 7 설정 둘 다 (file_links, revisions 'er' / 'r')
+
+사용법:
+    python _experiments/test_marker_fused.py
+    python _experiments/test_marker_fused.py --cases 20000 --seed 7
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import marker_engine
+from marker_engine import PART_CONFIGS, clean_text, split_sections, transform_content, transform_content_fused
+
+SAMPLE_PATH = Path(__file__).parent / "marker_output" / "section_9_4.md"
+
+EDGE_CASES = [
+    # Article / Table 헤딩
+    "## {p}.1.1.1. Scope **e1** (See Note A-{p}.1.1.1.)\ntext r1",
+    "#{p}.1.1.2A.Suffix\n### {p}.1.1A.1. Alt",
+    "text\n\n**Table {p}.1.1.1. Sizes**\n\n\nForming Part of Sentence {p}.1.1.1.(1)\nafter",
+    "### **Table {p}.1.1.1.   Two   spaces**  rest  ",
+    "**Table {p}.1.1.1.**\n\n",
+    "### Table {p}.1.1.1.-A\n\n\n  Title line  \nnext",
+    "### Table {p}.1.1.1. (Cont'd)",
+    "Table {p}.1.1.1.\n\nSplit Title\nForming Part of Article {p}.1.1.1.",
+    "Table {p}.1.1.1.\n\n\n\n  Title\nForming Part of x\nTable {p}.1.1.2.\n\nT\nForming Part of",
+    "Table {p}.1.1.1.\nno blank\nForming Part of x",
+    "Table {p}.1.1.1.\n\nTable {p}.1.1.2.\n\nTitle\nForming Part of y",
+    # Notes
+    "#### Notes to Table {p}.1.1.1.:\n\n\n(1) first\n- (2) second\n  (3) indented\n[ARTICLE:x]\n(4) after",
+    "Notes to Table {p}.1.1.1.:\n\n(1) plain\n\n- (2) kept\n#### Table {p}.1.1.2. T\n- (3) clause",
+    "### **Notes to Table {p}.1.1.1.**\n- (1) a\n\n- (2) b [ARTICLE:y] (3)\n- (4) c",
+    # Clause
+    "intro\n\n\n- **(1)** one\n  - **(2)** two\n- (a) a\n    - (iv) four\n- **(1.1)** dec\n- (See Note A-1.)\n- . (See Note A-2.)",
+    "- **(1)**\ntext **(2)** inline **(3)**",
+    # where
+    "where:\n\nQ is the flow\nSs = snow load\n- x = y\nplain\n\n\nγ is after",
+    "formula where,\nQ is a (1) Q is b\nH is c where,\nP is d\n\n\nR is e",
+    "where,\nA is x\n\n\n",
+    "a where, [ARTICLE:z] where,\nB is y",
+    "where :  \n\nAB = c\n#### Table {p}.1.1.1. T\nC is d",
+    # Bold / italic / 개정 표시
+    "**bold** and *italic* and ***both*** r2 e1 **r1**.\nword e2) end r1",
+    "*not closed\n**also** not",
+    "| A | B |\n|---|---|\n| *x* | **y** |\n| r1 | 2 |\nafter\n|only|",
+    "\n\n\nleading and trailing\n\n\n\n",
+]
+
+# 무작위 입력용 줄 문법
+LINE_TEMPLATES = [
+    "", "", "", "", "plain text line", "  indented text", "text with (1) inside", "see Table {p}.1.1.1.",
+    "## {p}.{a}.{b}.{c}. Article **title**", "###{p}.{a}.{b}.{c}A.Suffix e1",
+    "**Table {p}.{a}.{b}.{c}. Title**", "**Table {p}.{a}.{b}.{c}. Title** Forming Part of x",
+    "### **Table {p}.{a}.{b}.{c}.**", "### Table {p}.{a}.{b}.{c}.", "### Table {p}.{a}.{b}.{c}.-A (Cont'd)",
+    "#### Table {p}.{a}.{b}.{c}. T", "Table {p}.{a}.{b}.{c}.", "Forming Part of Sentence {p}.{a}.{b}.{c}.(1)",
+    "Notes to Table {p}.{a}.{b}.{c}.:", "#### Notes to Table {p}.{a}.{b}.{c}.", "### **Notes to Table {p}.{a}.1.**",
+    "- **(1)** clause", "- (2) item", "  - (a) sub", "    - (iii) roman", "- **(1.1)** decimal", "(3) bare",
+    "  (4) bare indented", "- (See Note A-{p}.{a}.)", "- . (See Note A-1.)", "text **(5)** inline",
+    "where:", "where :", "where,", "formula where,", "Q is the rate", "Ss = load", "γ is weight",
+    "xyz is long", "- A = given", "[ARTICLE:{p}.{a}.{b}.{c}:T]", "mid [ARTICLE:x] (b) text",
+    "| a | b |", "|---|---|", "| 1 | 2 |", "|x", "**bold** text", "*ital* text", "*(1)* kept",
+    "text r1", "text **e2**.", "Figure2 r2)",
+]
+# 단일 패스로 재현하지 않는 모양 (transform_content로 넘어가는 경로)
+HAZARD_TEMPLATES = [
+    "# {p}.{a}.{b}.", "## {p}.{a}.{b}.{c}.", "##", "-", "   ", "Notes to Table", "where", ": after",
+    "**open bold", "close**", "***", "**Table {p}.{a}.{b}.{c}. open", "r1", "  e1 lead",
+    "[l](file:///x.docx)", "x<sup>2</sup>",
+    "<span id=\"x\"></span>", "![](img.png)", "__NOTES_ITEM__(1)", '<h5 class="table-notes-title">x</h5>',
+]
+
+
+def sample_subsections(part_id: str) -> list:
+    """Marker 샘플 → Part 번호 바꿔서 split_sections (convert_part와 같은 전처리)"""
+    config = PART_CONFIGS[part_id]
+    text = SAMPLE_PATH.read_text(encoding='utf-8').replace('9.4.', f'{part_id}.1.')
+    sections = split_sections(clean_text(text, **config['clean']), config)
+    return [sub['content'] for section in sections for sub in section['subsections']]
+
+
+def random_content(rng: random.Random, part_id: str) -> str:
+    lines = []
+    for _ in range(rng.randint(1, 25)):
+        template = rng.choice(HAZARD_TEMPLATES if rng.random() < 0.01 else LINE_TEMPLATES)
+        lines.append(template.format(p=part_id, a=rng.randint(1, 3), b=rng.randint(1, 3), c=rng.randint(1, 3)))
+    return '\n'.join(lines) + rng.choice(['', '\n', '\n\n'])
+
+
+def check(contents: list, part_id: str, label: str) -> int:
+    """fused == transform_content 확인 → fallback 횟수"""
+    config = PART_CONFIGS[part_id]
+    calls = []
+
+    def counting(content, config):
+        calls.append(1)
+        return transform_content(content, config)
+
+    expected = [transform_content(content, config) for content in contents]
+    marker_engine.transform_content = counting
+    try:
+        actual = [transform_content_fused(content, config) for content in contents]
+    finally:
+        marker_engine.transform_content = transform_content
+
+    for content, want, got in zip(contents, expected, actual):
+        if want != got:
+            print(f"[ERROR] {label} (Part {part_id}): output differs")
+            print(f"  input:    {content!r}")
+            print(f"  expected: {want!r}")
+            print(f"  fused:    {got!r}")
+            sys.exit(1)
+    return len(calls)
+
+
+def test_marker_sample():
+    for part_id in ('6', '7'):
+        contents = sample_subsections(part_id)
+        assert contents, "sample has no subsections"
+        fallbacks = check(contents, part_id, 'marker sample')
+        print(f"[OK] Marker sample, Part {part_id}: {len(contents)} subsections ({fallbacks} fallback)")
+
+
+def test_edge_cases():
+    for part_id in ('6', '7'):
+        contents = [case.format(p=part_id) for case in EDGE_CASES]
+        fallbacks = check(contents, part_id, 'edge case')
+        print(f"[OK] Edge cases, Part {part_id}: {len(contents)} cases ({fallbacks} fallback)")
+
+
+def test_random(cases: int, seed: int):
+    rng = random.Random(seed)
+    for part_id in ('6', '7'):
+        contents = [random_content(rng, part_id) for _ in range(cases)]
+        fallbacks = check(contents, part_id, f'random (seed {seed})')
+        print(f"[OK] Random, Part {part_id}: {cases} cases ({fallbacks} fallback)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='transform_content_fused == transform_content')
+    parser.add_argument('--cases', type=int, default=3000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    test_marker_sample()
+    test_edge_cases()
+    test_random(args.cases, args.seed)
+
+    print("\n=== All tests passed! ===")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,7 @@
 patterns.py 테스트 (특수 패턴 포함)
 """
 
-from patterns import detect_type, extract_references, get_node_type
+from patterns import detect_type, extract_references, get_node_type, parent_from_id, id_sort_key
 
 
 def test_subsection():
@@ -107,6 +107,24 @@ def test_node_type():
     print("[OK] Node type from ID (including special patterns)")
 
 
+def test_parsed_id():
+    # 다른 Part 번호도 같은 규칙
+    assert get_node_type('10') == 'part'
+    assert get_node_type('10.2.3A') == 'alt_subsection'
+    assert get_node_type('12.1.1.2') == 'article'
+    assert get_node_type('9.5.3.1.(1)') == 'unknown'
+
+    assert parent_from_id('sub_article', '9.5.3A.1') == '9.5.3A'
+    assert parent_from_id('article_suffix', '11.4.1.1A') == '11.4.1'
+    assert parent_from_id('article', '9.5.3A.1') is None  # 타입과 ID 모양이 다름
+    assert parent_from_id('clause', '9.5.3.1.(1)') is None
+
+    ids = ['9.10.1', '9.5.3A', '9.2.1', '9.5.3.1.(10)', '9.5.3.1.(2)', '9.5.3', '10.1']
+    assert sorted(ids, key=id_sort_key) == [
+        '9.2.1', '9.5.3', '9.5.3.1.(2)', '9.5.3.1.(10)', '9.5.3A', '9.10.1', '10.1']
+    print("[OK] Parsed ID (parent / sort, any part)")
+
+
 if __name__ == '__main__':
     # 기본 패턴
     test_subsection()
@@ -122,5 +140,6 @@ if __name__ == '__main__':
     # 기타
     test_references()
     test_node_type()
+    test_parsed_id()
 
     print("\n=== All tests passed! ===")
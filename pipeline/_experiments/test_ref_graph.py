@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+ref_graph 테스트 (임시 DB, PDF 불필요)
+- Table 참조는 같은 번호의 Article이 있어도 tables.parent_id의 Article로
+- Section/Subsection 참조는 ref_edges에는 남지만 ref_closure / deps (재귀 CTE)에는 나오지 않음
+
+사용법:
+    python _experiments/test_ref_graph.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db_utils import SCHEMA_PATH, ensure_schema
+from ref_graph import build_ref_graph, cited_by, dependencies
+
+NODES = [
+    ('9', 'part', 9, None),
+    ('9.10', 'section', 9, '9'),
+    ('9.10.14', 'subsection', 9, '9.10'),
+    ('9.10.14.1', 'article', 9, '9.10.14'),
+    ('9.10.14.1.(1)', 'clause', 9, '9.10.14.1'),
+    ('9.10.14.4', 'article', 9, '9.10.14'),
+    ('9.10.14.5', 'article', 9, '9.10.14'),
+]
+
+REFS = [
+    ('9.10.14.1.(1)', '9.10.14.5', 'table'),  # 표 "Table 9.10.14.5"는 9.10.14.4에 붙어 있음
+    ('9.10.14.1.(1)', '9.10', 'section'),
+    ('9.10.14.4', '9.10.14', 'subsection'),
+]
+
+
+def new_db(tmp: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(tmp / 'refs.db', isolation_level=None)
+    conn.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+    ensure_schema(conn)
+    conn.executemany("INSERT INTO nodes (id, type, part, parent_id) VALUES (?, ?, ?, ?)", NODES)
+    conn.execute("INSERT INTO tables (id, parent_id) VALUES ('Table 9.10.14.5', '9.10.14.4')")
+    conn.executemany("INSERT INTO refs (source_id, target_id, target_type) VALUES (?, ?, ?)", REFS)
+    return conn
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = new_db(Path(tmp))
+        cursor = conn.cursor()
+        stats = build_ref_graph(cursor, closure_hops=3)
+        assert stats['unresolved'] == 0, stats
+
+        targets = dict(conn.execute("SELECT target_id, target_article FROM ref_edges"))
+        assert targets['9.10.14.4'] == '9.10.14.4' and '9.10.14.5' not in targets
+        print("[OK] table refs resolve through tables.parent_id, not the same-numbered Article")
+
+        assert targets['9.10'] == '9.10'
+        assert [r['source_article'] for r in cited_by(conn, '9.10')] == ['9.10.14.1']
+        closure = conn.execute("SELECT source_article, target_article, hops FROM ref_closure").fetchall()
+        assert closure == [('9.10.14.1', '9.10.14.4', 1)], closure
+        assert dependencies(conn, '9.10.14.1', hops=1) == [('9.10.14.4', 1)]
+        assert dependencies(conn, '9.10.14.1', hops=5) == [('9.10.14.4', 1)]  # 재귀 CTE 경로
+        print("[OK] section / subsection targets stay out of ref_closure and deps")
+        conn.close()
+
+    print("\n=== All tests passed! ===")
+
+
+if __name__ == '__main__':
+    main()
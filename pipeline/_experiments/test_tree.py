@@ -142,10 +142,23 @@ def test_reference_extraction():
         content='Refer to Table 9.5.3.1 and Sentence (2) and Clause (3).'
     )
 
+    builder.add_node(
+        'clause', '9.5.3.1.(2)',
+        content='Except as required in Sentence 9.10.9.6.(1) and Article 3.2.1.1.'
+    )
+
+    # 참조는 트리 구축 후 한 번에 해석
+    assert builder.get_node('9.5.3.1.(1)').refs == {}
+    builder.resolve_references()
+
     node = builder.get_node('9.5.3.1.(1)')
     assert '9.5.3.1' in node.refs.get('tables', [])
-    assert '2' in node.refs.get('clauses', [])
-    assert '3' in node.refs.get('clauses', [])
+    assert '9.5.3.1.(2)' in node.refs.get('clauses', [])  # 같은 Article 기준
+    assert '9.5.3.1.(3)' in node.refs.get('clauses', [])
+
+    node = builder.get_node('9.5.3.1.(2)')
+    assert node.refs['clauses'] == ['9.10.9.6.(1)']
+    assert node.refs['articles'] == ['3.2.1.1']  # 다른 Part
 
     print("[OK] Reference extraction")
 
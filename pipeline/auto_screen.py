@@ -10,6 +10,8 @@ import sqlite3
 import re
 from pathlib import Path
 from collections import defaultdict
+from page_cache import PageTextCache
+from patterns import id_sort_key
 
 # 설정
 PDF_PATH = Path(__file__).parent.parent / "source/2024 Building Code Compendium/301880.pdf"
@@ -24,21 +26,33 @@ def get_db_articles():
         SELECT id, title, content, page, type FROM nodes
         WHERE part = 9
           AND type IN ('article', 'article_suffix', 'article_0a', 'sub_article')
-        ORDER BY id
     ''')
-    articles = cur.fetchall()
+    articles = sorted(cur.fetchall(), key=lambda row: id_sort_key(row[0]))  # 9.2 < 9.10
     conn.close()
     return articles
 
-def extract_pdf_text(page_num):
-    """PDF 페이지에서 텍스트 추출 (0-indexed)"""
+_page_cache = None
+
+
+def get_page_cache():
+    """raw get_text() 결과용 페이지 캐시 (프로세스당 1개)"""
+    global _page_cache
+    if _page_cache is None:
+        _page_cache = PageTextCache(PDF_PATH, 'raw')
+    return _page_cache
+
+def _extract_raw(page_num):
     doc = fitz.open(PDF_PATH)
-    if page_num < len(doc):
-        text = doc[page_num].get_text()
+    try:
+        if page_num < len(doc):
+            return doc[page_num].get_text()
+        return ""
+    finally:
         doc.close()
-        return text
-    doc.close()
-    return ""
+
+def extract_pdf_text(page_num):
+    """PDF 페이지에서 텍스트 추출 (0-indexed, 페이지 캐시 사용)"""
+    return get_page_cache().get_or_extract(page_num, _extract_raw)
 
 def check_article(article_id, title, content, page, article_type):
     """단일 Article 검증 - 의심스러운 케이스 탐지"""
@@ -188,6 +202,8 @@ def verify_sample(article_id):
     else:
         print(pdf_text[:500])
 
+    get_page_cache().report()
+
 if __name__ == "__main__":
     import sys
 
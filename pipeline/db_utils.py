@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+obc.db 공용 헬퍼 (PDF 의존성 없음)
+- 대량 저장용 PRAGMA
+- nodes 동기화 트리거 일시 제거 / 복구 (같은 트랜잭션 안에서 search_index를 직접 관리할 때)
+- content_hash / generation / node_changes 변경 로그 (schema.sql 6절)
+- search_index / search_ids (external content FTS5, schema.sql 4절) 행 단위 색인 / 제거, 이전 레이아웃 마이그레이션
+- 트리 번호 path / lft / rgt (schema.sql 1절): Part마다 DFS 1회
+
+변경 로그:
+    저장/임포트마다 begin_generation()으로 generation을 하나 열고 (커밋 전에 end_generation()으로 닫음),
+    nodes 트리거 (또는 트리거를 내린 대량 저장은 log_changes)가 node_changes에 기록
+    begin_generation 없이 nodes를 고치면 트리거가 generation을 직접 열어 기록 (다음 begin_generation이 닫음)
+    → changed_since(conn, N)으로 "generation N 이후 바뀐 노드"만 받아 후처리
+      (N = current_generation(): 닫힌 generation까지 → 열린 generation의 변경은 놓치지 않음)
+
+사용법:
+    python db_utils.py migrate                  # 기존 obc.db에 content_hash / 변경 로그 / 현재 FTS 레이아웃 / 트리 번호 적용
+    python db_utils.py generations
+    python db_utils.py changes --since 12 --part 8
+"""
+
+import argparse
+import hashlib
+import re
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from patterns import id_sort_key
+
+DB_PATH = Path(__file__).parent.parent / "data" / "obc.db"
+SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+# 대량 저장 시 PRAGMA (연결 단위 설정, 연결 종료 시 원복)
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA cache_size = -262144",  # 256MB
+    "PRAGMA temp_store = MEMORY",
+)
+
+# 노드 시그니처 = 이 값이 같으면 후처리 입장에서 "안 바뀐" 노드
+SIGNATURE_COLUMNS = ('type', 'parent_id', 'page', 'seq', 'content_hash')
+
+# 처음 schema.sql 이후에 추가된 컬럼 (이전 DB에는 ALTER TABLE로 추가)
+ADDED_COLUMNS = {
+    'nodes': (
+        ('content_hash', 'TEXT'),
+        ('path', 'TEXT'),
+        ('lft', 'INTEGER'),
+        ('rgt', 'INTEGER'),
+    ),
+    'generations': (
+        ('closed_at', 'TEXT'),
+    ),
+}
+
+# 현재 schema.sql의 로그 트리거 표시 (없으면 이전 트리거 → ensure_change_log가 다시 만듦)
+LOG_TRIGGERS = ('nodes_log_ai', 'nodes_log_au', 'nodes_log_ad')
+LOG_TRIGGER_MARKER = 'closed_at IS NULL'
+
+PATH_WIDTH = 4  # path 한 단계 자릿수 (형제 9999개까지)
+
+SCHEMA_OBJECT = re.compile(r'CREATE\s+(?:VIRTUAL\s+)?(?:TABLE|INDEX|VIEW|TRIGGER)\s+IF NOT EXISTS\s+(\w+)')
+
+
+def suspend_triggers(cursor, table: str = 'nodes') -> list:
+    """table의 트리거 제거 후 CREATE 문 반환 (같은 트랜잭션 안에서 resume_triggers로 복구)"""
+    cursor.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ?", (table,))
+    triggers = cursor.fetchall()
+    for name, _ in triggers:
+        cursor.execute(f'DROP TRIGGER "{name}"')
+    return [sql for _, sql in triggers]
+
+
+def resume_triggers(cursor, trigger_sqls: list):
+    for sql in trigger_sqls:
+        cursor.execute(sql)
+
+
+# === search_index / search_ids (external content) ===
+# 트리거를 내린 상태에서 nodes를 고칠 때: 바꾸기 전에 fts_delete, 바꾼 뒤에 fts_insert
+# (external content는 'delete' 명령에 색인했던 값을 그대로 줘야 하므로 순서가 중요)
+
+FTS_TABLES = ('search_index', 'search_ids')
+
+# 현재 schema.sql의 FTS 레이아웃 표시 (하나라도 없으면 이전 레이아웃 → ensure_fts_layout이 다시 만듦)
+FTS_LAYOUT_MARKERS = {
+    'search_index': ("content='search_source'", "prefix="),
+    'search_ids': ("tokenize='trigram'",),
+}
+
+
+def fts_delete(cursor, where: str, params=()):
+    """WHERE에 맞는 nodes 행을 search_index / search_ids에서 제거 (nodes 행을 고치기/지우기 전에 호출)"""
+    cursor.execute(f'''
+        INSERT INTO search_index (search_index, rowid, node_id, title, content)
+        SELECT 'delete', rowid, id, title, content FROM nodes WHERE {where}
+    ''', params)
+    cursor.execute(f'''
+        INSERT INTO search_ids (search_ids, rowid, node_id)
+        SELECT 'delete', rowid, id FROM nodes WHERE {where}
+    ''', params)
+
+
+def fts_insert(cursor, where: str, params=()):
+    """WHERE에 맞는 nodes 행을 search_index / search_ids에 색인 (nodes 행을 쓴 뒤에 호출)"""
+    cursor.execute(f'''
+        INSERT INTO search_index (rowid, node_id, title, content)
+        SELECT rowid, id, title, content FROM nodes WHERE {where}
+    ''', params)
+    cursor.execute(f'''
+        INSERT INTO search_ids (rowid, node_id)
+        SELECT rowid, id FROM nodes WHERE {where}
+    ''', params)
+
+
+def is_external_fts(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'search_index'").fetchone()
+    return row is not None and 'content=' in row[0].replace(' ', '')
+
+
+def is_current_fts_layout(conn: sqlite3.Connection) -> bool:
+    for table, markers in FTS_LAYOUT_MARKERS.items():
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE name = ?", (table,)).fetchone()
+        if row is None or not all(m in row[0] for m in markers):
+            return False
+    return True
+
+
+def ensure_fts_layout(conn: sqlite3.Connection) -> bool:
+    """FTS 테이블 / 트리거가 schema.sql과 다르면 (이전 레이아웃) 다시 만들고 rebuild
+
+    Returns:
+        True면 이번에 마이그레이션함
+    """
+    if is_current_fts_layout(conn):
+        return False
+    # 한 스크립트 = 한 트랜잭션 (schema.sql은 IF NOT EXISTS → 지운 것만 새로 만들어짐)
+    conn.executescript(
+        "BEGIN;"
+        "DROP TRIGGER IF EXISTS nodes_ai; DROP TRIGGER IF EXISTS nodes_au; DROP TRIGGER IF EXISTS nodes_ad;"
+        "DROP TRIGGER IF EXISTS nodes_id_au;"
+        + ''.join(f"DROP TABLE IF EXISTS {table};" for table in FTS_TABLES)
+        + SCHEMA_PATH.read_text(encoding='utf-8') + ";"
+        + ''.join(f"INSERT INTO {table} ({table}) VALUES ('rebuild');" for table in FTS_TABLES)
+        + "COMMIT;"
+    )
+    return True
+
+
+def ensure_schema(conn: sqlite3.Connection):
+    """쓰기 전에 호출: 변경 로그 + 현재 FTS 레이아웃 + 트리 번호 (트랜잭션 밖에서)"""
+    ensure_change_log(conn)
+    ensure_fts_layout(conn)
+    ensure_tree_numbers(conn)
+
+
+def _add_columns(conn: sqlite3.Connection) -> set:
+    """ADDED_COLUMNS 중 없는 컬럼 추가 → 추가한 {(table, column)}"""
+    added = set()
+    for table, table_columns in ADDED_COLUMNS.items():
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if not columns:  # 테이블이 없음 → schema.sql이 새로 만듦
+            continue
+        for name, sql_type in table_columns:
+            if name not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}")
+                added.add((table, name))
+    return added
+
+
+def _stale_log_triggers(conn: sqlite3.Connection) -> bool:
+    """로그 트리거가 이전 버전 (begin_generation 없는 쓰기를 이전 generation에 기록)이면 True"""
+    rows = conn.execute(
+        f"SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({', '.join('?' * len(LOG_TRIGGERS))})",
+        LOG_TRIGGERS).fetchall()
+    return any(LOG_TRIGGER_MARKER not in sql for sql, in rows)
+
+
+# === content_hash / 변경 로그 ===
+
+def content_hash(title, content) -> str:
+    """nodes.content_hash 값 (title + content, None과 ''는 구분)"""
+    h = hashlib.blake2b(digest_size=16)
+    for value in (title, content):
+        if value is None:
+            h.update(b'\x00')
+        else:
+            h.update(b'\x01' + value.encode('utf-8') + b'\x1f')
+    return h.hexdigest()
+
+
+def with_content_hash(rows: Iterable[tuple]) -> Iterable[tuple]:
+    """(id, type, part, parent_id, title, content, page, seq) → 끝에 content_hash 추가"""
+    for row in rows:
+        yield row + (content_hash(row[4], row[5]),)
+
+
+def ensure_change_log(conn: sqlite3.Connection):
+    """추가된 nodes 컬럼 / generations / node_changes / 로그 트리거 (등 schema.sql에 새로 생긴 객체)가 없으면 추가하고
+    content_hash가 비어 있는 행을 채움 (트랜잭션 밖에서 호출)
+
+    schema.sql은 모두 IF NOT EXISTS라 그대로 다시 실행해도 됨 (새 컬럼의 인덱스도 여기서 생김)
+    """
+    added = _add_columns(conn)
+    if ('generations', 'closed_at') in added:  # 이전 generation은 모두 끝난 것
+        conn.execute("UPDATE generations SET closed_at = created_at")
+    if _stale_log_triggers(conn):
+        for name in LOG_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    schema = SCHEMA_PATH.read_text(encoding='utf-8')
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    if added or not set(SCHEMA_OBJECT.findall(schema)) <= existing:
+        conn.executescript(schema)
+
+    missing = conn.execute(
+        "SELECT id, title, content FROM nodes WHERE content_hash IS NULL").fetchall()
+    if missing:
+        # 해시만 채움 → FTS / 로그 트리거 없이
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        trigger_sqls = suspend_triggers(cursor)
+        cursor.executemany("UPDATE nodes SET content_hash = ? WHERE id = ?",
+                           [(content_hash(title, content), node_id) for node_id, title, content in missing])
+        resume_triggers(cursor, trigger_sqls)
+        cursor.execute("COMMIT")
+
+
+def begin_generation(cursor, source: str) -> int:
+    """새 generation 번호 (이후 nodes 트리거 / log_changes가 이 번호로 기록, 커밋 전에 end_generation)
+
+    열려 있던 generation (트리거가 연 것 포함)은 여기서 닫음
+    """
+    cursor.execute("UPDATE generations SET closed_at = CURRENT_TIMESTAMP WHERE closed_at IS NULL")
+    cursor.execute("INSERT INTO generations (source) VALUES (?)", (source,))
+    return cursor.lastrowid
+
+
+def end_generation(cursor, generation: int):
+    """generation 닫기 (같은 트랜잭션 안에서, 커밋 직전)"""
+    cursor.execute("UPDATE generations SET closed_at = CURRENT_TIMESTAMP WHERE generation = ?", (generation,))
+
+
+def current_generation(conn: sqlite3.Connection) -> int:
+    """닫힌 generation 중 가장 큰 번호 (changed_since의 기준으로 쓰면 아직 기록 중인 변경을 건너뛰지 않음)"""
+    return conn.execute(
+        "SELECT COALESCE(MAX(generation), 0) FROM generations WHERE closed_at IS NOT NULL").fetchone()[0]
+
+
+def change_version(conn: sqlite3.Connection) -> tuple:
+    """(마지막 generation (열린 것 포함), 마지막 node_changes.id) → nodes를 쓰거나 generation을 열면 바뀜
+
+    열린 generation에 이어서 쓰는 직접 UPDATE는 generation 번호를 바꾸지 않으므로 node_changes.id까지 봄
+    """
+    return conn.execute(
+        "SELECT (SELECT COALESCE(MAX(generation), 0) FROM generations), "
+        "(SELECT COALESCE(MAX(id), 0) FROM node_changes)").fetchone()
+
+
+def node_signatures(cursor, part: int) -> Dict[str, tuple]:
+    """Part 노드 → {id: (type, parent_id, page, seq, content_hash)}"""
+    cursor.execute(f"SELECT id, {', '.join(SIGNATURE_COLUMNS)} FROM nodes WHERE part = ?", (part,))
+    return {row[0]: row[1:] for row in cursor}
+
+
+def diff_signatures(before: Dict[str, tuple], after: Dict[str, tuple]) -> List[Tuple[str, str]]:
+    """두 시그니처 스냅샷 → [(node_id, op)]"""
+    changes = [(node_id, 'delete') for node_id in before if node_id not in after]
+    for node_id, sig in after.items():
+        old = before.get(node_id)
+        if old is None:
+            changes.append((node_id, 'insert'))
+        elif old != sig:
+            changes.append((node_id, 'update'))
+    return changes
+
+
+def log_changes(cursor, generation: int, changes: List[Tuple[str, str]]):
+    """트리거를 내린 상태에서 쓴 변경을 직접 기록"""
+    cursor.executemany("INSERT INTO node_changes (generation, node_id, op) VALUES (?, ?, ?)",
+                       [(generation, node_id, op) for node_id, op in changes])
+
+
+def changed_since(conn: sqlite3.Connection, generation: int, part: int = None) -> Dict[str, str]:
+    """generation 이후(초과) 바뀐 노드 → {node_id: op}
+
+    같은 노드가 여러 번 바뀌었으면 합쳐서 하나로:
+      마지막이 delete → 'delete', 처음이 insert → 'insert', 그 외 → 'update'
+    """
+    sql = "SELECT node_id, op FROM node_changes WHERE generation > ?"
+    params = [generation]
+    if part is not None:
+        sql += " AND (node_id = ? OR node_id LIKE ?)"
+        params += [str(part), f'{part}.%']
+    sql += " ORDER BY id"
+
+    first, last = {}, {}
+    for node_id, op in conn.execute(sql, params):
+        first.setdefault(node_id, op)
+        last[node_id] = op
+
+    return {
+        node_id: 'delete' if op == 'delete' else 'insert' if first[node_id] == 'insert' else 'update'
+        for node_id, op in last.items()
+    }
+
+
+# === 트리 번호 (path / lft / rgt) ===
+# nodes_log_au / nodes_au 트리거는 이 컬럼을 보지 않음 → 트리거를 켠 채로 UPDATE해도 로그 / FTS 변화 없음
+# (번호는 parent_id / seq에서 나오는 값이라 그쪽 변경이 이미 기록됨)
+
+def number_tree(cursor, part: int) -> int:
+    """Part 트리를 DFS 1회로 다시 번호 매김 (형제는 seq, 같으면 ID 순) → 바뀐 행 수
+
+    parent가 Part 안에 없는 노드는 Part 노드와 같은 최상위로 취급
+    """
+    cursor.execute("SELECT id, parent_id, seq, path, lft, rgt FROM nodes WHERE part = ?", (part,))
+    rows = cursor.fetchall()
+    ids = {row[0] for row in rows}
+
+    children = defaultdict(list)
+    for node_id, parent_id, seq, *_ in rows:
+        children[parent_id if parent_id in ids else None].append((seq or 0, id_sort_key(node_id), node_id))
+    for siblings in children.values():
+        siblings.sort()
+
+    numbers = {}
+    counter = 0
+    prefix = f"{part:0{PATH_WIDTH}d}"
+    stack = [(node_id, f"{prefix}/{rank:0{PATH_WIDTH}d}", None)
+             for rank, (_, _, node_id) in reversed(list(enumerate(children[None], 1)))]
+    while stack:
+        node_id, path, lft = stack.pop()
+        counter += 1
+        if lft is not None:  # 하위 노드를 모두 돈 뒤 (rgt)
+            numbers[node_id] = (path, lft, counter)
+            continue
+        stack.append((node_id, path, counter))
+        for rank, (_, _, child) in reversed(list(enumerate(children[node_id], 1))):
+            stack.append((child, f"{path}/{rank:0{PATH_WIDTH}d}", None))
+
+    updates = [numbers[node_id] + (node_id,) for node_id, _, _, *current in rows
+               if tuple(current) != numbers[node_id]]
+    cursor.executemany("UPDATE nodes SET path = ?, lft = ?, rgt = ? WHERE id = ?", updates)
+    return len(updates)
+
+
+def ensure_tree_numbers(conn: sqlite3.Connection):
+    """번호가 없는 노드가 있는 Part만 number_tree (트랜잭션 밖에서)"""
+    parts = [row[0] for row in conn.execute("SELECT DISTINCT part FROM nodes WHERE lft IS NULL")]
+    if not parts:
+        return
+    cursor = conn.cursor()
+    cursor.execute("BEGIN")
+    for part in parts:
+        number_tree(cursor, part)
+    cursor.execute("COMMIT")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='obc.db 변경 로그 관리')
+    parser.add_argument('--db', type=Path, default=DB_PATH, help=f'SQLite DB (기본: {DB_PATH})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('migrate', help='content_hash 컬럼 / 변경 로그 / 현재 FTS 레이아웃 적용')
+    sub.add_parser('generations', help='generation 목록과 변경 수')
+    changes = sub.add_parser('changes', help='generation N 이후 바뀐 노드')
+    changes.add_argument('--since', type=int, required=True)
+    changes.add_argument('--part', type=int)
+
+    args = parser.parse_args()
+    conn = sqlite3.connect(args.db, isolation_level=None)
+
+    if args.command == 'migrate':
+        ensure_schema(conn)
+        print(f"[OK] change log ready (generation {current_generation(conn)}): {args.db}")
+    elif args.command == 'generations':
+        for generation, source, created_at, closed_at, count in conn.execute('''
+            SELECT g.generation, g.source, g.created_at, g.closed_at, COUNT(c.id)
+            FROM generations g LEFT JOIN node_changes c ON c.generation = g.generation
+            GROUP BY g.generation ORDER BY g.generation
+        '''):
+            state = '' if closed_at else '  (open)'
+            print(f"  {generation:5}  {created_at}  {count:7} changes  {source}{state}")
+    elif args.command == 'changes':
+        changed = changed_since(conn, args.since, args.part)
+        for node_id, op in sorted(changed.items()):
+            print(f"  {op:6} {node_id}")
+        print(f"{len(changed)} nodes changed since generation {args.since}")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
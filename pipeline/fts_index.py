@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+search_index / search_ids (external content FTS5) 관리
+- 텍스트는 nodes에만 있고 search_index (본문, 접두어 색인) / search_ids (ID trigram)는 역색인만 가짐 (schema.sql 4절)
+- 트리거 없이 nodes를 고쳤거나 VACUUM으로 nodes rowid가 바뀌었으면 rebuild
+- 대량 임포트 뒤에는 optimize로 세그먼트 병합 (검색 시 읽는 b-tree 수 감소)
+
+사용법:
+    python fts_index.py stats
+    python fts_index.py rebuild          # nodes 전체로 색인 다시 만들기
+    python fts_index.py optimize         # 세그먼트 병합
+    python fts_index.py check            # 색인이 nodes와 일치하는지 (integrity-check)
+    python fts_index.py migrate          # 이전 레이아웃 → 현재 schema.sql 레이아웃
+"""
+
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+
+from db_utils import DB_PATH, FTS_TABLES, ensure_fts_layout, is_external_fts, is_current_fts_layout
+
+
+def rebuild(conn: sqlite3.Connection):
+    for table in FTS_TABLES:
+        conn.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+    conn.commit()
+
+
+def optimize(conn: sqlite3.Connection):
+    for table in FTS_TABLES:
+        conn.execute(f"INSERT INTO {table} ({table}) VALUES ('optimize')")
+    conn.commit()
+
+
+def check(conn: sqlite3.Connection) -> bool:
+    """색인 내용을 nodes에서 다시 토큰화해 비교 (external content: rank=1)"""
+    for table in FTS_TABLES:
+        try:
+            conn.execute(f"INSERT INTO {table} ({table}, rank) VALUES ('integrity-check', 1)")
+        except sqlite3.DatabaseError as e:
+            print(f"[ERROR] {table} does not match nodes ({e}). Run: python fts_index.py rebuild")
+            return False
+    return True
+
+
+def table_sizes(conn: sqlite3.Connection) -> dict:
+    """테이블별 바이트 수 (dbstat 가상 테이블이 없는 빌드면 빈 dict)"""
+    try:
+        rows = conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name").fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    return dict(rows)
+
+
+def print_stats(conn: sqlite3.Connection, db_path: Path):
+    if is_current_fts_layout(conn):
+        layout = 'external content + prefix, search_ids trigram'
+    elif is_external_fts(conn):
+        layout = 'external content (이전 버전: prefix / search_ids 없음)'
+    else:
+        layout = 'plain (텍스트 중복 저장)'
+    print(f"DB: {db_path} ({db_path.stat().st_size / 1024 / 1024:.1f} MB)")
+    print(f"search_index: {layout}")
+
+    sizes = table_sizes(conn)
+    if sizes:
+        print(f"  nodes          {sizes.get('nodes', 0) / 1024:10.1f} KB")
+        for table in FTS_TABLES:
+            fts = sum(size for name, size in sizes.items() if name.startswith(table))
+            print(f"  {table + '*':14} {fts / 1024:10.1f} KB")
+            for name, size in sorted(sizes.items()):
+                if name.startswith(table + '_'):
+                    print(f"    {name:22} {size / 1024:10.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='search_index / search_ids (FTS5) 관리')
+    parser.add_argument('--db', type=Path, default=DB_PATH, help=f'SQLite DB (기본: {DB_PATH})')
+    parser.add_argument('command', choices=('stats', 'rebuild', 'optimize', 'check', 'migrate'))
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    t0 = time.perf_counter()
+
+    if args.command == 'stats':
+        print_stats(conn, args.db)
+    elif args.command == 'migrate':
+        migrated = ensure_fts_layout(conn)
+        print("[OK] migrated to the current FTS layout" if migrated else "[OK] already the current FTS layout")
+    elif not is_current_fts_layout(conn):
+        print("[ERROR] FTS tables are an older layout. Run: python fts_index.py migrate")
+    elif args.command == 'rebuild':
+        rebuild(conn)
+        print(f"[OK] rebuilt in {time.perf_counter() - t0:.2f}s")
+    elif args.command == 'optimize':
+        optimize(conn)
+        print(f"[OK] optimized in {time.perf_counter() - t0:.2f}s")
+    elif args.command == 'check':
+        if check(conn):
+            print(f"[OK] search_index matches nodes ({time.perf_counter() - t0:.2f}s)")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
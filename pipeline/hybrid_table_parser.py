@@ -23,15 +23,6 @@ MARKER_DIR = BASE_DIR / "data" / "marker"
 PDF_PATH = BASE_DIR / "source" / "2024 Building Code Compendium" / "301880.pdf"
 OUTPUT_DIR = BASE_DIR / "codevault" / "public" / "data"
 
-# Part별 시작 페이지 (0-indexed)
-PART_START_PAGES = {
-    8: 678,   # Part 8 starts at page 679
-    9: 711,   # Part 9 starts at page 712
-    10: 1028, # Part 10
-    11: 1040, # Part 11
-    12: 1098, # Part 12
-}
-
 
 class TableBlock:
     """테이블 블록 데이터 클래스"""
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Part JSON → DB 통합 임포트 (모든 Part, 재실행 안전)
+- partN.json (Part → Section → Subsection, content 안의 [ARTICLE:ID:Title] 마커 → Article)을 행으로 펼침
+- 행마다 content hash를 계산해 DB의 같은 Part 행과 비교 → 바뀐 행만 INSERT ... ON CONFLICT DO UPDATE
+- search_index는 title/content가 바뀐 행만 제거 후 다시 색인 (Part 전체 LIKE 삭제 없음)
+- seq는 형제 노드 중 순서 (JSON 순서) → 재실행해도 같은 값 (MAX(seq) 사용 안 함)
+- 변경이 없으면 트랜잭션도 열지 않음 (no-op 재임포트 = 쓰기 0, generation도 만들지 않음)
+- 바뀐 행은 generation 1개로 node_changes에 기록 (db_utils 변경 로그)
+- JSON에 page가 없는 행 (Marker JSON의 Article 등)은 DB의 page를 유지 (비교에서도 제외)
+- --content-only: Part/Section/Subsection만, 이미 있는 행은 title/content만 갱신
+  (type/parent_id/page/seq는 PDF 파서가 만든 값 유지, Article 행은 만들지 않음) - update_part8_db.py
+- add_missing_articles: JSON 없이 DB의 Subsection content 마커에서 Article 행을 만들어
+  없는 것만 INSERT (insert_only, 기존 행은 건드리지 않음) - add_articles_to_db.py
+
+import_part6_to_db.py / import_part7_to_db.py / update_part8_db.py / add_articles_to_db.py는
+이 모듈을 호출하는 얇은 래퍼
+
+사용법:
+    python import_part_json.py 6                    # codevault/public/data/part6.json
+    python import_part_json.py 10 11 12
+    python import_part_json.py path/to/part7.json
+    python import_part_json.py 8 --prune            # JSON에서 사라진 Section/Subsection/Article 삭제
+    python import_part_json.py 8 --dry-run          # 변경 내역만 출력
+    python import_part_json.py 8 --content-only     # 기존 행은 title/content만 (update_part8_db.py)
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Iterator, List, Tuple
+
+from patterns import get_node_type
+from db_utils import (suspend_triggers, resume_triggers, with_content_hash, ensure_schema, number_tree,
+                      begin_generation, end_generation, node_signatures, log_changes, fts_delete, fts_insert)
+from ref_graph import build_ref_graph
+
+# 경로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, 'codevault', 'public', 'data')
+DB_PATH = os.path.join(BASE_DIR, 'data', 'obc.db')
+
+NODE_COLUMNS = ('id', 'type', 'part', 'parent_id', 'title', 'content', 'page', 'seq', 'content_hash')
+
+# JSON에서 만들어지는 타입 (--prune은 이 타입만 삭제 → 파서가 만든 Clause 등은 유지)
+IMPORTED_TYPES = ('part', 'section', 'subsection', 'alt_subsection',
+                  'article', 'article_suffix', 'article_0a', 'sub_article')
+# --content-only에서 다루는 타입 (Article 제외)
+STRUCTURE_TYPES = ('part', 'section', 'subsection', 'alt_subsection')
+# --content-only에서 이미 있는 행에 쓰는 열
+CONTENT_COLUMNS = ('title', 'content', 'content_hash')
+
+ARTICLE_MARKER = re.compile(r'\[ARTICLE:([^:]+):([^\]]*)\]')
+
+BATCH = 500  # IN (...) 바인딩 수
+
+
+def parse_articles_from_content(subsection_id: str, content: str) -> list[dict]:
+    """Subsection content에서 Article 파싱 (마커 형식: [ARTICLE:11.1.1.1:Scope])"""
+    if not content:
+        return []
+
+    matches = list(ARTICLE_MARKER.finditer(content))
+
+    articles = []
+    for i, match in enumerate(matches):
+        # content 범위: 현재 마커 끝 ~ 다음 마커 시작 (또는 끝)
+        start = match.end()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+
+        articles.append({
+            'id': match.group(1).strip(),
+            'title': match.group(2).strip(),
+            'content': content[start:end].strip(),
+            'parent_id': subsection_id
+        })
+
+    return articles
+
+
+def part_json_path(part_or_path: str) -> str:
+    """'6' → DATA_DIR/part6.json, 그 외에는 경로 그대로"""
+    if part_or_path.isdigit():
+        return os.path.join(DATA_DIR, f'part{part_or_path}.json')
+    return part_or_path
+
+
+def iter_part_rows(data: dict) -> Iterator[tuple]:
+    """Part JSON → nodes 행 (NODE_COLUMNS에서 content_hash 제외), 부모가 항상 자식보다 먼저
+
+    seq: 형제 노드 중 순서 (1부터)
+    """
+    part_id = str(data['id'])
+    part = int(part_id)
+
+    yield (part_id, 'part', part, None, data.get('title'), None, data.get('page'), 1)
+
+    for sec_seq, section in enumerate(data.get('sections', []), start=1):
+        sec_id = section['id']
+        yield (sec_id, 'section', part, part_id, section.get('title', ''), None,
+               section.get('page'), sec_seq)
+
+        for sub_seq, subsection in enumerate(section.get('subsections', []), start=1):
+            sub_id = subsection['id']
+            sub_content = subsection.get('content', '')
+            sub_type = get_node_type(sub_id)
+            if sub_type not in ('subsection', 'alt_subsection'):
+                sub_type = 'subsection'
+            yield (sub_id, sub_type, part, sec_id, subsection.get('title', ''), sub_content,
+                   subsection.get('page'), sub_seq)
+
+            for art_seq, article in enumerate(parse_articles_from_content(sub_id, sub_content), start=1):
+                art_type = get_node_type(article['id'])
+                if art_type not in IMPORTED_TYPES:
+                    art_type = 'article'
+                yield (article['id'], art_type, part, sub_id, article['title'], article['content'],
+                       None, art_seq)
+
+
+def diff_rows(rows: List[tuple], db_signatures: dict, prune: bool,
+              content_only: bool = False, insert_only: bool = False) -> Tuple[list, list, list, list]:
+    """→ (inserts, updates, deletes, fts_ids)
+
+    rows          : NODE_COLUMNS 순서 (마지막이 content_hash)
+    db_signatures : db_utils.node_signatures → {id: (type, parent_id, page, seq, content_hash)}
+    content_only  : 이미 있는 행은 content_hash만 비교 (type/parent_id/page/seq는 쓰지 않음)
+    insert_only   : 이미 있는 행은 비교하지 않고 건너뜀 (updates 없음)
+
+    page가 None인 행 (JSON에 page 없음)은 DB의 page와 비교하지 않음 (쓸 때도 COALESCE로 유지)
+
+    inserts / updates : 쓸 행
+    deletes           : --prune일 때 JSON에 없는 노드 ID (IMPORTED_TYPES, content_only면 STRUCTURE_TYPES)
+    fts_ids           : search_index를 다시 채울 ID (새 행 + content_hash 변경 + 삭제)
+    """
+    inserts, updates, fts_ids = [], [], []
+    seen = set()
+    for row in rows:
+        node_id = row[0]
+        seen.add(node_id)
+        old = db_signatures.get(node_id)
+        if old is None:
+            inserts.append(row)
+            fts_ids.append(node_id)
+            continue
+        if insert_only:
+            continue
+        if content_only:
+            changed = old[4] != row[8]
+        else:
+            changed = old != (row[1], row[3], old[2] if row[6] is None else row[6], row[7], row[8])
+        if changed:
+            updates.append(row)
+            if old[4] != row[8]:
+                fts_ids.append(node_id)
+
+    deletes = []
+    if prune:
+        types = STRUCTURE_TYPES if content_only else IMPORTED_TYPES
+        deletes = [node_id for node_id, sig in db_signatures.items()
+                   if node_id not in seen and sig[0] in types]
+        fts_ids.extend(deletes)
+
+    return inserts, updates, deletes, fts_ids
+
+
+def _batches(items: list) -> Iterator[list]:
+    for i in range(0, len(items), BATCH):
+        yield items[i:i + BATCH]
+
+
+def db_article_rows(cursor, part: int) -> Iterator[tuple]:
+    """DB에 있는 Subsection content의 [ARTICLE:...] 마커 → Article 행 (iter_part_rows와 같은 형식)"""
+    cursor.execute('''
+        SELECT id, content FROM nodes
+        WHERE part = ? AND type IN ('subsection', 'alt_subsection') AND content IS NOT NULL
+        ORDER BY id
+    ''', (part,))
+    for sub_id, sub_content in cursor.fetchall():
+        for art_seq, article in enumerate(parse_articles_from_content(sub_id, sub_content), start=1):
+            art_type = get_node_type(article['id'])
+            if art_type not in IMPORTED_TYPES:
+                art_type = 'article'
+            yield (article['id'], art_type, part, sub_id, article['title'], article['content'],
+                   None, art_seq)
+
+
+def import_part_json(json_path: str, db_path: str = DB_PATH, prune: bool = False,
+                     dry_run: bool = False, content_only: bool = False) -> dict:
+    """Part JSON 1개를 DB에 반영 (바뀐 행만)
+
+    content_only: Part/Section/Subsection 행만, 이미 있는 행은 title/content만 갱신
+
+    Returns:
+        {'part', 'rows', 'inserted', 'updated', 'deleted', 'fts', 'unchanged'} (+ 'generation' if written)
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    # 같은 ID가 두 번 나오면 (예: 6.3.4.2 마커 중복) 마지막 값 사용 - 이전 스크립트의 INSERT 후 UPDATE와 같은 결과
+    rows = list({row[0]: row for row in with_content_hash(iter_part_rows(data))}.values())
+    part = rows[0][2]
+    if content_only:
+        rows = [row for row in rows if row[1] in STRUCTURE_TYPES]
+
+    return apply_rows(rows, part, db_path, f'import_part_json {os.path.basename(json_path)}',
+                      prune=prune, dry_run=dry_run, content_only=content_only)
+
+
+def add_missing_articles(part: int, db_path: str = DB_PATH, dry_run: bool = False) -> dict:
+    """DB의 Subsection content 마커에서 아직 없는 Article 노드만 추가 (JSON 불필요)
+
+    이미 있는 노드 (Article 포함)와 Subsection 행은 그대로 - title/content/page/seq 모두 유지
+    """
+    conn = sqlite3.connect(db_path)
+    ensure_schema(conn)
+    # 같은 ID 마커가 두 번 나오면 처음 것 (이전 add_articles_to_db.py와 같은 결과)
+    rows = {}
+    for row in with_content_hash(db_article_rows(conn.cursor(), part)):
+        rows.setdefault(row[0], row)
+    conn.close()
+
+    return apply_rows(list(rows.values()), part, db_path, f'add_missing_articles part{part}',
+                      dry_run=dry_run, insert_only=True)
+
+
+def apply_rows(rows: List[tuple], part: int, db_path: str, source: str, prune: bool = False,
+               dry_run: bool = False, content_only: bool = False, insert_only: bool = False) -> dict:
+    """Part 1개의 행 (NODE_COLUMNS 순서)을 DB와 비교해서 바뀐 행만 반영 (source: generation 기록용)"""
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    ensure_schema(conn)
+    cursor = conn.cursor()
+
+    # DB 쪽은 content를 읽지 않고 content_hash만 비교
+    t0 = time.perf_counter()
+    inserts, updates, deletes, fts_ids = diff_rows(rows, node_signatures(cursor, part), prune,
+                                                   content_only, insert_only)
+    diff_time = time.perf_counter() - t0
+
+    stats = {
+        'part': part, 'rows': len(rows), 'inserted': len(inserts), 'updated': len(updates),
+        'deleted': len(deletes), 'fts': len(fts_ids),
+        'unchanged': len(rows) - len(inserts) - len(updates),
+    }
+
+    print(f"Part {part}: {len(rows)} rows ({diff_time * 1000:.0f}ms diff) → "
+          f"+{stats['inserted']} ~{stats['updated']} -{stats['deleted']} "
+          f"(unchanged {stats['unchanged']}, FTS {stats['fts']})")
+    for row in inserts:
+        print(f"  [+] {row[1]}: {row[0]}")
+    for row in updates:
+        print(f"  [U] {row[1]}: {row[0]}")
+    for node_id in deletes:
+        print(f"  [-] {node_id}")
+
+    if dry_run or not (inserts or updates or deletes):
+        conn.close()
+        return stats
+
+    placeholders = ', '.join('?' * len(NODE_COLUMNS))
+    # JSON에 page가 없으면 (None) DB의 page 유지
+    assignments = ', '.join(f"{col} = COALESCE(excluded.{col}, nodes.{col})" if col == 'page'
+                            else f"{col} = excluded.{col}"
+                            for col in (CONTENT_COLUMNS if content_only else NODE_COLUMNS[1:]))
+
+    cursor.execute("BEGIN")
+    try:
+        # 동기화 트리거 대신 바뀐 행만 search_index 갱신
+        trigger_sqls = suspend_triggers(cursor)
+        generation = begin_generation(cursor, source)
+
+        # search_index (external content): 바뀌기 전 값으로 제거 → nodes 쓰기 → 새 값으로 색인
+        for batch in _batches(fts_ids):
+            fts_delete(cursor, f"id IN ({', '.join('?' * len(batch))})", batch)
+
+        cursor.executemany(f'''
+            INSERT INTO nodes ({', '.join(NODE_COLUMNS)}) VALUES ({placeholders})
+            ON CONFLICT(id) DO UPDATE SET {assignments}
+        ''', inserts + updates)
+
+        for batch in _batches(deletes):
+            marks = ', '.join('?' * len(batch))
+            cursor.execute(f"DELETE FROM refs WHERE source_id IN ({marks})", batch)
+            cursor.execute(f"DELETE FROM nodes WHERE id IN ({marks})", batch)
+
+        for batch in _batches(fts_ids):
+            fts_insert(cursor, f"id IN ({', '.join('?' * len(batch))})", batch)
+        log_changes(cursor, generation,
+                    [(row[0], 'insert') for row in inserts] + [(row[0], 'update') for row in updates]
+                    + [(node_id, 'delete') for node_id in deletes])
+        stats['generation'] = generation
+        number_tree(cursor, part)
+        if inserts or deletes:  # 대상 노드가 생기거나 사라진 참조 (다른 Part의 refs 포함) 다시 해석
+            build_ref_graph(cursor)
+
+        resume_triggers(cursor, trigger_sqls)
+        end_generation(cursor, generation)
+        cursor.execute("COMMIT")
+    except BaseException:
+        cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Part JSON → obc.db (content hash diff, 바뀐 행만 반영)')
+    parser.add_argument('parts', nargs='+',
+                        help=f'Part 번호 (→ {DATA_DIR}/partN.json) 또는 JSON 경로')
+    parser.add_argument('--db', default=DB_PATH, help=f'SQLite DB (기본: {DB_PATH})')
+    parser.add_argument('--prune', action='store_true',
+                        help='JSON에 없는 Section/Subsection/Article 노드 삭제 (Clause 등은 유지)')
+    parser.add_argument('--dry-run', action='store_true', help='변경 내역만 출력 (DB 변경 없음)')
+    parser.add_argument('--content-only', action='store_true',
+                        help='Section/Subsection만, 기존 행은 title/content만 갱신 (Article 행 안 만듦)')
+    args = parser.parse_args()
+
+    print("=== Part JSON 임포트 ===\n")
+    for part_or_path in args.parts:
+        json_path = part_json_path(part_or_path)
+        print(f"Loading {json_path}...")
+        import_part_json(json_path, args.db, prune=args.prune, dry_run=args.dry_run,
+                         content_only=args.content_only)
+
+    print(f"\n=== 완료: {args.db} ===")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+301880.pdf → Marker (marker_single) 청크 병렬 실행 + 청크 캐시 → 301880_full.md 병합
+- 페이지를 CHUNK_SIZE 단위 청크로 나눠 워커 슬롯 수만큼 동시에 marker_single 실행
+    CPU 전용: marker_single(torch)은 기본으로 코어 전부를 스레드로 씀 → 슬롯마다 코어 / 슬롯 수 스레드로 제한
+    (workers x threads = 코어 수, 프로세스마다 모델 메모리 수 GB → 메모리가 부족하면 --workers를 줄일 것)
+- 청크 출력 캐시: 키 = (PDF SHA-256, 페이지 구간, Marker 옵션)
+    data/marker/chunks/<pdf hash16>/p<first>-<last>_<key12>/  (chunk.json이 있으면 완료된 청크)
+    임시 폴더에서 실행 → 성공하면 os.replace → 중단돼도 반쯤 쓴 청크가 캐시에 남지 않음
+- 다시 실행하면 캐시된 청크는 건너뜀 (자동 재개), 실패한 청크는 --retries번까지 다시 실행
+- 병합: 페이지 순서로 이어붙여 301880_full.md + 301880_full.pages.json (페이지 → 문자 오프셋)
+    --paginate_output의 페이지 구분선은 병합할 때 제거 (Part 파서는 구분선을 모름)
+    --pages가 PDF 일부만이면 기본 출력 (301880_full.md)은 덮어쓰지 않음 → --out 또는 --no-merge 필요
+
+사용법:
+    python marker_chunks.py                          # 전체 페이지 (캐시된 청크 건너뜀) + 병합
+    python marker_chunks.py --workers 2 --threads 8
+    python marker_chunks.py --dry-run                # 청크 목록 / 캐시 상태만
+    python marker_chunks.py --pages 700-799 --out data/marker/p700.md   # 일부 페이지만 (별도 파일)
+    python marker_chunks.py --marker-exe /path/to/marker_single --retries 2
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from page_cache import pdf_fingerprint
+
+ROOT = Path(__file__).parent.parent
+PDF_PATH = ROOT / "source/2024 Building Code Compendium/301880.pdf"
+OUTPUT_PATH = ROOT / "data" / "marker" / "301880_full.md"
+CHUNK_DIR = ROOT / "data" / "marker" / "chunks"
+MANIFEST_FILE = "chunk.json"
+
+TOTAL_PAGES = 1260      # 301880.pdf 전체 페이지 수 (parse_compendium.COMPENDIUM_PAGES)
+CHUNK_SIZE = 100
+THREADS_PER_WORKER = 4  # 기본 슬롯 수 = 코어 수 / 4
+RETRIES = 1
+
+# 캐시 키에 들어감 → 바꾸면 모든 청크를 다시 실행
+MARKER_OPTIONS = ('--paginate_output', '--layout_batch_size', '1')
+
+# marker --paginate_output: "\n\n{page_id}" + "-" * 48 + "\n\n"
+PAGE_SEPARATOR = re.compile(r'^\{(\d+)\}-{48}$', re.MULTILINE)
+THREAD_ENV = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'TORCH_NUM_THREADS')
+
+
+def find_marker(exe: Optional[str] = None) -> Optional[str]:
+    """marker_single 경로: 인자 → MARKER_SINGLE 환경 변수 → PATH"""
+    return exe or os.environ.get('MARKER_SINGLE') or shutil.which('marker_single')
+
+
+def plan_chunks(first: int, last: int, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """[(first, last), ...] (0-indexed, last 포함 - marker --page_range 형식)"""
+    return [(start, min(start + chunk_size, last + 1) - 1) for start in range(first, last + 1, chunk_size)]
+
+
+def chunk_key(pdf_hash: str, first: int, last: int, options: Tuple[str, ...]) -> str:
+    record = json.dumps({'pdf': pdf_hash, 'pages': [first, last], 'options': list(options)}, sort_keys=True)
+    return hashlib.sha256(record.encode('utf-8')).hexdigest()
+
+
+def chunk_path(cache_dir: Path, pdf_hash: str, first: int, last: int, options: Tuple[str, ...]) -> Path:
+    key = chunk_key(pdf_hash, first, last, options)
+    return Path(cache_dir) / pdf_hash[:16] / f"p{first:04d}-{last:04d}_{key[:12]}"
+
+
+def load_manifest(path: Path) -> Optional[dict]:
+    """완료된 청크의 chunk.json (없으면 None)"""
+    manifest = path / MANIFEST_FILE
+    if not manifest.exists():
+        return None
+    with open(manifest, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _find_markdown(out_dir: Path, pdf_path: Path) -> Optional[Path]:
+    """marker_single 출력: <output_dir>/<pdf stem>/<pdf stem>.md (버전에 따라 다르면 첫 .md)"""
+    expected = out_dir / pdf_path.stem / f"{pdf_path.stem}.md"
+    if expected.exists():
+        return expected
+    found = sorted(out_dir.rglob('*.md'))
+    return found[0] if found else None
+
+
+def run_chunk(job: dict) -> Tuple[bool, str]:
+    """청크 1개 실행 → (성공 여부, 메시지). 성공하면 job['path']에 chunk.json까지 기록"""
+    path = job['path']
+    tmp = path.with_name(path.name + '.tmp')
+    shutil.rmtree(tmp, ignore_errors=True)  # 이전 실행이 중단되며 남긴 임시 폴더
+    tmp.mkdir(parents=True)
+
+    cmd = [job['exe'], str(job['pdf']), '--output_dir', str(tmp),
+           '--page_range', f"{job['first']}-{job['last']}", *job['options']]
+    env = dict(os.environ, TORCH_DEVICE='cpu')
+    env.update({name: str(job['threads']) for name in THREAD_ENV})
+
+    t0 = time.perf_counter()
+    try:
+        with open(tmp / 'marker.log', 'w', encoding='utf-8') as log:
+            result = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT, env=env, timeout=job['timeout'])
+    except subprocess.TimeoutExpired:
+        return False, f"timeout after {job['timeout']}s"
+    except OSError as e:
+        return False, str(e)
+    seconds = time.perf_counter() - t0
+
+    if result.returncode != 0:
+        tail = (tmp / 'marker.log').read_text(encoding='utf-8', errors='replace').strip().splitlines()[-3:]
+        return False, f"exit {result.returncode}: {' | '.join(tail)}"
+    markdown = _find_markdown(tmp, Path(job['pdf']))
+    if markdown is None:
+        return False, "no markdown output"
+
+    manifest = {
+        'pdf_sha256': job['pdf_hash'],
+        'first': job['first'],
+        'last': job['last'],
+        'options': list(job['options']),
+        'markdown': markdown.relative_to(tmp).as_posix(),
+        'seconds': round(seconds, 1),
+    }
+    with open(tmp / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp, path)
+    return True, f"{seconds:.1f}s"
+
+
+def run_chunks(jobs: List[dict], workers: int, retries: int = RETRIES) -> List[dict]:
+    """워커 슬롯 workers개로 실행 (실패하면 retries번까지 다시) → 끝내 실패한 job 목록"""
+    attempts = {id(job): 0 for job in jobs}
+    failed = []
+    pending = list(jobs)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        while pending or running:
+            while pending and len(running) < workers:
+                job = pending.pop(0)
+                attempts[id(job)] += 1
+                running[pool.submit(run_chunk, job)] = job
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                ok, message = future.result()
+                label = f"pages {job['first']}-{job['last']}"
+                if ok:
+                    print(f"[OK] {label} ({message})")
+                elif attempts[id(job)] <= retries:
+                    print(f"[RETRY] {label} (attempt {attempts[id(job)]}): {message}")
+                    pending.append(job)
+                else:
+                    print(f"[ERROR] {label}: {message}")
+                    failed.append(job)
+    return failed
+
+
+def split_pages(markdown: str, first: int, last: int) -> List[Tuple[int, str]]:
+    """청크 Markdown → [(page_idx, text)] (--paginate_output 구분선 기준)
+
+    구분선의 페이지 번호가 청크 기준 (0부터)이면 first를 더해 PDF 기준으로
+    """
+    parts = PAGE_SEPARATOR.split(markdown)
+    pages = [(first, parts[0])] if parts[0].strip() else []
+    numbers = [int(n) for n in parts[1::2]]
+    if numbers and not all(first <= n <= last for n in numbers):
+        if not all(0 <= n <= last - first for n in numbers):
+            raise ValueError(f"page ids {numbers[0]}..{numbers[-1]} outside chunk pages {first}-{last}")
+        numbers = [n + first for n in numbers]
+    pages += zip(numbers, parts[2::2])
+    return pages
+
+
+def merge_chunks(chunks: List[Tuple[int, int, Path]], out_path: Path, pdf_hash: str,
+                 options: Tuple[str, ...]) -> dict:
+    """완료된 청크 [(first, last, chunk 폴더)] → out_path (.md) + .pages.json. 통계 반환
+
+    페이지 순서 고정, 페이지마다 앞뒤 빈 줄을 지우고 "\\n\\n"으로 이어붙임 → 같은 청크면 같은 파일
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    pages = []
+    for first, last, path in sorted(chunks):
+        manifest = load_manifest(path)
+        markdown = (path / manifest['markdown']).read_text(encoding='utf-8')
+        pages += split_pages(markdown, first, last)
+    text, spans = join_pages(pages)
+
+    index = {
+        'pdf_sha256': pdf_hash,
+        'options': list(options),
+        'chunks': [[first, last, path.name] for first, last, path in sorted(chunks)],
+        'pages': spans,
+    }
+    write_merged(out_path, text, index)
+    return {'pages': len(spans), 'chars': len(text)}
+
+
+def page_text(text: str) -> str:
+    """페이지 1개의 병합 형식: 앞뒤 빈 줄 제거 + "\n\n" (빈 페이지는 '')"""
+    text = text.strip('\n')
+    return text + '\n\n' if text else ''
+
+
+def join_pages(pages: List[Tuple[int, str]]) -> Tuple[str, Dict[str, List[int]]]:
+    """[(page_idx, text)] → (병합 텍스트, {"page_idx": [start, end)}) (페이지 순)"""
+    texts = []
+    spans = {}
+    offset = 0
+    for page_idx, text in sorted(pages, key=lambda page: page[0]):
+        text = page_text(text)
+        spans[str(page_idx)] = [offset, offset + len(text)]
+        texts.append(text)
+        offset += len(text)
+    return ''.join(texts), spans
+
+
+def write_merged(out_path: Path, text: str, index: Optional[dict]):
+    """.md (+ .pages.json) 원자적 쓰기 (tmp → os.replace)"""
+    files = [(Path(out_path), text)]
+    if index is not None:
+        files.append((pages_index_path(out_path), json.dumps(index, indent=1)))
+    for path, content in files:
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp, path)
+
+
+def pages_index_path(out_path: Path) -> Path:
+    """301880_full.md → 301880_full.pages.json"""
+    return Path(out_path).with_name(Path(out_path).stem + '.pages.json')
+
+
+def parse_pages(value: str) -> Tuple[int, int]:
+    """'0-1259' → (0, 1259)"""
+    first, _, last = value.partition('-')
+    try:
+        first, last = int(first), int(last or first)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FIRST-LAST (0-indexed), got {value!r}")
+    if first < 0 or last < first:
+        raise argparse.ArgumentTypeError(f"invalid page range {value!r}")
+    return first, last
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='301880.pdf → Marker 청크 병렬 실행 (캐시 / 재개) → 301880_full.md')
+    parser.add_argument('--pdf', type=Path, default=PDF_PATH)
+    parser.add_argument('--out', type=Path, default=None,
+                        help=f'병합 결과 (기본: {OUTPUT_PATH}, --pages가 일부면 지정 필수)')
+    parser.add_argument('--cache-dir', type=Path, default=CHUNK_DIR)
+    parser.add_argument('--pages', type=parse_pages, default=(0, TOTAL_PAGES - 1), metavar='FIRST-LAST',
+                        help=f'0-indexed, 끝 포함 (기본: 0-{TOTAL_PAGES - 1})')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=None,
+                        help=f'동시 실행 슬롯 (기본: 코어 수 / {THREADS_PER_WORKER})')
+    parser.add_argument('--threads', type=int, default=None, help='슬롯당 torch 스레드 (기본: 코어 수 / 슬롯)')
+    parser.add_argument('--retries', type=int, default=RETRIES, help='실패한 청크 재실행 횟수')
+    parser.add_argument('--timeout', type=int, default=None, help='청크당 제한 시간 (초)')
+    parser.add_argument('--marker-exe', default=None, help='marker_single (기본: MARKER_SINGLE 또는 PATH)')
+    parser.add_argument('--no-merge', action='store_true', help='청크만 실행')
+    parser.add_argument('--dry-run', action='store_true', help='청크 목록 / 캐시 상태만 출력')
+    args = parser.parse_args()
+
+    if not args.pdf.exists():
+        print(f"[ERROR] PDF not found: {args.pdf}")
+        sys.exit(1)
+
+    # 일부 페이지만 병합한 파일로 전체 301880_full.md를 덮어쓰지 않도록 (Marker 실행 전에 확인)
+    partial = args.pages != (0, TOTAL_PAGES - 1)
+    if partial and args.out is None and not (args.no_merge or args.dry_run):
+        print(f"[ERROR] --pages {args.pages[0]}-{args.pages[1]} covers only part of the PDF; "
+              f"refusing to overwrite {OUTPUT_PATH}. Pass --out for a partial file or --no-merge.")
+        sys.exit(1)
+    out_path = args.out or OUTPUT_PATH
+
+    pdf_hash = pdf_fingerprint(args.pdf)
+    options = MARKER_OPTIONS
+    chunks = [(first, last, chunk_path(args.cache_dir, pdf_hash, first, last, options))
+              for first, last in plan_chunks(*args.pages, args.chunk_size)]
+    todo = [(first, last, path) for first, last, path in chunks if load_manifest(path) is None]
+
+    workers = max(1, min(args.workers or cpus // THREADS_PER_WORKER, len(todo) or 1))
+    threads = args.threads or max(1, cpus // workers)
+    print(f"PDF: {args.pdf} ({pdf_hash[:16]})")
+    print(f"Chunks: {len(chunks)} x {args.chunk_size} pages, cached {len(chunks) - len(todo)}, "
+          f"to run {len(todo)} ({workers} workers x {threads} threads)")
+
+    if args.dry_run:
+        for first, last, path in chunks:
+            state = 'cached' if load_manifest(path) else 'todo'
+            print(f"  pages {first:4}-{last:4}  {state:6}  {path}")
+        return
+
+    if todo:
+        exe = find_marker(args.marker_exe)
+        if exe is None:
+            print("[ERROR] marker_single not found (--marker-exe, MARKER_SINGLE or PATH)")
+            sys.exit(1)
+        jobs = [{'exe': exe, 'pdf': args.pdf, 'pdf_hash': pdf_hash, 'first': first, 'last': last,
+                 'path': path, 'options': options, 'threads': threads, 'timeout': args.timeout}
+                for first, last, path in todo]
+        t0 = time.perf_counter()
+        failed = run_chunks(jobs, workers, args.retries)
+        print(f"Marker: {len(jobs) - len(failed)}/{len(jobs)} chunks in {time.perf_counter() - t0:.1f}s")
+        if failed:
+            ranges = ', '.join(f"{job['first']}-{job['last']}" for job in failed)
+            print(f"[ERROR] failed chunks: {ranges} (run again to resume, log: <chunk>.tmp/marker.log)")
+            sys.exit(1)
+
+    if not args.no_merge:
+        stats = merge_chunks(chunks, out_path, pdf_hash, options)
+        print(f"[OK] {out_path} ({stats['pages']} pages, {stats['chars'] / 1024:.0f} KB) "
+              f"+ {pages_index_path(out_path).name}")
+
+
+if __name__ == '__main__':
+    main()
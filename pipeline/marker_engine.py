@@ -0,0 +1,1320 @@
+#!/usr/bin/env python3
+"""
+Marker 301880_full.md → Part별 JSON 공용 엔진 (Part 6 / 7 / 8)
+- Marker 파일은 1번만 읽고, "# Part N" 헤딩을 1번 스캔해서 Part 경계를 색인 (index_parts)
+- Part마다 PART_CONFIGS (Section/Subsection 제목, ID 접두사, 출력 경로, Part별 차이)로 같은 변환 적용
+    6, 7: 301880_full.md 형식 (#### Table 헤딩, Notes 대시, where 블록)
+    8   : part8.md 형식 (<h4 class="table-title">, 단순 Clause 정리)
+- 6, 7의 Subsection 후처리는 줄 단위 1회 스캔 (transform_content_fused, 결과는 정규식 체인 transform_content와 같음)
+- Part끼리는 독립 → ProcessPoolExecutor로 Part마다 워커 1개 (워커에는 해당 Part 구간만 전달)
+- Section / Subsection 분할은 헤딩만 찾아서 버퍼 구간으로 (iter_subsections) → Subsection마다 슬라이스 1번
+- parse_marker_part6/7/8.py는 이 모듈의 얇은 래퍼 (단독 실행 그대로)
+- part8.json의 원본은 별도 Marker 실행인 part8.md (PART_CONFIGS['8']['source'], parse_marker_part8.py)
+    → 기본 실행 대상 (FULL_MARKER_PARTS)에서 빠지고, 8을 직접 지정하면 --out-dir 필요 (part8.json 덮어쓰기 방지)
+
+사용법:
+    python marker_engine.py                        # FULL_MARKER_PARTS (6, 7)
+    python marker_engine.py 6 7 --workers 2
+    python marker_engine.py --marker x.md --out-dir /tmp/parts
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+MARKER_PATH = ROOT / "data" / "marker" / "301880_full.md"
+DATA_DIR = ROOT / "codevault" / "public" / "data"
+
+PART_HEADING = re.compile(r'^# Part (\d+)\s*$', re.MULTILINE)
+
+SUPERSCRIPT_MAP = {
+    '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
+    '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
+    '(': '⁽', ')': '⁾', '+': '⁺', '-': '⁻', '=': '⁼',
+    'n': 'ⁿ', 'i': 'ⁱ',
+}
+
+# Section / Subsection 제목 매핑 (목차에서 추출)
+PART6_SECTION_TITLES = {
+    "6.1": "General",
+    "6.2": "Design and Installation",
+    "6.3": "Ventilation Systems",
+    "6.4": "Heating Appliances",
+    "6.5": "Thermal Insulation Systems",
+    "6.6": "Refrigeration and Cooling Systems",
+    "6.7": "Piping Systems",
+    "6.8": "Equipment Access",
+    "6.9": "Fire Safety Systems"
+}
+
+PART6_SUBSECTION_TITLES = {
+    "6.1.1": "Application",
+    "6.1.2": "Definitions",
+    "6.2.1": "General",
+    "6.2.2": "Incinerators",
+    "6.2.3": "Solid Fuel Storage",
+    "6.3.1": "Ventilation",
+    "6.3.2": "Air Duct Systems",
+    "6.3.3": "Chimneys and Venting Equipment",
+    "6.3.4": "Ventilation for Laboratories",
+    "6.4.1": "Heating Appliances, General",
+    "6.4.2": "Unit Heaters",
+    "6.4.3": "Radiators and Convectors",
+    "6.5.1": "Insulation",
+    "6.6.1": "Refrigerating Systems and Equipment for Air Conditioning",
+    "6.7.1": "Piping for Heating and Cooling Systems",
+    "6.7.2": "Storage Bins",
+    "6.8.1": "Openings",
+    "6.9.1": "General",
+    "6.9.2": "Dampers and Ductwork",
+    "6.9.3": "Carbon Monoxide Alarms",
+    "6.9.4": "Ash Storage"
+}
+
+PART7_SECTION_TITLES = {
+    "7.1": "General",
+    "7.2": "Materials and Equipment",
+    "7.3": "Piping",
+    "7.4": "Drainage Systems",
+    "7.5": "Venting Systems",
+    "7.6": "Potable Water Systems",
+    "7.7": "Non-Potable Water Systems"
+}
+
+PART7_SUBSECTION_TITLES = {
+    "7.1.0": "Scope",
+    "7.1.1": "Application",
+    "7.1.1A": "Definitions",
+    "7.1.1B": "Plumbing Facilities",
+    "7.1.2": "Service Connections",
+    "7.1.3": "Location of Fixtures",
+    "7.1.3A": "Accommodating Movement",
+    "7.1.4": "Seismic Design",
+    "7.2.1": "General",
+    "7.2.2": "Fixtures",
+    "7.2.3": "Traps and Interceptors",
+    "7.2.4": "Pipe Fittings",
+    "7.2.5": "Non-Metallic Pipe and Fittings",
+    "7.2.6": "Ferrous Pipe and Fittings",
+    "7.2.7": "Non-Ferrous Pipe and Fittings",
+    "7.2.8": "Corrosion Resistant Materials",
+    "7.2.9": "Jointing Materials",
+    "7.2.10": "Miscellaneous Materials",
+    "7.2.11": "Water Service Pipes and Fire Service Mains",
+    "7.3.1": "Application",
+    "7.3.2": "Construction and Use of Joints",
+    "7.3.3": "Joints and Connections",
+    "7.3.4": "Support of Piping",
+    "7.3.5": "Protection of Piping",
+    "7.3.6": "Testing of Drainage and Venting Systems",
+    "7.3.7": "Testing of Potable Water Systems",
+    "7.4.1": "Application",
+    "7.4.2": "Connections to Drainage Systems",
+    "7.4.3": "Location of Fixtures",
+    "7.4.4": "Treatment of Sewage and Wastes",
+    "7.4.5": "Traps",
+    "7.4.6": "Arrangement of Drainage Piping",
+    "7.4.7": "Cleanouts",
+    "7.4.8": "Minimum Slope and Length of Drainage Pipes",
+    "7.4.9": "Size of Drainage Pipes",
+    "7.4.10": "Hydraulic Loads",
+    "7.5.1": "Vent Pipes for Traps",
+    "7.5.2": "Wet Venting",
+    "7.5.3": "Circuit Venting",
+    "7.5.4": "Vent Pipes for Stacks",
+    "7.5.5": "Miscellaneous Vent Pipes",
+    "7.5.6": "Arrangement of Vent Pipes",
+    "7.5.7": "Minimum Size of Vent Pipes",
+    "7.5.8": "Sizing of Vent Pipes",
+    "7.5.9": "Air Admittance Valves",
+    "7.6.1": "Arrangement of Piping",
+    "7.6.2": "Protection from Contamination",
+    "7.6.3": "Size and Capacity of Pipes",
+    "7.6.4": "Water Efficiency",
+    "7.7.1": "Non-Potable Water Systems",
+    "7.7.2": "Non-Potable Rainwater Harvesting Systems",
+    "7.7.3": "Non-Potable Water Systems for Re-Use Purposes",
+    "7.7.4": "Water Quality"
+}
+
+PART8_SECTION_TITLES = {
+    "8.1": "General",
+    "8.2": "Design Standards",
+    "8.3": "Class 1 Sewage Systems",
+    "8.4": "Class 2 Sewage Systems",
+    "8.5": "Class 3 Sewage Systems",
+    "8.6": "Class 4 Sewage Systems",
+    "8.7": "Leaching Beds",
+    "8.8": "Class 5 Sewage Systems",
+    "8.9": "Operation and Maintenance"
+}
+
+PART8_SUBSECTION_TITLES = {
+    "8.1.1": "Scope",
+    "8.1.2": "Application",
+    "8.1.3": "Limitations",
+    "8.2.1": "General Requirements",
+    "8.2.2": "Treatment and Holding Tanks",
+    "8.3.1": "General Requirements",
+    "8.3.2": "Superstructure Requirements",
+    "8.3.3": "Earth Pit Privy",
+    "8.3.4": "Privy Vaults and Pail Privy",
+    "8.3.5": "Portable Privy",
+    "8.4.1": "General Requirements",
+    "8.4.2": "Design and Construction Requirements",
+    "8.5.1": "General Requirements",
+    "8.5.2": "Design and Construction Requirements",
+    "8.6.1": "General Requirements",
+    "8.6.2": "Treatment Units",
+    "8.7.1": "General Requirements",
+    "8.7.2": "Design and Construction Requirements",
+    "8.7.3": "Absorption Trench Construction",
+    "8.7.4": "Fill Based Absorption Trenches",
+    "8.7.5": "Filter Beds",
+    "8.7.6": "Shallow Buried Trench",
+    "8.7.7": "Type A Dispersal Beds",
+    "8.7.8": "Type B Dispersal Beds",
+    "8.8.1": "Application",
+    "8.8.2": "General Requirements",
+    "8.9.1": "General",
+    "8.9.2": "Operation",
+    "8.9.3": "Maintenance"
+}
+
+
+# ============================================================
+# 공통 변환
+# ============================================================
+
+def convert_superscript(text: str) -> str:
+    """<sup> 태그를 유니코드 위첨자로 변환"""
+    def replace_sup(m):
+        return ''.join(SUPERSCRIPT_MAP.get(char, char) for char in m.group(1))
+
+    return re.sub(r'<sup>([^<]+)</sup>', replace_sup, text, flags=re.IGNORECASE)
+
+
+def clean_text(text: str, file_links: bool = False, superscript: bool = True, revisions: str = 'r') -> str:
+    """텍스트 정리
+
+    Args:
+        file_links: [text](file:///...) → text (Word 문서 내부 링크, Part 6)
+        superscript: <sup> → 유니코드 위첨자
+        revisions: 제거할 개정 표시 문자 ('er' → e1, e2, r1, r2 / 'r' → r1, r2 / '' → 그대로)
+    """
+    # 이미지 참조 제거 (줄바꿈 유지!)
+    text = re.sub(r'!\[\]\([^)]+\)', '', text)
+    # span 태그 제거
+    text = re.sub(r'<span[^>]*>|</span>', '', text)
+    if file_links:
+        text = re.sub(r'\[([^\]]+)\]\(file:///[^)]+\)', r'\1', text)
+    if superscript:
+        text = convert_superscript(text)
+    if revisions and re.search(rf'[{revisions}][12]', text):
+        # 패턴: **r1**, **r2**, r1, r2 (문장 끝이나 단독)
+        # 앞의 \s* 때문에 모든 위치에서 매칭을 시도 → 후보 문자가 있을 때만 (Subsection 대부분은 없음)
+        text = re.sub(rf'\s*\*{{0,2}}[{revisions}][12]\*{{0,2}}(?=\s|$|\.|\))', '', text)
+    # 연속 빈 줄 정리
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def parse_markdown_table(table_text: str) -> str:
+    """Markdown 파이프 테이블 → HTML 테이블 변환"""
+    lines = [l.strip() for l in table_text.strip().split('\n') if l.strip()]
+
+    if len(lines) < 2:
+        return table_text
+
+    # 헤더 파싱
+    if not lines[0].startswith('|'):
+        return table_text
+
+    headers = [cell.strip() for cell in lines[0].split('|')[1:-1]]
+
+    # 구분선 확인
+    if len(lines) > 1 and re.match(r'\|[\s\-:]+\|', lines[1]):
+        data_start = 2
+    else:
+        data_start = 1
+
+    # 데이터 행 파싱
+    rows = []
+    for line in lines[data_start:]:
+        if line.startswith('|'):
+            cells = [cell.strip() for cell in line.split('|')[1:-1]]
+            rows.append(cells)
+
+    # HTML 생성
+    html = ['<table class="obc-table">']
+
+    if headers:
+        html.append('<thead><tr>')
+        for h in headers:
+            html.append(f'<th>{h}</th>')
+        html.append('</tr></thead>')
+
+    if rows:
+        html.append('<tbody>')
+        for row in rows:
+            html.append('<tr>')
+            for cell in row:
+                html.append(f'<td>{cell}</td>')
+            html.append('</tr>')
+        html.append('</tbody>')
+
+    html.append('</table>')
+    return ''.join(html)
+
+
+def convert_tables_in_content(content: str) -> str:
+    """Content 내의 Markdown 테이블을 HTML로 변환"""
+    lines = content.split('\n')
+    result = []
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+
+        # 파이프 테이블 시작 감지
+        if line.strip().startswith('|') and '|' in line[1:]:
+            table_lines = [line]
+            i += 1
+
+            while i < len(lines):
+                next_line = lines[i]
+                if next_line.strip().startswith('|') or re.match(r'^\|?[\s\-:]+\|', next_line.strip()):
+                    table_lines.append(next_line)
+                    i += 1
+                else:
+                    break
+
+            if len(table_lines) >= 2:
+                result.append(parse_markdown_table('\n'.join(table_lines)))
+            else:
+                result.extend(table_lines)
+        else:
+            result.append(line)
+            i += 1
+
+    return '\n'.join(result)
+
+
+# ============================================================
+# 301880_full.md 형식 (Part 6, 7)
+# ============================================================
+
+def convert_article_markers(content: str, prefix: str) -> str:
+    """Article 헤딩을 [ARTICLE:ID:Title] 마커로 변환
+
+    ### 7.1.1.1. Scope -> [ARTICLE:7.1.1.1:Scope]
+    X.X.X.X / X.X.XA.X (대안 Subsection의 Article) / X.X.X.XA (Article suffix)
+    """
+    pattern = rf'^#{{1,4}}\s*({prefix}\.\d+\.\d+[A-Z]?\.\d+[A-Z]?)\.\s*(.+)$'
+    return re.sub(pattern, lambda m: f'\n{_article_marker(m.group(1), m.group(2))}', content, flags=re.MULTILINE)
+
+
+def _article_marker(article_id: str, title: str) -> str:
+    title = title.strip()
+    # Bold 제거
+    title = re.sub(r'\*{1,2}', '', title)
+    # (See Note...) 제거
+    title = re.sub(r'\s*\(See Note[^)]+\)', '', title)
+    # **e2** 같은 마커 제거
+    title = re.sub(r'\s*\*{0,2}[er]\d+\*{0,2}$', '', title)
+    return f'[ARTICLE:{article_id}:{title.strip()}]'
+
+
+def convert_table_headings(content: str, prefix: str) -> str:
+    """테이블 헤딩 정리 - Part 11 형식 (#### Table X.X.X.X. Title)
+
+    입력 형태들:
+      - ### **Table X.x.x.x. Title** Forming Part of...
+      - **Table X.x.x.x. Title** Forming Part of...
+      - Table X.x.x.x.\\n\\nTitle\\nForming Part of...
+    """
+    table_id = rf'Table {prefix}\.\d+\.\d+\.\d+\.?(?:-[A-Z])?'
+
+    # Pattern 1: Bold로 감싸진 테이블 제목 (마크다운 헤딩 포함 가능)
+    def replace1(m):
+        table_part = re.sub(r'\s+', ' ', m.group(1).strip())
+        rest = m.group(2).strip()
+        if rest:
+            return f'#### {table_part} {rest}'
+        return f'#### {table_part}'
+
+    content = re.sub(rf'^#{{0,4}}\s*\*{{2}}({table_id}[^*]*)\*{{2}}\s*(.*)$', replace1, content, flags=re.MULTILINE)
+
+    # Pattern 2: ### Table X.X.X.X. Title (Bold 없는 마크다운 헤딩)
+    def replace2(m):
+        rest = m.group(2).strip()
+        if rest:
+            return f'#### {m.group(1).strip()} {rest}'
+        return f'#### {m.group(1).strip()}'
+
+    content = re.sub(rf'^#{{1,4}}\s*({table_id})\s*(.*)$', replace2, content, flags=re.MULTILINE)
+
+    # Pattern 3: 줄바꿈으로 분리된 테이블 헤딩
+    content = re.sub(rf'^({table_id})\s*\n\n(.+?)\n(Forming Part of.+)$', r'#### \1 \2 \3',
+                     content, flags=re.MULTILINE)
+
+    return content
+
+
+def convert_notes_headings(content: str) -> str:
+    """Notes to Table 헤딩 변환
+
+    #### Notes to Table 7.2.5.15.: / Notes to Table 7.2.5.15.:
+        → <h5 class="table-notes-title">Notes to Table 7.2.5.15.:</h5>
+    """
+    # Pattern 1: ### Notes to Table... 또는 #### Notes to Table...
+    pattern1 = r'^#{1,5}\s*\*{0,2}(Notes to Table[^:*\n]+):?\*{0,2}\s*$'
+    content = re.sub(pattern1, r'\n<h5 class="table-notes-title">\1:</h5>', content, flags=re.MULTILINE)
+
+    # Pattern 2: 마크다운 헤딩 없이 "Notes to Table X.X.X.X.:" 로 시작
+    pattern2 = r'^(Notes to Table\s+\d+\.\d+\.\d+\.\d*\.?(?:-[A-Z])?):?\s*$'
+    content = re.sub(pattern2, r'<h5 class="table-notes-title">\1:</h5>', content, flags=re.MULTILINE)
+
+    return content
+
+
+def add_dash_to_notes_items(content: str) -> str:
+    """Notes 섹션 내의 (1), (2) 항목에 대시 추가
+
+    CLAUDE.md 규칙: "Notes 항목 = `- (1)` 형식 (대시 필수!)"
+    Notes 섹션 끝: 다음 [ARTICLE: / #### Table / 문자열 끝
+    """
+    def process_notes_section(m):
+        notes_content = re.sub(r'^(\s*)(?!- )\((\d+)\)', r'\1- (\2)', m.group(2), flags=re.MULTILINE)
+        return m.group(1) + notes_content
+
+    pattern = r'(<h5 class="table-notes-title">Notes to Table[^<]+</h5>\s*\n)(.*?)(?=\[ARTICLE:|#### Table|$)'
+    return re.sub(pattern, process_notes_section, content, flags=re.DOTALL)
+
+
+def process_clauses(content: str) -> str:
+    """Clause 형식 정리
+
+    - **(1)** Main clause... / "  - **(2)** ..." / "  - (a) ..." → (1) / (2) / (a)
+    주의: Notes to Table 섹션 내의 - (1)은 대시 유지! (CLAUDE.md)
+    """
+    # Notes 섹션을 임시 마커로 보호
+    notes_pattern = r'(<h5 class="table-notes-title">Notes to Table[^<]+</h5>.*?)(?=\[ARTICLE:|#### Table|\Z)'
+
+    def protect_notes(m):
+        return re.sub(r'^- \((\d+)\)', r'__NOTES_ITEM__(\1)', m.group(1), flags=re.MULTILINE)
+
+    content = re.sub(notes_pattern, protect_notes, content, flags=re.DOTALL)
+
+    # 일반 clause에서 대시 제거
+    # 소수점 clause (0.1), (1.1)을 (1)보다 먼저 처리해야 함 (OBC 2024)
+    content = re.sub(r'^\s*-\s*\*{0,2}\((\d+\.\d+)\)\*{0,2}', r'(\1)', content, flags=re.MULTILINE)
+    content = re.sub(r'^\s*-\s*\*{0,2}\((\d+)\)\*{0,2}', r'(\1)', content, flags=re.MULTILINE)
+    content = re.sub(r'^\s*-\s*\(([a-z])\)', r'(\1)', content, flags=re.MULTILINE)
+    content = re.sub(r'^\s*-\s*\(([ivx]+)\)', r'(\1)', content, flags=re.MULTILINE)
+    # 인라인 **(1)** -> (1)
+    content = re.sub(r'\*{2}\((\d+)\)\*{2}', r'(\1)', content)
+
+    # "- (See Note..." 대시 제거 (clause가 아님), "- . (See Note..." Marker 오류
+    content = re.sub(r'^- \(See Note', r'(See Note', content, flags=re.MULTILINE)
+    content = re.sub(r'^- \. \(See Note', r'(See Note', content, flags=re.MULTILINE)
+
+    # Notes 마커 복원 (대시 포함)
+    content = re.sub(r'__NOTES_ITEM__\((\d+)\)', r'- (\1)', content)
+
+    return content
+
+
+def convert_where_block_format(content: str) -> str:
+    """수식의 where 블록을 Part 8 형식으로 변환 (add-part.md 참조)
+
+        where:                          where,
+        Q is the flow rate...     →     - Q = the flow rate...
+    """
+    # 1. "where:" → "where,"
+    content = re.sub(r'^where\s*:\s*$', 'where,', content, flags=re.MULTILINE)
+
+    # 2. 변수 정의: 1-3 글자 변수명 (Q, Ss, PD, γ 등) + "is" 또는 "=" + 설명
+    def convert_variable_definitions(m):
+        converted_lines = []
+        for line in m.group(2).split('\n'):
+            stripped = line.strip()
+            if stripped.startswith('- ') or not stripped:
+                converted_lines.append(line)
+                continue
+            var_match = re.match(r'^([A-Za-zγ]{1,3})\s+(?:is|=)\s+(.+)$', stripped)
+            if var_match:
+                converted_lines.append(f'- {var_match.group(1)} = {var_match.group(2)}')
+            else:
+                converted_lines.append(line)
+        return m.group(1) + '\n' + '\n'.join(converted_lines)
+
+    # 종료 조건: 빈 줄 2개 연속, (1), (a), [ARTICLE:, #### Table
+    where_pattern = r'(where,)\n((?:(?!\n\n\n|\(\d+\)|\([a-z]\)|\[ARTICLE:|\#{4} Table).)*)'
+    return re.sub(where_pattern, convert_variable_definitions, content, flags=re.DOTALL)
+
+
+def remove_bold_italic(content: str) -> str:
+    """Bold/Italic 마크다운 제거"""
+    # **bold** -> bold
+    content = re.sub(r'\*{2}([^*]+)\*{2}', r'\1', content)
+    # *italic* -> italic (단, *(1)* 같은 clause는 유지)
+    content = re.sub(r'(?<!\*)\*([^*\n]+)\*(?!\*)', r'\1', content)
+    return content
+
+
+def transform_content(content: str, config: dict) -> str:
+    """Subsection content 후처리 (301880_full.md 형식)"""
+    prefix = re.escape(config['id'])
+    content = convert_article_markers(content, prefix)
+    content = convert_table_headings(content, prefix)
+    content = convert_notes_headings(content)
+    content = convert_tables_in_content(content)
+    content = process_clauses(content)
+    content = add_dash_to_notes_items(content)
+    content = convert_where_block_format(content)
+    content = remove_bold_italic(content)
+    return clean_text(content, **config['clean'])
+
+
+# ============================================================
+# 단일 패스 변환 (transform_content와 같은 결과)
+# ============================================================
+# transform_content는 Subsection마다 re.sub 20여 번 (일부 DOTALL)으로 전체 문자열을 다시 훑음
+# → 여기서는 content를 줄로 한 번 나누고, 각 줄이 단계별 상태 기계를 차례로 지나가게 연결
+#    (단계 = transform_content의 변환 1개, 앞 단계가 줄을 넘기는 즉시 다음 단계가 처리)
+# 정규식의 \s*가 줄바꿈을 넘어가는 경우도 그대로 재현:
+#    빈 줄 흡수 (Bold Table 헤딩 앞, "- (1)" 앞, Notes 헤딩 / "where:" 뒤), 제목 없는 Table 헤딩 + 다음 줄
+# 재현하지 않는 드문 입력 (공백만 있는 줄, 제목 없는 Article 헤딩, 닫히지 않은 ** 등)은
+# transform_content로 처리 → 결과는 항상 같음 (_experiments/test_marker_fused.py)
+# clean_text는 그대로 마지막에 1번 (줄 단위 변환이 아니라 전체 문자열 정리)
+
+class _Fallback(Exception):
+    """단일 패스로 재현하지 않는 입력"""
+
+
+NOTES_H5 = re.compile(r'<h5 class="table-notes-title">Notes to Table[^<]+</h5>')
+TABLE_SEPARATOR = re.compile(r'^\|?[\s\-:]+\|')
+CLAUSE_DASH = (
+    re.compile(r'\s*-\s*\*{0,2}\((\d+\.\d+)\)\*{0,2}'),
+    re.compile(r'\s*-\s*\*{0,2}\((\d+)\)\*{0,2}'),
+    re.compile(r'\s*-\s*\(([a-z])\)'),
+    re.compile(r'\s*-\s*\(([ivx]+)\)'),
+)
+NOTES_ITEM = re.compile(r'- \(\d+\)')
+NOTES_NUMBER = re.compile(r'(\s*)\(\d+\)')
+WHERE_COLON = re.compile(r'where\s*:\s*')
+WHERE_BARE = re.compile(r'where\s*')
+WHERE_STOP = re.compile(r'\(\d+\)|\([a-z]\)|\[ARTICLE:|#{4} Table')
+WHERE_VARIABLE = re.compile(r'^([A-Za-zγ]{1,3})\s+(?:is|=)\s+(.+)$')
+BOLD = re.compile(r'\*{2}([^*]+)\*{2}')
+ITALIC = re.compile(r'(?<!\*)\*([^*\n]+)\*(?!\*)')
+INLINE_CLAUSE = re.compile(r'\*{2}\((\d+)\)\*{2}')
+
+# 입력 전체에서 1번 검사: 정규식이 줄을 넘어 매칭될 수 있는 모양 → transform_content
+# ("\n"으로 시작하는 패턴 → 리터럴 검색으로 빠르게 건너뜀, 입력 앞뒤에 "\n"을 붙여서 검사)
+_FUSED_HAZARD = (
+    r'[^\S\n]+'                          # 공백만 있는 줄 (\s*가 빈 줄과 다르게 넘어감)
+    r'|#{1,5}[^\S\n]*'                   # 제목 없는 "#" 헤딩
+    r'|[^\S\n]*-[^\S\n]*'                # 대시만 있는 줄
+    r'|Notes to Table[^\S\n]*'
+)
+FUSED_HAZARD_TEXT = ('__NOTES_ITEM__', '<h5 class="table-notes-title">')
+_fused_hazards = {}
+
+
+def _fused_hazard(prefix: str):
+    if prefix not in _fused_hazards:
+        _fused_hazards[prefix] = re.compile(
+            r'\n(?:' + _FUSED_HAZARD +
+            rf'|#{{1,4}}[^\S\n]*{prefix}\.\d+\.\d+[A-Z]?\.\d+[A-Z]?\.[^\S\n]*'   # 제목 없는 Article 헤딩
+            rf'|#{{0,4}}[^\S\n]*\*\*Table {prefix}\.\d+\.\d+\.\d+[^*\n]*'       # 줄 안에서 닫히지 않는 Bold Table
+            r')(?=\n)')
+    return _fused_hazards[prefix]
+
+
+# 치환 문자열 (r'\1') 대신 함수 → 매칭마다 템플릿 해석을 건너뜀
+def _group1(m):
+    return m.group(1)
+
+
+def _unbold(m):
+    return m.group(0)[2:-2]
+
+
+def _where_line(line: str) -> str:
+    """where 블록의 한 줄: "Q is the ..." → "- Q = the ..." """
+    stripped = line.strip()
+    if not stripped or stripped.startswith('- '):
+        return line
+    m = WHERE_VARIABLE.match(stripped)
+    return f'- {m.group(1)} = {m.group(2)}' if m else line
+
+
+def _stage_articles(emit, prefix):
+    """convert_article_markers"""
+    pattern = re.compile(rf'#{{1,4}}\s*({prefix}\.\d+\.\d+[A-Z]?\.\d+[A-Z]?)\.\s*(.+)')
+
+    def feed(line):
+        if line[:1] == '#':
+            m = pattern.match(line)
+            if m:
+                emit('')
+                emit(_article_marker(m.group(1), m.group(2)))
+                return
+        emit(line)
+    return feed, lambda: None
+
+
+def _stage_bold_tables(emit, prefix):
+    """convert_table_headings Pattern 1: 앞 빈 줄 흡수 (# 없는 경우), 제목 뒤가 비면 다음 줄을 이어 붙임"""
+    pattern = re.compile(rf'(#{{0,4}})\s*\*\*(Table {prefix}\.\d+\.\d+\.\d+\.?(?:-[A-Z])?[^*]*)\*\*(.*)')
+    blanks = 0
+    waiting = None
+
+    def feed(line):
+        nonlocal blanks, waiting
+        if waiting is not None:
+            if line:
+                emit(f'#### {waiting} {line.strip()}')
+                waiting = None
+            return
+        if not line:
+            blanks += 1
+            return
+        m = pattern.match(line) if '**Table' in line else None
+        if m and not m.group(1):
+            blanks = 0
+        while blanks:
+            emit('')
+            blanks -= 1
+        if not m:
+            emit(line)
+            return
+        table_part = re.sub(r'\s+', ' ', m.group(2).strip())
+        rest = m.group(3).strip()
+        if rest:
+            emit(f'#### {table_part} {rest}')
+        else:
+            waiting = table_part
+
+    def finish():
+        nonlocal blanks
+        if waiting is not None:
+            emit(f'#### {waiting}')
+        while blanks:
+            emit('')
+            blanks -= 1
+    return feed, finish
+
+
+def _stage_heading_tables(emit, prefix):
+    """convert_table_headings Pattern 2: ### Table X.X.X.X. Title (제목이 없으면 다음 줄)"""
+    pattern = re.compile(rf'#{{1,4}}\s*(Table {prefix}\.\d+\.\d+\.\d+\.?(?:-[A-Z])?)\s*(.*)')
+    waiting = None
+
+    def feed(line):
+        nonlocal waiting
+        if waiting is not None:
+            if line:
+                emit(f'#### {waiting} {line.strip()}')
+                waiting = None
+            return
+        if line[:1] == '#':
+            m = pattern.match(line)
+            if m:
+                rest = m.group(2).strip()
+                if rest:
+                    emit(f'#### {m.group(1)} {rest}')
+                else:
+                    waiting = m.group(1)
+                return
+        emit(line)
+
+    def finish():
+        if waiting is not None:
+            emit(f'#### {waiting}')
+    return feed, finish
+
+
+def _stage_split_tables(emit, prefix):
+    """convert_table_headings Pattern 3: "Table X.X.X.X." / 빈 줄 / 제목 / "Forming Part of..." → 한 줄"""
+    pattern = re.compile(rf'(Table {prefix}\.\d+\.\d+\.\d+\.?(?:-[A-Z])?)\s*')
+    held = []
+
+    def feed(line):
+        if not held:
+            if line[:6] == 'Table ' and pattern.fullmatch(line):
+                held.append(line)
+            else:
+                emit(line)
+            return
+        held.append(line)
+        if len(held) == 2:
+            if line:                             # 바로 다음 줄이 빈 줄이 아님
+                fail()
+            return
+        title_at = next((i for i in range(2, len(held)) if held[i]), None)
+        if title_at is None or title_at == len(held) - 1:
+            return                               # 제목 / Forming 줄을 기다림
+        forming = held[title_at + 1]
+        if forming.startswith('Forming Part of') and len(forming) > len('Forming Part of'):
+            emit(f'#### {pattern.fullmatch(held[0]).group(1)} {held[title_at]} {forming}')
+            held.clear()
+        else:
+            fail()
+
+    def fail():
+        # 첫 줄만 내보내고 나머지는 다시 검사 (정규식이 다음 줄에서 다시 시작하는 것과 같음)
+        emit(held[0])
+        rest = held[1:]
+        held.clear()
+        for line in rest:
+            feed(line)
+
+    def finish():
+        while held:
+            fail()
+    return feed, finish
+
+
+def _stage_notes_headings(emit):
+    """convert_notes_headings Pattern 1 (# 헤딩), 뒤 빈 줄 흡수"""
+    pattern = re.compile(r'#{1,5}\s*\*{0,2}(Notes to Table[^:*\n]+):?\*{0,2}\s*')
+    absorbing = False
+
+    def feed(line):
+        nonlocal absorbing
+        if absorbing:
+            if not line:
+                return
+            absorbing = False
+        if line[:1] == '#' and 'Notes to Table' in line:
+            m = pattern.fullmatch(line)
+            if m:
+                emit('')
+                emit(f'<h5 class="table-notes-title">{m.group(1)}:</h5>')
+                absorbing = True
+                return
+        emit(line)
+    return feed, lambda: None
+
+
+def _stage_plain_notes_headings(emit):
+    """convert_notes_headings Pattern 2 ("Notes to Table X.X.X.X.:"), 뒤 빈 줄 흡수"""
+    pattern = re.compile(r'(Notes to Table\s+\d+\.\d+\.\d+\.\d*\.?(?:-[A-Z])?):?\s*')
+    absorbing = False
+
+    def feed(line):
+        nonlocal absorbing
+        if absorbing:
+            if not line:
+                return
+            absorbing = False
+        if line[:14] == 'Notes to Table':
+            m = pattern.fullmatch(line)
+            if m:
+                emit(f'<h5 class="table-notes-title">{m.group(1)}:</h5>')
+                absorbing = True
+                return
+        emit(line)
+    return feed, lambda: None
+
+
+def _stage_tables(emit):
+    """convert_tables_in_content"""
+    table = []
+
+    def flush():
+        if len(table) >= 2:
+            emit(parse_markdown_table('\n'.join(table)))
+        else:
+            for line in table:
+                emit(line)
+        table.clear()
+
+    def feed(line):
+        if table:
+            stripped = line.strip()
+            if stripped.startswith('|') or TABLE_SEPARATOR.match(stripped):
+                table.append(line)
+                return
+            flush()
+        if '|' in line and line.strip().startswith('|') and '|' in line[1:]:
+            table.append(line)
+            return
+        emit(line)
+
+    def finish():
+        if table:
+            flush()
+    return feed, finish
+
+
+def _stage_clauses(emit):
+    """process_clauses: Notes 항목 보호, "- (1)" 대시 제거 (앞 빈 줄 흡수), **(1)**, "- (See Note" """
+    in_notes = False
+    blanks = 0
+
+    def feed(line):
+        nonlocal in_notes, blanks
+        if not line:
+            blanks += 1
+            return
+        protected = in_notes and NOTES_ITEM.match(line)
+        if line[:3] == '<h5' and NOTES_H5.match(line):
+            in_notes = True
+        if in_notes and ('[ARTICLE:' in line or '#### Table' in line):
+            in_notes = False
+
+        m = None
+        if not protected and '-' in line[:line.find('(') + 1]:
+            for pattern in CLAUSE_DASH:
+                m = pattern.match(line)
+                if m:
+                    line = f'({m.group(1)})' + line[m.end():]
+                    blanks = 0
+                    break
+        while blanks:
+            emit('')
+            blanks -= 1
+        if '**(' in line:
+            line = INLINE_CLAUSE.sub(_unbold, line)
+        if line[:2] == '- ':
+            if line.startswith('- (See Note'):
+                line = line[2:]
+            elif line.startswith('- . (See Note'):
+                line = line[4:]
+        emit(line)
+
+    def finish():
+        nonlocal blanks
+        while blanks:
+            emit('')
+            blanks -= 1
+    return feed, finish
+
+
+def _stage_notes_items(emit):
+    """add_dash_to_notes_items: Notes 헤딩 뒤 (1) → - (1) (다음 [ARTICLE: / #### Table 전까지)"""
+    in_notes = False
+
+    def feed(line):
+        nonlocal in_notes
+        if in_notes and '(' in line:
+            m = NOTES_NUMBER.match(line)
+            if m:
+                at = len(m.group(1))
+                line = f'{line[:at]}- {line[at:]}'
+        if in_notes and ('[ARTICLE:' in line or '#### Table' in line):
+            in_notes = False
+        m = NOTES_H5.match(line) if line[:3] == '<h5' else None
+        if m and not line[m.end():].strip():
+            in_notes = True
+        emit(line)
+    return feed, lambda: None
+
+
+def _stage_where_colon(emit):
+    """convert_where_block_format 1: "where:" → "where," (뒤 빈 줄 흡수)"""
+    absorbing = False
+    bare = False
+
+    def feed(line):
+        nonlocal absorbing, bare
+        if absorbing:
+            if not line:
+                return
+            absorbing = False
+        if bare and line:
+            if line.lstrip().startswith(':'):   # "where" / ":" 로 나뉜 줄
+                raise _Fallback
+            bare = False
+        if line[:5] == 'where':
+            if WHERE_COLON.fullmatch(line):
+                emit('where,')
+                absorbing = True
+                return
+            bare = bool(WHERE_BARE.fullmatch(line))
+        emit(line)
+    return feed, lambda: None
+
+
+def _stage_where_blocks(emit):
+    """convert_where_block_format 2: "where," 뒤 변수 정의 → "- Q = ..."
+
+    블록 끝: 빈 줄 2개 연속 ("\\n\\n\\n"), (1), (a), [ARTICLE:, #### Table (줄 중간이어도)
+    """
+    held = []
+    in_block = False
+
+    def trigger(line, start=0):
+        nonlocal in_block
+        emit(line)
+        if line.endswith('where,') and len(line) - 6 >= start:
+            in_block = True
+
+    def end_block(tail):
+        nonlocal in_block
+        in_block = False
+        rest = held[1:]
+        held.clear()
+        tail()
+        for line in rest:
+            feed(line)
+
+    def advance(final=False):
+        while held:
+            line = held[0]
+            m = WHERE_STOP.search(line)
+            if m:
+                head = _where_line(line[:m.start()])
+                return end_block(lambda: trigger(head + line[m.start():], len(head)))
+            if not any(held[1:3]):                         # 뒤 2줄 중 내용 있는 줄이 없음
+                if len(held) > 3:
+                    return end_block(lambda: emit(_where_line(line)))   # 빈 줄 2개 + 다음 줄 → 블록 끝
+                if not final:
+                    return                                 # 다음 줄을 봐야 앎
+            emit(_where_line(held.pop(0)))
+
+    def feed(line):
+        if in_block:
+            held.append(line)
+            advance()
+        else:
+            trigger(line)
+
+    def finish():
+        advance(final=True)
+    return feed, finish
+
+
+def _stage_bold_italic(emit):
+    """remove_bold_italic (Bold가 줄을 넘어가면 _Fallback)"""
+    def feed(line):
+        if '*' in line:
+            line = BOLD.sub(_group1, line)
+            if '**' in line:
+                raise _Fallback
+            line = ITALIC.sub(_group1, line)
+        emit(line)
+    return feed, lambda: None
+
+
+def transform_content_fused(content: str, config: dict) -> str:
+    """Subsection content 후처리 (301880_full.md 형식) - transform_content와 같은 결과, 줄 단위 1회 스캔"""
+    prefix = re.escape(config['id'])
+    if _fused_hazard(prefix).search(f'\n{content}\n') or any(text in content for text in FUSED_HAZARD_TEXT):
+        return transform_content(content, config)
+
+    stages = (
+        lambda emit: _stage_articles(emit, prefix),
+        lambda emit: _stage_bold_tables(emit, prefix),
+        lambda emit: _stage_heading_tables(emit, prefix),
+        lambda emit: _stage_split_tables(emit, prefix),
+        _stage_notes_headings,
+        _stage_plain_notes_headings,
+        _stage_tables,
+        _stage_clauses,
+        _stage_notes_items,
+        _stage_where_colon,
+        _stage_where_blocks,
+        _stage_bold_italic,
+    )
+    # 마지막 단계부터 연결 → feed = 첫 단계, 마지막 단계는 out에 추가
+    out = []
+    feed = out.append
+    finishes = []
+    for make in reversed(stages):
+        feed, finish = make(feed)
+        finishes.insert(0, finish)
+
+    try:
+        for line in content.split('\n'):
+            feed(line)
+        for finish in finishes:        # 앞 단계가 남긴 줄을 뒤 단계로 먼저 넘김
+            finish()
+    except _Fallback:
+        return transform_content(content, config)
+    return clean_text('\n'.join(out), **config['clean'])
+
+
+# ============================================================
+# part8.md 형식 (Part 8)
+# ============================================================
+
+def convert_article_markers_legacy(content: str, prefix: str) -> str:
+    """### 8.1.1.1. Scope → [ARTICLE:8.1.1.1:Scope] (Bold 유지, **(See Note...)** 제거)"""
+    def replace(m):
+        title = re.sub(r'\s*\*{0,2}\(See Note[^)]+\)\*{0,2}', '', m.group(2).strip())
+        return f'\n[ARTICLE:{m.group(1).rstrip(".")}:{title}]'
+
+    return re.sub(rf'^#{{1,4}}\s*({prefix}\.\d+\.\d+\.\d+\.)\s*(.+)$', replace, content, flags=re.MULTILINE)
+
+
+def convert_table_headings_legacy(content: str, prefix: str) -> str:
+    """### Table X.X.X.X.-X Title / **Table X.X.X.X. Title** → <h4 class="table-title">...</h4>"""
+    def replace(m):
+        rest = m.group(2).strip()
+        if rest:
+            return f'\n<h4 class="table-title">{m.group(1).strip()} {rest}</h4>'
+        return f'\n<h4 class="table-title">{m.group(1).strip()}</h4>'
+
+    pattern1 = rf'^#{{1,4}}\s*(Table {prefix}\.\d+\.\d+\.\d+\.(?:-[A-Z])?(?:\s*\(Cont\'d\))?)\s*(.*)$'
+    pattern2 = rf'^\*{{1,2}}(Table {prefix}\.\d+\.\d+\.\d+\.?(?:-[A-Z])?[^*]*)\*{{1,2}}\s*(.*)$'
+    content = re.sub(pattern1, replace, content, flags=re.MULTILINE)
+    return re.sub(pattern2, replace, content, flags=re.MULTILINE)
+
+
+def convert_notes_headings_legacy(content: str) -> str:
+    """#### Notes to Table X: → <h5 class="table-notes-title">Notes to Table X:</h5>"""
+    pattern = r'^#{1,5}\s*\*{0,2}(Notes to Table[^:*\n]+):?\*{0,2}\s*$'
+    return re.sub(pattern, lambda m: f'\n<h5 class="table-notes-title">{m.group(1).strip()}:</h5>',
+                  content, flags=re.MULTILINE)
+
+
+def process_clauses_legacy(content: str) -> str:
+    """- **(1)** / - (a) / - (i) → (1) / (a) / (i) (들여쓴 항목, Notes는 그대로)"""
+    content = re.sub(r'^-\s*\*{0,2}\((\d+)\)\*{0,2}', r'(\1)', content, flags=re.MULTILINE)
+    content = re.sub(r'^-\s*\(([a-z])\)', r'(\1)', content, flags=re.MULTILINE)
+    content = re.sub(r'^-\s*\(([ivx]+)\)', r'(\1)', content, flags=re.MULTILINE)
+    return re.sub(r'\*{2}\((\d+)\)\*{2}', r'(\1)', content)
+
+
+def transform_content_legacy(content: str, config: dict) -> str:
+    """Subsection content 후처리 (part8.md 형식)"""
+    prefix = re.escape(config['id'])
+    content = convert_article_markers_legacy(content, prefix)
+    content = convert_table_headings_legacy(content, prefix)
+    content = convert_notes_headings_legacy(content)
+    content = convert_tables_in_content(content)
+    content = process_clauses_legacy(content)
+    return clean_text(content, **config['clean'])
+
+
+# ============================================================
+# Part 설정
+# ============================================================
+
+PART_CONFIGS = {
+    '6': {
+        'id': '6',
+        'title': 'Heating, Ventilating and Air-Conditioning',
+        'sections': PART6_SECTION_TITLES,
+        'subsections': PART6_SUBSECTION_TITLES,
+        'output': DATA_DIR / 'part6.json',
+        'sample': '6.1.1',
+        # 목차 건너뛰기: 첫 매칭부터 본문
+        'body_start': (r'^# (?:<span[^>]*>)?Section 6\.1\.',),
+        'clean': {'file_links': True, 'revisions': 'er'},
+        'alt_subsections': True,     # 6.X.XA
+        'heading_titles': True,      # 매핑에 없으면 헤딩 제목 사용
+        'strip_title_tags': True,    # 헤딩 제목의 <...> 제거
+        'transform': transform_content_fused,
+    },
+    '7': {
+        'id': '7',
+        'title': 'Plumbing',
+        'sections': PART7_SECTION_TITLES,
+        'subsections': PART7_SUBSECTION_TITLES,
+        'output': DATA_DIR / 'part7.json',
+        'sample': '7.1.1',
+        'body_start': (r'^# Section 7\.1\.',),
+        'clean': {'revisions': 'r'},
+        'alt_subsections': True,     # 7.X.XA/B
+        'heading_titles': True,
+        'strip_title_tags': False,
+        'transform': transform_content_fused,
+    },
+    '8': {
+        'id': '8',
+        'title': 'Sewage Systems',
+        'sections': PART8_SECTION_TITLES,
+        'subsections': PART8_SUBSECTION_TITLES,
+        'output': DATA_DIR / 'part8.json',
+        'source': ROOT / 'data' / 'marker' / 'part8.md',  # output의 원본 (301880_full.md 구간 아님)
+        'sample': '8.2.1',
+        'body_start': (r'# <span id="page-680-0"></span>Section 8\.1\.', r'Section 8\.1\.'),
+        'clean': {'superscript': False, 'revisions': ''},
+        'alt_subsections': False,
+        'heading_titles': False,     # 제목은 매핑에서만
+        'strip_title_tags': False,
+        'transform': transform_content_legacy,
+    },
+}
+
+# 301880_full.md에서 output을 만드는 Part (source가 따로 있는 Part는 제외)
+FULL_MARKER_PARTS = [p for p, config in PART_CONFIGS.items() if 'source' not in config]
+
+
+# ============================================================
+# Part 경계 / 구조 파싱
+# ============================================================
+
+def index_parts(full_content: str) -> Dict[str, Tuple[int, int]]:
+    """전체 Marker 출력 → {part_id: (start, end)} (1번 스캔)
+
+    Part N = 첫 "# Part N" ~ 그 뒤 첫 "# Part N+1" 전까지
+    ("# Part N"이 없으면 첫 "# Section N.1."부터)
+    """
+    headings = {}
+    for m in PART_HEADING.finditer(full_content):
+        headings.setdefault(m.group(1), []).append((m.start(), m.end()))
+
+    bounds = {}
+    for part_id in PART_CONFIGS:
+        if part_id in headings:
+            start, after = headings[part_id][0]
+        else:
+            m = re.search(rf'^# Section {re.escape(part_id)}\.1\.', full_content, re.MULTILINE)
+            if not m:
+                continue
+            start, after = m.start(), m.end()
+        following = headings.get(str(int(part_id) + 1), [])
+        i = bisect.bisect_left(following, (after, after))
+        bounds[part_id] = (start, following[i][0] if i < len(following) else len(full_content))
+    return bounds
+
+
+def _heading_re(config: dict) -> re.Pattern:
+    """Section / Subsection 헤딩 (버퍼 전체에 finditer - 줄 단위 match와 같도록 \s 대신 [^\S\n])
+
+    Section 헤딩: # Section 7.1. General
+    Subsection 헤딩: # 7.1.1. Application / # 7.1.1A. Definitions
+    """
+    prefix = re.escape(config['id'])
+    suffix = '[A-Z]?' if config['alt_subsections'] else ''
+    # Article (7.x.x.x)이 매칭되지 않도록 (?!\d) 사용
+    return re.compile(
+        rf'^#{{1,4}}[^\S\n]*(?:Section[^\S\n]*(?P<section>{prefix}\.\d+)\.'
+        rf'|(?P<subsection>{prefix}\.\d+\.\d+{suffix})\.(?!\d))[^\S\n]*(?P<title>.*)$',
+        re.MULTILINE)
+
+
+def iter_subsections(content: str, config: dict) -> Iterator[Tuple[dict, dict, int, int]]:
+    """목차를 건너뛴 Part 본문 → (section, subsection, start, end) 스트리밍
+
+    - 줄 목록을 만들지 않고 헤딩만 finditer로 찾음 → Subsection 본문 = subsection_content(content, start, end)
+      (헤딩 다음 줄부터 다음 헤딩 줄 앞까지, 각 줄 끝 '\n' 포함)
+    - Section 시작마다 (section, None, 헤딩 줄 start, end) 1번 → Subsection이 없는 Section도 JSON에 남음
+      이후 Subsection 레코드는 같은 section dict ('subsections'는 호출하는 쪽에서 채움)
+    - 첫 Subsection 전 / Section 헤딩과 Subsection 헤딩 사이의 줄은 버림
+    """
+    section_titles = config['sections']
+    subsection_titles = config['subsections']
+    section = None
+    subsection = None
+    start = 0
+
+    for m in _heading_re(config).finditer(content):
+        if subsection:
+            yield section, subsection, start, m.start()
+            subsection = None
+
+        title = ''
+        if m.group('section'):
+            section_id = m.group('section')
+            if config['heading_titles']:
+                title = m.group('title').strip()
+                if config['strip_title_tags']:
+                    title = re.sub(r'<[^>]+>', '', title)
+            section = {'id': section_id, 'title': section_titles.get(section_id, title), 'subsections': []}
+            yield section, None, m.start(), m.end()
+            continue
+
+        subsection_id = m.group('subsection')
+        if config['heading_titles']:
+            # Bold/마커 제거
+            title = m.group('title').strip()
+            title = re.sub(r'\*{1,2}', '', title)
+            title = re.sub(r'\s*[er]\d+$', '', title)
+            if config['strip_title_tags']:
+                title = re.sub(r'<[^>]+>', '', title)
+
+        # Section이 없으면 생성 (7.1.1A -> 7.1)
+        if not section:
+            section_id = '.'.join(subsection_id.split('.')[:2])
+            section = {'id': section_id, 'title': section_titles.get(section_id, ''), 'subsections': []}
+            yield section, None, m.start(), m.start()
+
+        subsection = {'id': subsection_id, 'title': subsection_titles.get(subsection_id, title)}
+        start = m.end() + 1
+
+    if subsection:
+        yield section, subsection, start, len(content)
+
+
+def subsection_content(content: str, start: int, end: int) -> str:
+    """iter_subsections 구간 → Subsection 본문 (슬라이스 1번, 마지막 구간은 끝 줄바꿈 보충)"""
+    if start > len(content):       # 헤딩이 마지막 줄 (뒤에 줄바꿈 없음)
+        return ''
+    if end >= len(content):
+        return content[start:] + '\n'
+    return content[start:end]
+
+
+def split_sections(content: str, config: dict, transform=None) -> List[dict]:
+    """목차를 건너뛴 Part 본문 → [{'id', 'title', 'subsections': [{'id', 'title', 'content'}]}]
+
+    transform: Subsection 본문마다 바로 적용 (변환 전 본문을 모아 두지 않음)
+    """
+    sections = []
+    for section, subsection, start, end in iter_subsections(content, config):
+        if subsection is None:
+            sections.append(section)
+            continue
+        text = subsection_content(content, start, end)
+        subsection['content'] = transform(text, config) if transform else text
+        section['subsections'].append(subsection)
+    return sections
+
+
+def convert_part(content: str, part_id: str) -> dict:
+    """Part 구간 (또는 part8.md 전체) → Part JSON"""
+    config = PART_CONFIGS[part_id]
+
+    # 목차 부분 제거 (첫 번째 Section X.1. 시작 전까지)
+    for pattern in config['body_start']:
+        m = re.search(pattern, content, re.MULTILINE)
+        if m:
+            content = content[m.start():]
+            break
+
+    sections = split_sections(clean_text(content, **config['clean']), config, config['transform'])
+
+    return {
+        'id': config['id'],
+        'title': config['title'],
+        'sections': sections
+    }
+
+
+def _convert_worker(job: Tuple[str, str]) -> Tuple[str, dict, float]:
+    part_id, content = job
+    t0 = time.perf_counter()
+    return part_id, convert_part(content, part_id), time.perf_counter() - t0
+
+
+def extract_part(full_content: str, part_id: str) -> str:
+    """전체 Marker 출력에서 Part 하나만 추출"""
+    bounds = index_parts(full_content)
+    if part_id not in bounds:
+        raise ValueError(f"Part {part_id} not found in Marker output")
+    return full_content[slice(*bounds[part_id])]
+
+
+def convert_parts(full_content: str, part_ids: List[str] = None, workers: int = None) -> Dict[str, Tuple[dict, float]]:
+    """전체 Marker 출력 → {part_id: (Part JSON, 변환 초)}
+
+    part_ids: 기본 FULL_MARKER_PARTS
+    workers: 1이면 현재 프로세스에서 차례로 (기본: min(Part 수, CPU 수))
+    """
+    bounds = index_parts(full_content)
+    part_ids = part_ids or FULL_MARKER_PARTS
+    missing = [p for p in part_ids if p not in bounds]
+    if missing:
+        raise ValueError(f"Part {', '.join(missing)} not found in Marker output")
+
+    # Part 구간 복사본은 필요할 때 1개씩 (순차 실행이면 한 번에 Part 1개만 메모리에)
+    jobs = ((p, full_content[slice(*bounds[p])]) for p in part_ids)
+    workers = workers or min(len(part_ids), os.cpu_count() or 1)
+    if workers <= 1:
+        results = map(_convert_worker, jobs)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_convert_worker, jobs))
+    return {part_id: (data, seconds) for part_id, data, seconds in results}
+
+
+def read_marker(path: Path = MARKER_PATH) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def part_stats(data: dict) -> dict:
+    """{'sections', 'subsections', 'articles', 'tables'}"""
+    contents = [sub['content'] for sec in data['sections'] for sub in sec['subsections']]
+    table_heading = f"#### Table {data['id']}."
+    return {
+        'sections': len(data['sections']),
+        'subsections': len(contents),
+        'articles': sum(c.count('[ARTICLE:') for c in contents),
+        'tables': sum(c.count('<table class="obc-table">') + c.count(table_heading) for c in contents),
+    }
+
+
+def write_part(data: dict, path: Path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def run_part(data: dict, out_path: Path, limit: int = 1000):
+    """Part 하나 저장 + 통계 / 샘플 출력 (parse_marker_partN.py 단독 실행용)"""
+    s = part_stats(data)
+    print(f"Sections: {s['sections']}")
+    print(f"Subsections: {s['subsections']}")
+    print(f"Articles: {s['articles']}")
+    print(f"Tables: {s['tables']}")
+
+    write_part(data, out_path)
+    print(f"\n저장됨: {out_path}")
+
+    sample = PART_CONFIGS[data['id']]['sample']
+    print(f"\n=== 샘플 ({sample} 처음 {limit}자) ===")
+    for section in data['sections']:
+        for subsection in section['subsections']:
+            if subsection['id'] == sample:
+                print(subsection['content'][:limit])
+                return
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Marker 301880_full.md → Part JSON (1회 읽기, Part별 병렬)')
+    parser.add_argument('parts', nargs='*', help=f"Part 번호 ({', '.join(PART_CONFIGS)}, 기본: {', '.join(FULL_MARKER_PARTS)})")
+    parser.add_argument('--marker', type=Path, default=MARKER_PATH, help=f'Marker 출력 (기본: {MARKER_PATH})')
+    parser.add_argument('--out-dir', type=Path, default=None, help=f'출력 폴더 (기본: {DATA_DIR})')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (1 = 순차)')
+    args = parser.parse_args()
+
+    unknown = [p for p in args.parts if p not in PART_CONFIGS]
+    if unknown:
+        print(f"[ERROR] no config for Part {', '.join(unknown)} (PART_CONFIGS: {', '.join(PART_CONFIGS)})")
+        sys.exit(1)
+    separate = [p for p in args.parts if 'source' in PART_CONFIGS[p]]
+    if separate and not args.out_dir:
+        for p in separate:
+            print(f"[ERROR] {PART_CONFIGS[p]['output'].name} is built from {PART_CONFIGS[p]['source'].name} "
+                  f"(parse_marker_part{p}.py); use --out-dir to convert Part {p} from {args.marker.name}")
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    full_content = read_marker(args.marker)
+    read_seconds = time.perf_counter() - t0
+
+    try:
+        results = convert_parts(full_content, args.parts, args.workers)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    print(f"Marker: {args.marker} ({len(full_content) / 1024:.0f} KB, read {read_seconds:.2f}s)")
+    for part_id, (data, seconds) in results.items():
+        out_path = (args.out_dir / f'part{part_id}.json') if args.out_dir else PART_CONFIGS[part_id]['output']
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        write_part(data, out_path)
+        s = part_stats(data)
+        print(f"[OK] Part {part_id}: {s['sections']} sections, {s['subsections']} subsections, "
+              f"{s['articles']} articles, {s['tables']} tables ({seconds:.2f}s) → {out_path}")
+    print(f"total {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+플래그된 노드만 Marker 재실행 → 301880_full.md에 페이지 단위로 끼워넣기 → 해당 Part JSON / DB만 다시 반영
+- 노드 ID (validate_part.py / auto_screen.py 출력 또는 직접 입력) → 301880_full.md에서 헤딩 위치 → PDF 페이지
+    노드 구간 = 노드 헤딩 ~ 자손이 아닌 다음 헤딩 (헤딩이 없는 ID는 가장 가까운 조상으로)
+- 페이지 ↔ 문자 위치: 301880_full.pages.json (marker_chunks.py 병합 결과)
+    없으면 Marker 페이지 앵커 (<span id="page-N-k">)로 구간을 나눔 (앵커 없는 페이지는 앞 페이지에 포함)
+- 겹치거나 붙은 페이지 구간은 합쳐서 marker_single 1번, 구간끼리는 병렬 (marker_chunks 워커 슬롯 / 청크 캐시)
+    --marker-option으로 옵션을 바꾸면 (예: --force_ocr) 캐시 키도 달라짐
+- 해당 페이지 구간만 교체 (.pages.json도 갱신) → 바뀐 구간이 걸친 Part만 marker_engine으로 다시 변환
+  → import_part_json (content hash diff, 바뀐 행만, prune: 새 JSON에서 사라진 노드는 삭제하고 [-]로 출력)
+- Part 8은 대상 아님: part8.json은 별도 Marker 실행인 data/marker/part8.md에서 만듦 (parse_marker_part8.py)
+  → 301880_full.md 구간으로 다시 만들지 않음 (교체 구간이 Part 8에 걸쳐도 Part 8은 다시 변환하지 않음)
+- Part 9-12 (PyMuPDF 경로)는 대상 아님 → parse_part9.py --pages
+
+사용법:
+    python marker_repair.py 7.2.5.1 7.2.10.6            # 노드 ID
+    python marker_repair.py --from suspicious.txt        # validate_part.py / auto_screen.py 출력 파일
+    python marker_repair.py 6.2.1 --dry-run             # 노드 → 페이지 구간만 출력
+    python marker_repair.py 7.2.10.6 --marker-option --force_ocr
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from marker_chunks import (PDF_PATH, CHUNK_DIR, TOTAL_PAGES, MARKER_OPTIONS, THREADS_PER_WORKER, RETRIES,
+                           find_marker, chunk_path, load_manifest, run_chunks, split_pages, join_pages,
+                           write_merged, pages_index_path)
+from marker_engine import MARKER_PATH, PART_CONFIGS, index_parts, convert_parts, read_marker, write_part
+from import_part_json import DB_PATH, import_part_json
+from page_cache import pdf_fingerprint
+from parse_marker_part8 import MARKER_PATH as PART8_MARKER_PATH
+
+# 301880_full.md가 아닌 별도 Marker 출력에서 JSON을 만드는 Part → 고치지도, 다시 변환하지도 않음
+SEPARATE_PARTS = {'8': f"{PART8_MARKER_PATH.name} (parse_marker_part8.py)"}
+
+# validate_part.py "   [7.2.5.1] msg" / auto_screen.py "9.10.1.1" 줄 → 노드 ID (Clause 등 뒷부분은 버림)
+NODE_ID_LINE = re.compile(r'^\s*\[?(\d+(?:\.\d+)+[A-Z]?)')
+
+# 노드 헤딩: "## 7.2.5.1. Title", "# <span id=...></span>Section 8.1.", "#6.1.1A.Title", "**8.2.1.1. Title**"
+HEADING = re.compile(r'^(?:#{1,6}[^\S\n]*|\*\*)(?:<span[^>]*>[^\S\n]*</span>[^\S\n]*)*(?:\*\*)?'
+                     r'(?:Section[^\S\n]*)?(\d+(?:\.\d+)+[A-Z]?)\.(?!\d)', re.MULTILINE)
+PAGE_ANCHOR = re.compile(r'<span id="page-(\d+)-\d+">')
+
+# (first_page, last_page, start, end): 301880_full.md의 [start, end)가 PDF 페이지 first~last
+Segment = Tuple[int, int, int, int]
+
+
+def read_node_ids(path: Path) -> List[str]:
+    """validate_part.py / auto_screen.py 출력 (또는 한 줄에 ID 1개) → 노드 ID 목록 (순서 유지, 중복 제거)"""
+    ids = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            m = NODE_ID_LINE.match(line)
+            if m and m.group(1) not in ids:
+                ids.append(m.group(1))
+    return ids
+
+
+def load_segments(full_content: str, marker_path: Path, pdf_hash: str) -> Tuple[List[Segment], Optional[dict]]:
+    """301880_full.md → (페이지 구간 목록, .pages.json 내용 또는 None)
+
+    .pages.json이 있고 현재 파일 길이와 맞으면 페이지 1개씩, 아니면 페이지 앵커 기준
+    """
+    index_path = pages_index_path(marker_path)
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index['pdf_sha256'] != pdf_hash:
+            raise ValueError(f"{index_path.name} was built from a different PDF ({index['pdf_sha256'][:16]})")
+        spans = sorted((int(page), start, end) for page, (start, end) in index['pages'].items())
+        if spans and spans[-1][2] == len(full_content):
+            return [(page, page, start, end) for page, start, end in spans], index
+        print(f"[WARN] {index_path.name} does not match {marker_path.name}, using page anchors")
+
+    anchors = []
+    for m in PAGE_ANCHOR.finditer(full_content):
+        page = int(m.group(1))
+        if not anchors or page > anchors[-1][0]:
+            anchors.append((page, full_content.rfind('\n', 0, m.start()) + 1))
+    if not anchors:
+        raise ValueError(f"no {pages_index_path(marker_path).name} and no page anchors in {marker_path.name}")
+    # 첫 앵커 앞 텍스트는 0페이지부터, 마지막 앵커 뒤는 PDF 끝까지
+    if anchors[0][0] == 0:
+        anchors[0] = (0, 0)
+    else:
+        anchors.insert(0, (0, 0))
+    bounds = anchors + [(TOTAL_PAGES, len(full_content))]
+    return [(page, bounds[i + 1][0] - 1, start, bounds[i + 1][1]) for i, (page, start) in enumerate(anchors)], None
+
+
+def node_headings(full_content: str) -> Dict[str, List[Tuple[int, str]]]:
+    """{part_id: [(offset, node_id), ...]} (PART_CONFIGS의 Part, 목차 뒤 본문만)"""
+    headings = {}
+    for part_id, (start, end) in index_parts(full_content).items():
+        if part_id not in PART_CONFIGS:
+            continue
+        content = full_content[start:end]
+        for pattern in PART_CONFIGS[part_id]['body_start']:
+            m = re.search(pattern, content, re.MULTILINE)
+            if m:
+                start += m.start()
+                break
+        prefix = f'{part_id}.'
+        headings[part_id] = [(m.start(), m.group(1)) for m in HEADING.finditer(full_content, start, end)
+                             if m.group(1).startswith(prefix)]
+        headings[part_id].append((end, ''))
+    return headings
+
+
+def node_span(headings: List[Tuple[int, str]], node_id: str) -> Optional[Tuple[str, int, int]]:
+    """노드 ID → (찾은 ID, start, end): 노드 헤딩 ~ 자손이 아닌 다음 헤딩 (없으면 조상 ID로)"""
+    while node_id.count('.') >= 1:
+        for i, (offset, heading_id) in enumerate(headings):
+            if heading_id == node_id:
+                for end, next_id in headings[i + 1:]:
+                    if next_id != node_id and not next_id.startswith(node_id + '.'):
+                        return node_id, offset, end
+        node_id = node_id.rsplit('.', 1)[0]
+    return None
+
+
+def segment_range(starts: List[int], start: int, end: int) -> Tuple[int, int]:
+    """문자 구간 [start, end) → 덮는 segment 인덱스 (i, j) (starts: segment 시작 위치, 오름차순)"""
+    i = bisect.bisect_right(starts, start) - 1
+    j = bisect.bisect_right(starts, max(start, end - 1)) - 1
+    return max(i, 0), max(j, 0)
+
+
+def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """segment 인덱스 구간 중 겹치거나 붙은 것은 합침"""
+    merged = []
+    for i, j in sorted(ranges):
+        if merged and i <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], j))
+        else:
+            merged.append((i, j))
+    return merged
+
+
+def splice(full_content: str, segments: List[Segment], index: Optional[dict],
+           replacements: List[Tuple[int, int, str]]) -> Tuple[str, Optional[dict]]:
+    """segment 구간 (i, j)를 재실행 결과 Markdown으로 교체 → (새 301880_full.md, 새 .pages.json 또는 None)"""
+    if index is not None:
+        # 페이지 1개씩: 교체 구간의 페이지는 비우고 새 페이지로 → marker_chunks 병합과 같은 형식으로 다시 이어붙임
+        pages = {segment[0]: full_content[segment[2]:segment[3]] for segment in segments}
+        for i, j, markdown in replacements:
+            first, last = segments[i][0], segments[j][1]
+            pages.update({page: '' for page in range(first, last + 1)})
+            pages.update(split_pages(markdown, first, last))
+        text, spans = join_pages(list(pages.items()))
+        return text, dict(index, pages=spans)
+
+    # 앵커 기준: segment는 첫 페이지 앵커 줄부터 → 새 출력도 같은 앵커 줄부터 (앞부분은 앞 segment에 이미 있음)
+    pieces = []
+    offset = 0
+    for i, j, markdown in sorted(replacements):
+        first, last = segments[i][0], segments[j][1]
+        text = join_pages(split_pages(markdown, first, last))[0]
+        anchor = re.search(rf'<span id="page-{first}-\d+">', text) if segments[i][2] > 0 else None
+        if anchor:
+            text = text[text.rfind('\n', 0, anchor.start()) + 1:]
+        pieces += [full_content[offset:segments[i][2]], text]
+        offset = segments[j][3]
+    pieces.append(full_content[offset:])
+    return ''.join(pieces), None
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='플래그된 노드의 PDF 페이지만 Marker 재실행 → 301880_full.md / Part JSON / DB 갱신')
+    parser.add_argument('nodes', nargs='*', help='노드 ID (예: 7.2.5.1)')
+    parser.add_argument('--from', dest='from_file', type=Path, default=None,
+                        help='validate_part.py / auto_screen.py 출력 파일 (줄 앞의 노드 ID)')
+    parser.add_argument('--pdf', type=Path, default=PDF_PATH)
+    parser.add_argument('--marker', type=Path, default=MARKER_PATH, help=f'Marker 출력 (기본: {MARKER_PATH})')
+    parser.add_argument('--cache-dir', type=Path, default=CHUNK_DIR)
+    parser.add_argument('--marker-exe', default=None, help='marker_single (기본: MARKER_SINGLE 또는 PATH)')
+    parser.add_argument('--marker-option', action='append', default=[], metavar='OPT',
+                        help='marker_single 추가 옵션 (반복 가능, 예: --marker-option=--force_ocr)')
+    parser.add_argument('--workers', type=int, default=None, help=f'동시 실행 슬롯 (기본: 코어 수 / {THREADS_PER_WORKER})')
+    parser.add_argument('--retries', type=int, default=RETRIES)
+    parser.add_argument('--out-dir', type=Path, default=None, help='Part JSON 출력 폴더 (기본: PART_CONFIGS 경로)')
+    parser.add_argument('--db', default=DB_PATH, help=f'SQLite DB (기본: {DB_PATH})')
+    parser.add_argument('--no-import', action='store_true', help='Part JSON까지만 (DB 변경 없음)')
+    parser.add_argument('--dry-run', action='store_true', help='노드 → 페이지 구간만 출력')
+    args = parser.parse_args()
+
+    node_ids = list(dict.fromkeys(args.nodes + (read_node_ids(args.from_file) if args.from_file else [])))
+    if not node_ids:
+        parser.error('no node IDs (positional or --from)')
+    for path in (args.pdf, args.marker):
+        if not path.exists():
+            print(f"[ERROR] not found: {path}")
+            sys.exit(1)
+
+    t0 = time.perf_counter()
+    pdf_hash = pdf_fingerprint(args.pdf)
+    full_content = read_marker(args.marker)
+    try:
+        segments, index = load_segments(full_content, args.marker, pdf_hash)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    headings = node_headings(full_content)
+
+    # 노드 → 문자 구간 → 페이지 구간
+    starts = [segment[2] for segment in segments]
+    ranges = []
+    for node_id in node_ids:
+        part_id = node_id.split('.')[0]
+        if part_id in SEPARATE_PARTS:
+            print(f"[SKIP] {node_id}: Part {part_id} is built from {SEPARATE_PARTS[part_id]}, "
+                  f"not {args.marker.name}")
+            continue
+        found = node_span(headings[part_id], node_id) if part_id in headings else None
+        if found is None:
+            hint = ' (Part 9-12: parse_part9.py --pages)' if part_id not in PART_CONFIGS else ''
+            print(f"[SKIP] {node_id}: no heading in {args.marker.name}{hint}")
+            continue
+        found_id, start, end = found
+        i, j = segment_range(starts, start, end)
+        ranges.append((i, j))
+        via = '' if found_id == node_id else f" (via {found_id})"
+        print(f"  {node_id:16} → pages {segments[i][0]}-{segments[j][1]}{via}")
+    if not ranges:
+        print("[ERROR] no flagged node found in the Marker output")
+        sys.exit(1)
+
+    options = MARKER_OPTIONS + tuple(args.marker_option)
+    ranges = merge_ranges(ranges)
+    jobs = []
+    for i, j in ranges:
+        first, last = segments[i][0], segments[j][1]
+        path = chunk_path(args.cache_dir, pdf_hash, first, last, options)
+        cached = load_manifest(path) is not None
+        print(f"Re-Marker pages {first}-{last} ({last - first + 1} pages{', cached' if cached else ''})")
+        jobs.append({'first': first, 'last': last, 'path': path, 'cached': cached})
+    if args.dry_run:
+        return
+
+    todo = [job for job in jobs if not job['cached']]
+    if todo:
+        exe = find_marker(args.marker_exe)
+        if exe is None:
+            print("[ERROR] marker_single not found (--marker-exe, MARKER_SINGLE or PATH)")
+            sys.exit(1)
+        workers = max(1, min(args.workers or cpus // THREADS_PER_WORKER, len(todo)))
+        for job in todo:
+            job.update({'exe': exe, 'pdf': args.pdf, 'pdf_hash': pdf_hash, 'options': options,
+                        'threads': max(1, cpus // workers), 'timeout': None})
+        failed = run_chunks(todo, workers, args.retries)
+        if failed:
+            print(f"[ERROR] {len(failed)} page ranges failed, {args.marker.name} unchanged")
+            sys.exit(1)
+
+    # 301880_full.md 교체 (Part 경계는 교체 전 기준 → 교체 구간이 걸친 Part만 다시 변환)
+    replacements = []
+    for (i, j), job in zip(ranges, jobs):
+        manifest = load_manifest(job['path'])
+        replacements.append((i, j, (job['path'] / manifest['markdown']).read_text(encoding='utf-8')))
+    part_bounds = index_parts(full_content)
+    part_ids = [part_id for part_id, (start, end) in part_bounds.items()
+                if part_id in PART_CONFIGS and part_id not in SEPARATE_PARTS
+                and any(start < segments[j][3] and segments[i][2] < end for i, j in ranges)]
+    new_content, new_index = splice(full_content, segments, index, replacements)
+    if new_index is not None:
+        new_index['repairs'] = index.get('repairs', []) + [[job['first'], job['last'], job['path'].name]
+                                                           for job in jobs]
+    if new_content == full_content:
+        print(f"[OK] {args.marker.name} unchanged (re-Marker output identical)")
+        return
+    write_merged(args.marker, new_content, new_index)
+    print(f"[OK] {args.marker} ({len(full_content) / 1024:.0f} KB → {len(new_content) / 1024:.0f} KB)")
+
+    try:
+        results = convert_parts(new_content, part_ids, workers=1)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    for part_id, (data, seconds) in results.items():
+        out_path = (args.out_dir / f'part{part_id}.json') if args.out_dir else PART_CONFIGS[part_id]['output']
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        write_part(data, out_path)
+        print(f"[OK] Part {part_id} ({seconds:.2f}s) → {out_path}")
+        if args.no_import:
+            continue
+        # 다시 변환한 JSON에서 사라진 Section/Subsection/Article은 삭제 (import_part_json이 [-]로 출력)
+        stats = import_part_json(str(out_path), args.db, prune=True)
+        if 'generation' in stats:
+            print(f"     check: python validate_part.py {args.db} --db --part {part_id} --since {stats['generation'] - 1}")
+    print(f"total {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,9 @@ import json
 import sqlite3
 import os
 
+from db_utils import number_tree
+import fts_index
+
 # 경로 설정
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 JSON_PATH = os.path.join(BASE_DIR, 'codevault', 'public', 'data', 'part9.json')
@@ -99,6 +102,7 @@ def migrate():
                 ''', (art_id, art_type, sub_id, art_title, art_content, art_page, art_seq))
                 article_count += 1
 
+    number_tree(conn.cursor(), 9)
     conn.commit()
 
     # 7. 결과 출력
@@ -113,9 +117,9 @@ def migrate():
     for row in cursor:
         print(f'  {row[0]:16}: {row[1]}')
 
-    # FTS 검증
-    cursor = conn.execute('SELECT COUNT(*) FROM search_index')
-    print(f'\nFTS5 index entries: {cursor.fetchone()[0]}')
+    # FTS 검증 (external content: COUNT(*)는 nodes 행 수라서 색인을 nodes와 직접 비교)
+    if fts_index.check(conn):
+        print(f'\n[OK] search_index matches nodes')
 
     conn.close()
     print(f'\nDB saved: {DB_PATH}')
@@ -1,16 +1,29 @@
 """
 Tables JSON → SQLite 마이그레이션 스크립트
-part9_tables.json → obc.db tables 테이블
+part9_tables.json (+ 다른 Part의 테이블 JSON) → obc.db tables 테이블
+
+- nodes ID 집합을 한 번 읽어 parent를 메모리에서 결정 (테이블마다 SELECT 하지 않음)
+- 전체 테이블을 executemany 1회로 INSERT
+- parent를 못 찾은 테이블은 parent_id NULL로 넣고 마지막에 한꺼번에 보고
+- generation을 하나 열어 query.NodeStore 캐시가 이전 테이블을 돌려주지 않게 함
+
+사용법:
+    python migrate_tables.py
+    python migrate_tables.py part9_tables.json part8_tables_hybrid.json
 """
 
+import argparse
 import json
 import sqlite3
 import os
 import re
 
+from db_utils import ensure_change_log, begin_generation, end_generation
+
 # 경로 설정
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-TABLES_JSON = os.path.join(BASE_DIR, 'codevault', 'public', 'data', 'part9_tables.json')
+DATA_DIR = os.path.join(BASE_DIR, 'codevault', 'public', 'data')
+TABLES_JSON = os.path.join(DATA_DIR, 'part9_tables.json')
 DB_PATH = os.path.join(BASE_DIR, 'data', 'obc.db')
 
 
@@ -34,78 +47,94 @@ def get_parent_id(table_id: str) -> str:
     return None
 
 
-def migrate_tables():
-    # 1. JSON 로드
-    print(f'Loading {TABLES_JSON}...')
-    with open(TABLES_JSON, 'r', encoding='utf-8') as f:
+def resolve_parent(parent_id: str, node_ids: set) -> str:
+    """nodes에 있는 parent 결정 (Article → 없으면 Subsection), 못 찾으면 None
+
+    9.5.3.1 → 9.5.3.1 / 9.5.3 (subsection)
+    """
+    if not parent_id:
+        return None
+    if parent_id in node_ids:
+        return parent_id
+    parts = parent_id.split('.')
+    if len(parts) >= 3:
+        subsection_id = '.'.join(parts[:3])
+        if subsection_id in node_ids:
+            return subsection_id
+    return None
+
+
+def load_tables(json_path: str) -> dict:
+    """테이블 JSON 로드 → {table_id: (title, page, html, source)}
+
+    두 가지 형식 지원:
+      part9_tables.json          : {"Table 9.5.3.1": {"title", "page", "html", "source"}, ...}
+      hybrid_table_parser 출력   : {"part": 8, "tables": [{"id", "title", "html", "extraction_method"}, ...]}
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
-    print(f'Total tables in JSON: {len(data)}')
+    if isinstance(data.get('tables'), list):
+        return {
+            t['id']: (t.get('title', t['id']), t.get('page'), t.get('html', ''),
+                      t.get('extraction_method', 'unknown'))
+            for t in data['tables']
+        }
+
+    return {
+        table_id: (t.get('title', table_id), t.get('page'), t.get('html', ''),
+                   t.get('source', 'unknown'))
+        for table_id, t in data.items()
+    }
+
+
+def migrate_tables(json_paths: list = None):
+    # 1. JSON 로드 (같은 테이블 ID는 뒤 파일이 우선)
+    tables = {}
+    for json_path in json_paths or [TABLES_JSON]:
+        print(f'Loading {json_path}...')
+        loaded = load_tables(json_path)
+        print(f'  {len(loaded)} tables')
+        tables.update(loaded)
 
-    # 2. DB 연결
+    print(f'Total tables in JSON: {len(tables)}')
+
+    # 2. DB 연결 + nodes ID 집합 1회 로드
     conn = sqlite3.connect(DB_PATH)
     conn.execute('PRAGMA foreign_keys = ON')
+    ensure_change_log(conn)
+    node_ids = {row[0] for row in conn.execute('SELECT id FROM nodes')}
+    print(f'Loaded {len(node_ids)} node ids')
 
-    # 3. 기존 테이블 데이터 삭제
-    conn.execute('DELETE FROM tables')
-    print('Cleared existing tables data')
-
-    # 4. 테이블 삽입
-    inserted = 0
-    skipped = 0
+    # 3. parent 결정 (메모리)
+    rows = []
     no_parent = []
-
-    for table_id, table_data in data.items():
-        parent_id = get_parent_id(table_id)
-
-        # parent_id가 nodes에 존재하는지 확인
-        cursor = conn.execute('SELECT id FROM nodes WHERE id = ?', (parent_id,))
-        parent_exists = cursor.fetchone() is not None
-
-        # parent가 없으면 subsection 레벨로 시도
-        if not parent_exists and parent_id:
-            # 9.5.3.1 → 9.5.3 (subsection)
-            parts = parent_id.split('.')
-            if len(parts) >= 3:
-                subsection_id = '.'.join(parts[:3])
-                cursor = conn.execute('SELECT id FROM nodes WHERE id = ?', (subsection_id,))
-                if cursor.fetchone():
-                    parent_id = subsection_id
-                    parent_exists = True
-
-        title = table_data.get('title', table_id)
-        page = table_data.get('page')
-        html = table_data.get('html', '')
-        source = table_data.get('source', 'unknown')
-
-        try:
-            conn.execute('''
-                INSERT INTO tables (id, title, parent_id, page, html, source)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (table_id, title, parent_id, page, html, source))
-            inserted += 1
-        except sqlite3.IntegrityError as e:
-            # FK 제약 실패 시 parent_id를 NULL로
-            conn.execute('''
-                INSERT INTO tables (id, title, parent_id, page, html, source)
-                VALUES (?, ?, NULL, ?, ?, ?)
-            ''', (table_id, title, page, html, source))
-            no_parent.append((table_id, parent_id))
-            inserted += 1
-
-    conn.commit()
+    for table_id, (title, page, html, source) in tables.items():
+        article_id = get_parent_id(table_id)
+        parent_id = resolve_parent(article_id, node_ids)
+        if parent_id is None:
+            no_parent.append((table_id, article_id))
+        rows.append((table_id, title, parent_id, page, html, source))
+
+    # 4. 기존 테이블 데이터 교체 (한 트랜잭션)
+    with conn:
+        generation = begin_generation(conn.cursor(), 'migrate_tables')
+        conn.execute('DELETE FROM tables')
+        print('Cleared existing tables data')
+        conn.executemany('''
+            INSERT INTO tables (id, title, parent_id, page, html, source)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', rows)
+        end_generation(conn.cursor(), generation)
 
     # 5. 결과 출력
     print(f'\n=== Migration Complete ===')
-    print(f'Inserted: {inserted}')
-    print(f'Skipped:  {skipped}')
+    print(f'Inserted: {len(rows)} (generation {generation})')
 
     if no_parent:
         print(f'\n=== Tables without parent node ({len(no_parent)}) ===')
-        for tid, pid in no_parent[:10]:
+        for tid, pid in sorted(no_parent):
             print(f'  {tid} → {pid} (not found)')
-        if len(no_parent) > 10:
-            print(f'  ... and {len(no_parent) - 10} more')
 
     # 6. 검증
     print(f'\n=== Verification ===')
@@ -125,4 +154,10 @@ def migrate_tables():
 
 
 if __name__ == '__main__':
-    migrate_tables()
+    parser = argparse.ArgumentParser(description='Tables JSON → obc.db tables')
+    parser.add_argument('json_files', nargs='*',
+                        help=f'테이블 JSON 파일 (이름만 주면 {DATA_DIR} 기준, 기본: part9_tables.json)')
+    args = parser.parse_args()
+
+    paths = [p if os.path.exists(p) else os.path.join(DATA_DIR, p) for p in args.json_files]
+    migrate_tables(paths or None)
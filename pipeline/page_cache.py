@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+PDF 페이지 텍스트 디스크 캐시
+- 키: (PDF 해시, 페이지 인덱스, 추출 모드, cleaner 버전)
+- (PDF 해시, 모드, 버전)마다 세그먼트 1개:
+    <hash16>_<mode>_v<ver>.dat : UTF-8 텍스트를 이어붙인 데이터 파일 (mmap으로 읽음)
+    <hash16>_<mode>_v<ver>.idx : 고정 길이 레코드 (page_idx, offset, length) 오프셋 인덱스
+    <hash16>_<mode>_v<ver>.json: 세그먼트 메타데이터 (추출 설정 등, 예: geometry 모드의 header/footer 띠)
+- 첫 추출 이후에는 파일 open 없이 mmap 슬라이스만으로 페이지 텍스트 반환
+
+사용법:
+    python page_cache.py stats
+    python page_cache.py invalidate                      # 전체 삭제
+    python page_cache.py invalidate --pdf <pdf> --mode raw
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+CACHE_DIR = Path(__file__).parent.parent / "data" / "page_cache"
+FINGERPRINTS_FILE = "fingerprints.json"
+
+# 인덱스 레코드: page_idx (uint32), offset (uint64), length (uint32)
+INDEX_RECORD = struct.Struct('<IQI')
+
+
+def pdf_fingerprint(pdf_path: Path, cache_dir: Path = CACHE_DIR) -> str:
+    """PDF 파일의 SHA-256 해시
+
+    (경로, 크기, mtime)이 같으면 fingerprints.json에 기록된 값을 재사용
+    → 매 실행마다 PDF 전체를 다시 해싱하지 않음
+    """
+    pdf_path = Path(pdf_path).resolve()
+    stat = pdf_path.stat()
+    stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    fp_path = cache_dir / FINGERPRINTS_FILE
+    known = {}
+    if fp_path.exists():
+        with open(fp_path, 'r', encoding='utf-8') as f:
+            known = json.load(f)
+
+    entry = known.get(str(pdf_path))
+    if entry and entry.get('stamp') == stamp:
+        return entry['sha256']
+
+    h = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    digest = h.hexdigest()
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    known[str(pdf_path)] = {'stamp': stamp, 'sha256': digest}
+    with open(fp_path, 'w', encoding='utf-8') as f:
+        json.dump(known, f, indent=2)
+
+    return digest
+
+
+class PageTextCache:
+    """(PDF, 모드, cleaner 버전) 단위 페이지 텍스트 캐시
+
+    쓰기는 한 프로세스에서만 (append 전용). 병렬 추출 시에는
+    부모 프로세스가 워커 결과를 받아 put() 한다.
+    """
+
+    def __init__(self, pdf_path: Path, mode: str, version: int = 0,
+                 cache_dir: Path = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
+        self.version = version
+        self.pdf_hash = pdf_fingerprint(pdf_path, self.cache_dir)
+
+        stem = f"{self.pdf_hash[:16]}_{mode}_v{version}"
+        self.data_path = self.cache_dir / f"{stem}.dat"
+        self.index_path = self.cache_dir / f"{stem}.idx"
+        self.meta_path = self.cache_dir / f"{stem}.json"
+
+        self.index: Dict[int, Tuple[int, int]] = {}
+        self._mm: Optional[mmap.mmap] = None
+        self._data_file = None
+        self._mapped_size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        self._load_index()
+
+    def _load_index(self):
+        """오프셋 인덱스 로드 (같은 페이지가 여러 번 있으면 마지막 값 사용)"""
+        if not self.index_path.exists() or not self.data_path.exists():
+            return
+        data_size = self.data_path.stat().st_size
+        raw = self.index_path.read_bytes()
+        usable = len(raw) - len(raw) % INDEX_RECORD.size  # 잘린 마지막 레코드 무시
+        for page_idx, offset, length in INDEX_RECORD.iter_unpack(raw[:usable]):
+            if offset + length <= data_size:  # 데이터 쓰기 전에 중단된 레코드 무시
+                self.index[page_idx] = (offset, length)
+
+    def _remap(self):
+        """데이터 파일을 (다시) mmap"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._data_file is None:
+            self._data_file = open(self.data_path, 'rb')
+        size = os.fstat(self._data_file.fileno()).st_size
+        if size:
+            self._mm = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped_size = size
+
+    def get(self, page_idx: int) -> Optional[str]:
+        """캐시된 페이지 텍스트 (없으면 None)"""
+        entry = self.index.get(page_idx)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        offset, length = entry
+        if offset + length > self._mapped_size:
+            self._remap()
+        self.hits += 1
+        return self._mm[offset:offset + length].decode('utf-8') if length else ''
+
+    def put(self, page_idx: int, text: str):
+        """페이지 텍스트 추가 (데이터 먼저, 인덱스 나중 → 중단돼도 인덱스가 깨지지 않음)"""
+        encoded = text.encode('utf-8')
+        with open(self.data_path, 'ab') as f:
+            offset = f.tell()
+            f.write(encoded)
+        with open(self.index_path, 'ab') as f:
+            f.write(INDEX_RECORD.pack(page_idx, offset, len(encoded)))
+        self.index[page_idx] = (offset, len(encoded))
+
+    def get_or_extract(self, page_idx: int, extract: Callable[[int], str]) -> str:
+        """캐시 조회 후 없으면 extract(page_idx) 결과를 저장하고 반환"""
+        text = self.get(page_idx)
+        if text is None:
+            text = extract(page_idx)
+            self.put(page_idx, text)
+        return text
+
+    def get_meta(self, key: str):
+        """세그먼트 메타데이터 값 (없으면 None)"""
+        if not self.meta_path.exists():
+            return None
+        with open(self.meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get(key)
+
+    def put_meta(self, key: str, value):
+        """세그먼트 메타데이터 저장 (임시 파일 → replace, 중단돼도 이전 값 유지)"""
+        meta = {}
+        if self.meta_path.exists():
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        meta[key] = value
+        tmp_path = self.meta_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, self.meta_path)
+
+    def __contains__(self, page_idx: int) -> bool:
+        return page_idx in self.index
+
+    def report(self, label: str = ''):
+        """캐시 hit/miss 출력"""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        prefix = f"{label} " if label else ''
+        print(f"  {prefix}page cache [{self.mode} v{self.version}]: "
+              f"{self.hits} hits, {self.misses} misses ({rate:.0f}% hit)")
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._data_file is not None:
+            self._data_file.close()
+            self._data_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def invalidate(pdf_path: Optional[Path] = None, mode: Optional[str] = None,
+               cache_dir: Path = CACHE_DIR) -> int:
+    """조건에 맞는 세그먼트 삭제 (pdf/mode 미지정 시 전체). 삭제한 파일 수 반환"""
+    if not cache_dir.exists():
+        return 0
+
+    prefix = pdf_fingerprint(pdf_path, cache_dir)[:16] if pdf_path else None
+    removed = 0
+    for path in cache_dir.iterdir():
+        if path.suffix not in ('.dat', '.idx', '.json') or path.name == FINGERPRINTS_FILE:
+            continue
+        seg_hash, _, rest = path.stem.partition('_')
+        seg_mode = rest.rsplit('_v', 1)[0]
+        if prefix and seg_hash != prefix:
+            continue
+        if mode and seg_mode != mode:
+            continue
+        path.unlink()
+        removed += 1
+    return removed
+
+
+def print_stats(cache_dir: Path = CACHE_DIR):
+    """세그먼트별 페이지 수 / 크기 출력"""
+    if not cache_dir.exists():
+        print(f"(empty) {cache_dir}")
+        return
+    print(f"Cache dir: {cache_dir}")
+    for idx_path in sorted(cache_dir.glob('*.idx')):
+        data_path = idx_path.with_suffix('.dat')
+        records = idx_path.stat().st_size // INDEX_RECORD.size
+        data_size = data_path.stat().st_size if data_path.exists() else 0
+        print(f"  {idx_path.stem:40} {records:6} pages  {data_size / 1024:10.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PDF 페이지 텍스트 캐시 관리')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('stats', help='세그먼트 목록 출력')
+
+    inv = sub.add_parser('invalidate', help='캐시 삭제')
+    inv.add_argument('--pdf', type=Path, help='이 PDF의 세그먼트만 삭제')
+    inv.add_argument('--mode', help='이 추출 모드의 세그먼트만 삭제')
+
+    args = parser.parse_args()
+
+    if args.command == 'stats':
+        print_stats()
+    elif args.command == 'invalidate':
+        removed = invalidate(args.pdf, args.mode)
+        print(f"[OK] Removed {removed} cache files from {CACHE_DIR}")
+
+
+if __name__ == '__main__':
+    main()
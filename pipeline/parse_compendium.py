@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+301880.pdf의 Part 8-12 구간 (PART_START_PAGES[8]부터 끝까지)을 한 번에 스트리밍 파싱 (Part별 TreeBuilder로 분배)
+- PDF open 1회 + 추출 패스 1회 (페이지 캐시 / 병렬 추출은 parse_part9와 공유)
+- PART_START_PAGES 표 (parse_part9과 공유, Part 9 = PART9_START..PART9_END)로 각 페이지를 Part에 배정
+  → Part별 TreeBuilder + 패턴으로 parse_page (regex 추출의 clean_text도 페이지의 Part 기준)
+- Part 9은 SECTIONS 목록으로 Section 노드를 미리 만들고,
+  나머지 Part는 "Section N.x." 헤더를 만나면 parse_page가 Section 노드를 만든다
+
+전체 컴펜디움이 아님: Part 6/7은 시작 페이지가 확인되지 않아 표에 없음 → 0-677쪽은 읽지 않고
+Part 6/7은 Marker 경로 (marker_engine.py) 전용. 시작 페이지를 확인하면 PART_START_PAGES / PART_TITLES에 추가
+
+사용법:
+    python parse_compendium.py                 # 파싱 + Part별 노드 수 출력 (DB 변경 없음)
+    python parse_compendium.py --parts 10 11   # 일부 Part만
+    python parse_compendium.py --save          # Part별로 DB 교체 저장
+"""
+
+import argparse
+import bisect
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from tree_builder import TreeBuilder
+from page_cache import PageTextCache
+from parse_part9 import (PDF_PATH, DB_PATH, EXTRACT_MODES, DEFAULT_EXTRACT_MODE, DEFAULT_WORKERS,
+                         PART_START_PAGES, SECTIONS, iter_page_texts, page_bands, parse_page, flush_pending_clause, save_to_db)
+
+COMPENDIUM_PAGES = 1260  # 301880.pdf 전체 페이지 수 (마지막 Part의 끝)
+
+# Part 제목 (Part 노드 title)
+PART_TITLES = {
+    8: 'Sewage Systems',
+    9: 'Housing and Small Buildings',
+    10: 'Change of Use',
+    11: 'Renovation',
+    12: 'Resource Conservation and Environmental Integrity',
+}
+
+# Section 노드를 미리 만드는 Part (나머지는 parse_page가 헤더에서 생성)
+PART_SECTIONS = {
+    9: SECTIONS,
+}
+
+
+def part_page_ranges(parts: List[int] = None, total_pages: int = COMPENDIUM_PAGES) -> List[Tuple[int, int, int]]:
+    """PART_START_PAGES → [(part, start, end), ...] (0-indexed, end 미포함, 페이지 순)
+
+    각 Part는 다음 Part 시작 페이지 직전까지 (마지막 Part는 total_pages까지)
+    """
+    starts = sorted(PART_START_PAGES.items(), key=lambda x: x[1])
+    ranges = []
+    for i, (part, start) in enumerate(starts):
+        end = starts[i + 1][1] if i + 1 < len(starts) else total_pages
+        if parts is None or part in parts:
+            ranges.append((part, start, end))
+    return ranges
+
+
+def iter_compendium_pages(pdf_path: Path, ranges: List[Tuple[int, int, int]], workers: int = 1,
+                          cache: PageTextCache = None,
+                          extract_mode: str = DEFAULT_EXTRACT_MODE) -> Iterator[Tuple[int, int, str]]:
+    """ranges 전체를 한 번의 추출 패스로 읽어 (part, page_idx, text)를 페이지 순서대로 yield
+
+    선택한 Part 사이의 빈 구간(선택 안 한 Part)은 추출 후 건너뜀
+    """
+    if not ranges:
+        return
+
+    starts = [start for _, start, _ in ranges]
+    first, last = ranges[0][1], ranges[-1][2]
+
+    for page_idx, text in iter_page_texts(pdf_path, first, last, workers, cache, extract_mode):
+        i = bisect.bisect_right(starts, page_idx) - 1
+        part, start, end = ranges[i]
+        if start <= page_idx < end:
+            yield part, page_idx, text
+
+
+def new_part_builder(part: int, start: int) -> TreeBuilder:
+    """Part 노드 (+ 알려진 Section 노드)가 들어 있는 TreeBuilder"""
+    builder = TreeBuilder(part_num=part)
+    builder.add_node('part', str(part), title=PART_TITLES.get(part), page=start + 1)
+    for sec_id, sec_title in PART_SECTIONS.get(part, []):
+        builder.add_node('section', sec_id, title=sec_title)
+    return builder
+
+
+def parse_compendium(pdf_path: Path, ranges: List[Tuple[int, int, int]], workers: int = 1,
+                     cache: PageTextCache = None,
+                     extract_mode: str = DEFAULT_EXTRACT_MODE) -> Dict[int, TreeBuilder]:
+    """전체 페이지를 한 번 스트리밍하며 Part별 트리 구축
+
+    Returns:
+        {part_num: TreeBuilder}
+    """
+    builders: Dict[int, TreeBuilder] = {}
+    states: Dict[int, dict] = {}
+    ends = {part: end for part, _, end in ranges}
+
+    for part, page_idx, text in iter_compendium_pages(pdf_path, ranges, workers, cache, extract_mode):
+        builder = builders.get(part)
+        if builder is None:
+            builder = builders[part] = new_part_builder(part, page_idx)
+            states[part] = None
+            print(f"  Part {part}: pages {page_idx + 1} - {ends[part]}")
+
+        if text:
+            states[part] = parse_page(builder, text, page_idx + 1, states[part])
+
+        # Part 마지막 페이지 → 남은 clause 저장
+        if page_idx + 1 == ends[part]:
+            flush_pending_clause(builder, states[part], ends[part])
+
+    return builders
+
+
+def main():
+    parser = argparse.ArgumentParser(description='301880.pdf Part 8-12 스트리밍 파싱 → Part별 트리')
+    parser.add_argument('--parts', type=int, nargs='+', choices=sorted(PART_START_PAGES),
+                        help='파싱할 Part (기본: PART_START_PAGES 전체)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'페이지 추출 워커 프로세스 수 (1 = 직렬, 기본 {DEFAULT_WORKERS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='페이지 텍스트 캐시를 사용하지 않음')
+    parser.add_argument('--extract-mode', choices=sorted(EXTRACT_MODES), default=DEFAULT_EXTRACT_MODE,
+                        help='header/footer 제거 방식: regex (clean_text) 또는 geometry (본문 clip)')
+    parser.add_argument('--save', action='store_true',
+                        help='Part별로 DB의 기존 노드를 교체 저장 (기본: 파싱 결과만 출력)')
+    args = parser.parse_args()
+
+    print("=== Compendium 스트리밍 파싱 시작 ===\n")
+
+    if not PDF_PATH.exists():
+        print(f"[ERROR] PDF not found: {PDF_PATH}")
+        return
+
+    ranges = part_page_ranges(args.parts)
+    cache = None if args.no_cache else PageTextCache(PDF_PATH, *EXTRACT_MODES[args.extract_mode])
+    if args.extract_mode == 'geometry':
+        try:
+            page_bands(PDF_PATH, cache)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            return
+
+    t0 = time.perf_counter()
+    builders = parse_compendium(PDF_PATH, ranges, args.workers, cache, args.extract_mode)
+    elapsed = time.perf_counter() - t0
+
+    total_pages = sum(end - start for _, start, end in ranges)
+    mode = 'serial' if args.workers <= 1 else f'parallel x{args.workers}'
+    print(f"  {total_pages} pages in {elapsed:.2f}s ({total_pages / elapsed:.1f} pages/s, "
+          f"{mode}, {args.extract_mode})")
+    if cache is not None:
+        cache.report()
+        cache.close()
+
+    # 결과 출력
+    print(f"\n=== 파싱 결과 ===")
+    for part, builder in builders.items():
+        type_counts = {}
+        for node in builder.nodes.values():
+            type_counts[node.type] = type_counts.get(node.type, 0) + 1
+        counts = ', '.join(f"{t} {c}" for t, c in sorted(type_counts.items(), key=lambda x: -x[1]))
+        print(f"Part {part}: {len(builder.nodes)} nodes ({counts})")
+
+    if args.save:
+        for part, builder in builders.items():
+            print(f"\nSaving Part {part}...")
+            save_to_db(builder, DB_PATH)
+
+    print("\n=== 완료 ===")
+
+
+if __name__ == '__main__':
+    main()
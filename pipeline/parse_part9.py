@@ -5,18 +5,62 @@ Part 9 전체 PDF를 파싱하여 SQLite DB에 저장
 - Alternative Subsection, Article Suffix, 0A Article, Sub-Article 처리
 """
 
+import argparse
 import fitz
+import os
+import pickle
 import sqlite3
 import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from tree_builder import TreeBuilder
-from patterns import detect_type
+from patterns import detect_type, detect_id_only, part_patterns
+from page_cache import PageTextCache
+from db_utils import (BULK_LOAD_PRAGMAS, suspend_triggers, resume_triggers, content_hash, with_content_hash,
+                      ensure_schema, begin_generation, end_generation, node_signatures, diff_signatures, log_changes,
+                      fts_delete, fts_insert, number_tree)
+from ref_graph import build_ref_graph
 
 # === 설정 ===
 PDF_PATH = Path(__file__).parent.parent / "source/2024 Building Code Compendium/301880.pdf"
 DB_PATH = Path(__file__).parent.parent / "data" / "obc.db"
-PART9_START = 710  # 0-indexed
-PART9_END = 1034
+
+# Part별 시작 페이지 (0-indexed) - parse_compendium과 페이지 → Part 배정을 함께 쓰는 유일한 표
+# 각 Part는 다음 Part 시작 페이지 직전까지 (Part 9 span 표 9.23.10.7.-C/-D, 9.23.12.3.-A~-D는 1028-1033쪽)
+PART_START_PAGES = {
+    8: 678,    # Part 8 starts at page 679
+    9: 710,    # Part 9 starts at page 711
+    10: 1034,  # Part 10
+    11: 1040,  # Part 11
+    12: 1098,  # Part 12
+}
+PART9_START = PART_START_PAGES[9]
+PART9_END = PART_START_PAGES[10]
+
+# 추출 모드 → 페이지 캐시 키 (mode, version)
+# 추출/정리 동작이 바뀌면 해당 모드의 버전을 올릴 것
+EXTRACT_MODES = {
+    'regex': ('sorted_blocks', 2),  # 전체 블록 추출 후 clean_text regex로 header/footer 제거 (v2: Part별 패턴)
+    'geometry': ('body_clip', 2),   # 학습한 header/footer 띠를 clip으로 제외하고 본문만 추출 (v2: Part 9 전체에서 학습, 캐시에 저장)
+}
+DEFAULT_EXTRACT_MODE = 'regex'
+
+# header/footer 띠 학습 설정 (geometry 모드)
+BAND_SCAN_FRAC = 0.12    # 페이지 위/아래 12% 안에 있는 블록만 후보
+BAND_MIN_SHARE = 0.4     # 샘플 페이지의 40% 이상에서 반복되면 running header/footer (짝/홀 페이지 차이 허용)
+BAND_SAMPLE_PAGES = 40   # 학습에 쓰는 샘플 페이지 수
+BAND_Y_BIN = 2.0         # 위치 비교 단위 (pt)
+
+# 체크포인트 (증분 재파싱용): CHECKPOINT_EVERY 페이지마다 페이지 경계 상태 저장
+CHECKPOINT_DIR = Path(__file__).parent.parent / "data" / "checkpoints" / "part9"
+CHECKPOINT_EVERY = 25
+
+# 병렬 추출 설정
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+PAGE_CHUNK_SIZE = 16  # 워커 1회 작업당 페이지 수 (작을수록 부하 분산, 클수록 IPC 감소)
 
 # Section 목록 (part9.json에서 가져옴)
 SECTIONS = [
@@ -64,9 +108,20 @@ SECTIONS = [
 ]
 
 
-def extract_text_sorted(page) -> str:
-    """페이지 텍스트를 좌표 순으로 정렬하여 추출"""
-    blocks = page.get_text("blocks")
+def extract_text_sorted(page, bands: tuple = None) -> str:
+    """페이지 텍스트를 좌표 순으로 정렬하여 추출
+
+    bands가 주어지면 (header_height, footer_height) 밖의 본문 영역만 clip으로 추출하고,
+    띠에 걸친 블록도 join 전에 버린다.
+    """
+    if bands:
+        clip = body_clip(page, bands)
+        blocks = [
+            b for b in page.get_text("blocks", clip=clip)
+            if clip.y0 <= (b[1] + b[3]) / 2 <= clip.y1  # 블록 중심이 본문 안에 있는 것만
+        ]
+    else:
+        blocks = page.get_text("blocks")
     sorted_blocks = sorted(blocks, key=lambda b: (b[1], b[0]))
 
     lines = []
@@ -79,15 +134,94 @@ def extract_text_sorted(page) -> str:
     return '\n'.join(lines)
 
 
-def clean_text(text: str) -> str:
-    """텍스트 정리"""
+def body_clip(page, bands: tuple):
+    """header/footer 띠를 뺀 본문 영역 Rect"""
+    header, footer = bands
+    r = page.rect
+    return fitz.Rect(r.x0, r.y0 + header, r.x1, r.y1 - footer)
+
+
+def _band_signature(text: str) -> str:
+    """running header/footer 비교용 텍스트 서명 (숫자는 #로 치환: 페이지 번호, running Article ID)"""
+    return re.sub(r'\d+', '#', text.strip())[:40]
+
+
+def learn_page_bands(doc, start: int, end: int, sample: int = BAND_SAMPLE_PAGES) -> tuple:
+    """running header/footer 띠 높이를 문서당 1회 학습
+
+    샘플 페이지의 위/아래 가장자리 근처 블록 중 같은 위치 + 같은 서명으로
+    여러 페이지에 반복되는 것을 header/footer로 본다.
+    (본문 첫 줄은 위치는 같아도 내용이 매번 달라서 제외됨)
+
+    Returns:
+        (header_height, footer_height)  # 페이지 위/아래 가장자리로부터의 거리 (pt)
+    """
+    step = max(1, (end - start) // sample)
+    sample_pages = range(start, end, step)
+
+    top_hits, bottom_hits = Counter(), Counter()
+    top_extent, bottom_extent = {}, {}
+
+    for page_idx in sample_pages:
+        page = doc[page_idx]
+        r = page.rect
+        scan = r.height * BAND_SCAN_FRAC
+        seen_top, seen_bottom = set(), set()
+
+        for x0, y0, x1, y1, text, _, block_type in page.get_text("blocks"):
+            if block_type != 0 or not text.strip():
+                continue
+            sig = _band_signature(text)
+            if y1 - r.y0 <= scan:
+                key = (round((y0 - r.y0) / BAND_Y_BIN), sig)
+                seen_top.add(key)
+                top_extent[key] = max(top_extent.get(key, 0.0), y1 - r.y0)
+            elif r.y1 - y0 <= scan:
+                key = (round((r.y1 - y1) / BAND_Y_BIN), sig)
+                seen_bottom.add(key)
+                bottom_extent[key] = max(bottom_extent.get(key, 0.0), r.y1 - y0)
+
+        top_hits.update(seen_top)
+        bottom_hits.update(seen_bottom)
+
+    min_count = max(2, len(sample_pages) * BAND_MIN_SHARE)
+    header = max((top_extent[k] for k, c in top_hits.items() if c >= min_count), default=0.0)
+    footer = max((bottom_extent[k] for k, c in bottom_hits.items() if c >= min_count), default=0.0)
+    return header, footer
+
+
+def part_of_page(page_idx: int):
+    """0-indexed 페이지 → PART_START_PAGES 기준 Part 번호 (첫 Part 이전이면 None)"""
+    part = None
+    for num, start in sorted(PART_START_PAGES.items(), key=lambda x: x[1]):
+        if page_idx < start:
+            break
+        part = num
+    return part
+
+
+def extract_page(page, bands: tuple = None) -> str:
+    """추출 모드별 페이지 텍스트
+
+    bands 없음 (regex 모드): 전체 블록 추출 + clean_text (페이지의 Part 기준)
+    bands 있음 (geometry 모드): 본문 clip 추출만, regex 정리 없음
+    """
+    if bands:
+        return extract_text_sorted(page, bands)
+    return clean_text(extract_text_sorted(page), part_of_page(page.number))
+
+
+def clean_text(text: str, part: int = None) -> str:
+    """텍스트 정리 (part: running header의 "Part N" / Article ID 번호, None이면 아무 Part)"""
+    num = str(part) if part is not None else r'\d+'
+
     # 페이지 번호 제거
     text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)
 
     # 헤더/푸터 제거 (더 정밀한 패턴 사용)
     text = re.sub(r'^\d{4}\s+Building Code.*$', '', text, flags=re.MULTILINE)  # "2024 Building Code Compendium"
     text = re.sub(r'^Division [ABC]\s*[-–?]\s*Part\s*\d+.*$', '', text, flags=re.MULTILINE)  # "Division B - Part 9" (- or – or ?)
-    text = re.sub(r'^Part 9\s*$', '', text, flags=re.MULTILINE)
+    text = re.sub(rf'^Part {num}\s*$', '', text, flags=re.MULTILINE)
     # Footer: "20 Division B ? Part 9" (페이지 번호 + Division)
     text = re.sub(r'^\d+\s+Division [ABC].*Part\s*\d+.*$', '', text, flags=re.MULTILINE)
 
@@ -102,8 +236,8 @@ def clean_text(text: str) -> str:
         before_div = text[:div_match.start()]
         after_div = text[div_match.end():]
 
-        # 헤더 Article ID 제거 (9.X.X.X. 형식으로 단독 줄에 있는 것만)
-        before_div = re.sub(r'^9\.\d+\.\d+\.\d+[A-Z]?\.\s*$', '', before_div, flags=re.MULTILINE)
+        # 헤더 Article ID 제거 (N.X.X.X. 형식으로 단독 줄에 있는 것만)
+        before_div = re.sub(rf'^{num}\.\d+\.\d+\.\d+[A-Z]?\.\s*$', '', before_div, flags=re.MULTILINE)
 
         text = before_div + after_div
     else:
@@ -116,45 +250,157 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
-def is_id_only(line: str) -> tuple:
-    """ID만 있는 줄인지 확인 (Title은 다음 줄에)"""
-    # Subsection ID: 9.5.3.
-    m = re.match(r'^(9\.\d+\.\d+)\.\s*$', line)
-    if m:
-        return ('subsection', m.group(1))
+# === 페이지 추출 (직렬 / 병렬) ===
+
+_worker_doc = None    # 워커 프로세스별 fitz 문서 (initializer에서 1회 open)
+_worker_bands = None  # 워커 프로세스별 header/footer 띠 (geometry 모드)
+
+
+def _init_worker(pdf_path: str, bands: tuple = None):
+    """워커 프로세스 초기화: 프로세스마다 자체 fitz 문서를 연다"""
+    global _worker_doc, _worker_bands
+    _worker_doc = fitz.open(pdf_path)
+    _worker_bands = bands
+
+
+def _extract_range(page_range: tuple) -> list:
+    """워커에서 페이지 범위 [start, end) 추출 + 정리
+
+    Returns:
+        [(page_idx, cleaned_text), ...] (페이지 순서)
+    """
+    start, end = page_range
+    return [
+        (page_idx, extract_page(_worker_doc[page_idx], _worker_bands))
+        for page_idx in range(start, end)
+    ]
+
+
+def split_page_ranges(pages: list, chunk_size: int = PAGE_CHUNK_SIZE) -> list:
+    """페이지 목록을 연속 구간별 (start, end) 범위로 분할 (구간당 최대 chunk_size 페이지)"""
+    ranges = []
+    for page_idx in pages:
+        if ranges and ranges[-1][1] == page_idx and ranges[-1][1] - ranges[-1][0] < chunk_size:
+            ranges[-1][1] = page_idx + 1
+        else:
+            ranges.append([page_idx, page_idx + 1])
+    return [tuple(r) for r in ranges]
+
+
+_learned_bands = {}  # (PDF 경로) → 이번 프로세스에서 학습한 띠 (--no-cache일 때 재학습 방지)
+
+
+def page_bands(pdf_path: Path, cache: PageTextCache = None) -> tuple:
+    """geometry 모드의 header/footer 띠
+
+    추출할 페이지 구간과 상관없이 Part 9 전체 범위 (PART9_START..PART9_END)에서 1회 학습하고
+    페이지 캐시 세그먼트 메타데이터에 저장 → 캐시된 페이지와 새로 추출하는 페이지가 항상 같은 띠
+    (--pages 같은 짧은 구간 재파싱도 같은 띠 사용)
+
+    Raises:
+        ValueError: 반복되는 header/footer를 찾지 못함 (띠가 둘 다 0 → clip도 regex 정리도 없이 추출됨)
+    """
+    stored = cache.get_meta('bands') if cache is not None else None
+    bands = stored or _learned_bands.get(str(pdf_path))
+    if bands is None:
+        doc = fitz.open(pdf_path)
+        try:
+            bands = learn_page_bands(doc, PART9_START, PART9_END)
+        finally:
+            doc.close()
+        if not any(bands):
+            raise ValueError(f"no running header/footer found on pages {PART9_START + 1}-{PART9_END} "
+                             f"(use --extract-mode regex)")
+        print(f"  Learned bands: header {bands[0]:.1f}pt, footer {bands[1]:.1f}pt")
+        _learned_bands[str(pdf_path)] = bands
+    if cache is not None and stored is None:
+        cache.put_meta('bands', list(bands))
+    return tuple(bands)
+
+
+def _iter_extracted(pdf_path: Path, pages: list, workers: int, bands: tuple = None):
+    """pages를 추출하여 (page_idx, cleaned_text)를 pages 순서대로 yield (bands: geometry 모드의 띠)"""
+    if not pages:
+        return
+
+    if workers <= 1:
+        doc = fitz.open(pdf_path)
+        try:
+            for page_idx in pages:
+                yield page_idx, extract_page(doc[page_idx], bands)
+        finally:
+            doc.close()
+        return
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(str(pdf_path), bands)) as pool:
+        # map()은 제출 순서대로 결과 반환 → 페이지 순서 보장
+        for chunk in pool.map(_extract_range, split_page_ranges(pages)):
+            yield from chunk
+
+
+def iter_page_texts(pdf_path: Path, start: int, end: int, workers: int = 1,
+                    cache: PageTextCache = None, extract_mode: str = DEFAULT_EXTRACT_MODE):
+    """페이지 텍스트를 페이지 순서대로 yield
+
+    workers <= 1 이면 한 문서로 직렬 추출,
+    그 외에는 워커 프로세스 풀이 페이지 범위를 나눠 추출하고
+    결과는 원래 페이지 순서대로 돌려준다 (parse_page는 순서 의존).
+    cache가 있으면 캐시된 페이지는 추출하지 않고, 새로 추출한 페이지는 저장한다.
+    (cache는 extract_mode와 같은 EXTRACT_MODES 키로 연 것이어야 함)
+    geometry 모드의 띠는 page_bands (추출할 페이지가 있을 때만, 캐시에 저장된 띠 우선)
+
+    Yields:
+        (page_idx, cleaned_text)  # page_idx는 0-indexed
+    """
+    pages = range(start, end)
+    missing = [p for p in pages if cache is None or p not in cache]
+    bands = page_bands(pdf_path, cache) if extract_mode == 'geometry' and missing else None
+    extracted = _iter_extracted(pdf_path, missing, workers, bands)
+
+    for page_idx in pages:
+        text = cache.get(page_idx) if cache is not None else None
+        if text is None:
+            _, text = next(extracted)
+            if cache is not None:
+                cache.put(page_idx, text)
+        yield page_idx, text
 
-    # Article ID: 9.5.3.1.
-    m = re.match(r'^(9\.\d+\.\d+\.\d+)\.\s*$', line)
-    if m:
-        return ('article', m.group(1))
 
-    # Alt Subsection ID: 9.5.3A.
-    m = re.match(r'^(9\.\d+\.\d+[A-Z])\.\s*$', line)
-    if m:
-        return ('alt_subsection', m.group(1))
+def benchmark_extraction(pdf_path: Path, start: int, end: int, workers: int,
+                         extract_mode: str = DEFAULT_EXTRACT_MODE):
+    """직렬 vs 병렬 추출 속도 비교 (pages/s)"""
+    total = end - start
+    for label, n in (('serial', 1), ('parallel', workers)):
+        t0 = time.perf_counter()
+        for _ in iter_page_texts(pdf_path, start, end, workers=n, extract_mode=extract_mode):
+            pass
+        elapsed = time.perf_counter() - t0
+        print(f"  {label:8} (workers={n:2}, {extract_mode}): {total} pages in {elapsed:.2f}s "
+              f"-> {total / elapsed:.1f} pages/s")
 
-    # Sub-Article ID: 9.5.3A.1.
-    m = re.match(r'^(9\.\d+\.\d+[A-Z]\.\d+)\.\s*$', line)
-    if m:
-        return ('sub_article', m.group(1))
 
-    # Article Suffix ID: 9.5.1.1A.
-    m = re.match(r'^(9\.\d+\.\d+\.\d+[A-Z])\.\s*$', line)
-    if m:
-        return ('article_suffix', m.group(1))
+# Article 타입들 (Clause content를 합치는 대상)
+ARTICLE_TYPES = ('article', 'article_suffix', 'article_0a', 'sub_article')
 
-    return None
+# parse_page 줄 단위 패턴 (미리 compile, Part별 패턴은 patterns.part_patterns)
+TABLE_NOTES_START = re.compile(r'^Notes? to Table')
 
 
 def parse_page(builder: TreeBuilder, text: str, page_num: int, state: dict = None):
     """한 페이지 파싱 (특수 패턴 포함)
 
+    구조 ID 패턴은 builder.part_num의 Part 기준 (Part 9 외 Part도 같은 로직)
+
     Args:
         state: 페이지 간 유지되는 상태 {'content': [], 'type': None, 'data': None}
     Returns:
         state: 다음 페이지로 전달할 상태
     """
     lines = text.split('\n')
+    part = builder.part_num
+    pp = part_patterns(part)
 
     # 이전 페이지에서 상태 복원
     if state:
@@ -175,13 +421,13 @@ def parse_page(builder: TreeBuilder, text: str, page_num: int, state: dict = Non
             continue
 
         # Table 노트 영역 감지 (Notes to Table X.X.X.X.:)
-        if re.match(r'^Notes? to Table', line):
+        if TABLE_NOTES_START.match(line):
             in_table_notes = True
             continue
 
         # Table 노트 영역 종료 (새로운 Subsection/Article ID 발견)
         if in_table_notes:
-            if re.match(r'^9\.\d+\.\d+\.?\s*$', line) or re.match(r'^9\.\d+\.\d+\.\d+\.?\s', line):
+            if pp.table_notes_end.match(line):
                 in_table_notes = False
             else:
                 # Table 노트 내 clause는 건너뛰기
@@ -193,7 +439,7 @@ def parse_page(builder: TreeBuilder, text: str, page_num: int, state: dict = Non
             continue
 
         # ID only 패턴 체크 (Title이 다음 줄에)
-        id_only = is_id_only(line)
+        id_only = detect_id_only(line, part)
         if id_only:
             node_type, node_id = id_only
             # 다음 줄이 Title인지 확인
@@ -209,12 +455,12 @@ def parse_page(builder: TreeBuilder, text: str, page_num: int, state: dict = Non
                 current_content = []
 
             # Section 헤더는 title로 사용하지 않음 (9.19.2.2 같은 Reserved 처리)
-            if next_line and next_line[0].isupper() and not next_line.startswith('(') and not next_line.startswith('Section 9.'):
+            if next_line and next_line[0].isupper() and not next_line.startswith('(') and not next_line.startswith(pp.section_prefix):
                 title = next_line
                 skip_next = True
             else:
                 # Title이 없으면 Reserved로 처리
-                title = 'Reserved' if not next_line or next_line.startswith('Section 9.') else None
+                title = 'Reserved' if not next_line or next_line.startswith(pp.section_prefix) else None
                 skip_next = False
 
             builder.add_node(node_type, node_id, title=title, page=page_num)
@@ -222,7 +468,7 @@ def parse_page(builder: TreeBuilder, text: str, page_num: int, state: dict = Non
             current_data = {'id': node_id, 'title': title}
             continue
 
-        result = detect_type(line)
+        result = detect_type(line, part)
 
         if result:
             node_type, data = result
@@ -290,7 +536,20 @@ def parse_page(builder: TreeBuilder, text: str, page_num: int, state: dict = Non
 
         else:
             # Section 헤더는 건너뛰기 (예: "Section 9.2.  Definitions")
-            if re.match(r'^Section\s+9\.\d+\.?\s+', line):
+            # SECTIONS 목록이 없는 Part는 여기서 Section 노드 생성
+            m = pp.section_header.match(line)
+            if m:
+                if m.group(1) not in builder.nodes and m.group(2)[:1].isupper():
+                    if current_type == 'clause' and current_content:
+                        full_content = '\n'.join(current_content)
+                        parent = builder.context_stack[-1] if builder.context_stack else None
+                        if parent and '(' not in parent:
+                            clause_id = f"{parent}.({current_data['num']})"
+                            builder.add_node('clause', clause_id, content=full_content, page=page_num)
+                    current_content = []
+                    current_type = 'section'
+                    current_data = {'id': m.group(1), 'title': m.group(2).strip()}
+                    builder.add_node('section', m.group(1), title=m.group(2).strip(), page=page_num)
                 continue
 
             # 이전 Clause의 연속
@@ -306,96 +565,429 @@ def parse_page(builder: TreeBuilder, text: str, page_num: int, state: dict = Non
     }
 
 
+def format_article_content(clauses, part: int = 9) -> str:
+    """[(clause_id, content), ...] (seq 순) → Article content "(1) content\n(2) content..." """
+    merged_content = '\n'.join([
+        f"({clause_id.split('(')[-1].rstrip(')')}) {content}"
+        for clause_id, content in clauses
+        if content
+    ])
+
+    # Section 헤더 제거 (content 끝에 포함된 경우)
+    # 예: "...coating. Section 9.8. Stairs, Ramps..."
+    return part_patterns(part).trailing_section.sub('', merged_content)
+
+
+def merged_article_contents(builder: TreeBuilder) -> dict:
+    """트리에서 바로 Article별 병합 content 계산 (INSERT 전, DB 왕복 없음)
+
+    Returns:
+        {article_id: merged_content}  # Clause가 있는 Article만
+    """
+    clauses_by_parent = {}
+    for node in builder.nodes.values():
+        if node.type == 'clause':
+            parent_id = node.parent_id
+            if parent_id:
+                clauses_by_parent.setdefault(parent_id, []).append((node.seq, node.id, node.content))
+
+    merged = {}
+    for article_id, clauses in clauses_by_parent.items():
+        article = builder.nodes.get(article_id)
+        if article is None or article.type not in ARTICLE_TYPES:
+            continue
+        clauses.sort()
+        merged[article_id] = format_article_content(
+            [(clause_id, content) for _, clause_id, content in clauses], builder.part_num)
+    return merged
+
+
+def merge_clause_content(cursor, article_ids, part: int = 9):
+    """DB에 있는 Clause로 Article content 다시 합치기 (증분 저장용)
+
+    Article 전체의 Clause를 한 번의 정렬 스캔으로 읽고 UPDATE는 executemany 1회
+    """
+    article_ids = list(article_ids)
+    clauses_by_parent = {article_id: [] for article_id in article_ids}
+    titles = {}
+    for i in range(0, len(article_ids), 500):
+        batch = article_ids[i:i + 500]
+        marks = ','.join('?' * len(batch))
+        cursor.execute(f'''
+            SELECT parent_id, id, content FROM nodes
+            WHERE type = 'clause' AND parent_id IN ({marks})
+            ORDER BY parent_id, seq
+        ''', batch)
+        for parent_id, clause_id, content in cursor.fetchall():
+            clauses_by_parent[parent_id].append((clause_id, content))
+        cursor.execute(f"SELECT id, title FROM nodes WHERE id IN ({marks})", batch)
+        titles.update(cursor.fetchall())
+
+    rows = []
+    for article_id, clauses in clauses_by_parent.items():
+        if clauses:
+            content = format_article_content(clauses, part)
+            rows.append((content, content_hash(titles.get(article_id), content), article_id))
+    cursor.executemany('''
+        UPDATE nodes SET content = ?, content_hash = ? WHERE id = ?
+    ''', rows)
+
+
+@contextmanager
+def _phase(timings: list, name: str):
+    """단계별 wall time 기록"""
+    t0 = time.perf_counter()
+    yield
+    timings.append((name, time.perf_counter() - t0))
+
+
 def save_to_db(builder: TreeBuilder, db_path: Path):
-    """트리를 SQLite에 저장"""
-    conn = sqlite3.connect(db_path)
+    """트리를 SQLite에 저장 (builder.part_num Part 전체 교체, 대량 로드)
+
+    - 한 트랜잭션 + BULK_LOAD_PRAGMAS
+    - nodes 동기화 트리거를 잠시 제거 → 행마다 FTS INSERT/UPDATE 하지 않음
+    - Clause 병합은 트리에서 미리 계산 → Article은 병합된 content로 INSERT (UPDATE 없음)
+    - executemany로 nodes / refs 적재, search_index는 마지막에 한 번 채움
+    - 변경 로그: 저장 전후 노드 시그니처를 비교해 실제로 바뀐 노드만 node_changes에 기록
+    - 트리 번호 (path / lft / rgt): INSERT 뒤 DFS 1회, 참조 그래프 (ref_edges / ref_closure) 재계산
+    """
+    part = builder.part_num
+    timings = []
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    ensure_schema(conn)
     cursor = conn.cursor()
+    for pragma in BULK_LOAD_PRAGMAS:
+        cursor.execute(pragma)
+
+    cursor.execute("BEGIN")
+    try:
+        trigger_sqls = suspend_triggers(cursor)
+        generation = begin_generation(cursor, f'parse_part9 save_to_db part {part}')
+
+        # 기존 Part 데이터 삭제 (FTS 포함, 트리거 없이 한 번씩)
+        with _phase(timings, 'delete'):
+            before = node_signatures(cursor, part)
+            fts_delete(cursor, "part = ?", (part,))  # external content: nodes 행을 지우기 전에
+            cursor.execute("DELETE FROM nodes WHERE part = ?", (part,))
+            cursor.execute("DELETE FROM refs WHERE source_id LIKE ?", (f'{part}.%',))
+
+        # 참조 해석 (content 전체 1회 스캔)
+        with _phase(timings, 'resolve refs'):
+            ref_stats = builder.resolve_references()
+        print(f"  Resolved {ref_stats['refs']} refs "
+              f"({ref_stats['unresolved']} unresolved, {ref_stats['external']} outside this part)")
+
+        # === Article에 Clause content 합치기 (트리에서, INSERT 전) ===
+        with _phase(timings, 'merge clauses'):
+            merged = merged_article_contents(builder)
+        print(f"  Merged clause content into {len(merged)} articles")
+
+        # nodes / refs 저장 (트리에서 행을 바로 스트리밍, Article은 병합된 content로)
+        after = {}
+
+        def hashed_rows():
+            for row in with_content_hash(builder.iter_rows(content_overrides=merged)):
+                after[row[0]] = (row[1], row[3], row[6], row[7], row[8])
+                yield row
+
+        with _phase(timings, 'insert nodes'):
+            cursor.executemany('''
+                INSERT INTO nodes (id, type, part, parent_id, title, content, page, seq, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', hashed_rows())
+        with _phase(timings, 'insert refs'):
+            cursor.executemany('''
+                INSERT INTO refs (source_id, target_id, target_type)
+                VALUES (?, ?, ?)
+            ''', builder.iter_ref_rows())
+
+        # 검색 인덱스: 최종 content로 한 번만 채움
+        with _phase(timings, 'build fts'):
+            fts_insert(cursor, "part = ?", (part,))
+
+        with _phase(timings, 'number tree'):
+            number_tree(cursor, part)
+        with _phase(timings, 'ref graph'):
+            graph = build_ref_graph(cursor)
+        print(f"  Ref graph: {graph['edges']} edges ({graph['unresolved']} refs unresolved), "
+              f"{graph['closure']} closure rows")
+
+        with _phase(timings, 'change log'):
+            changes = diff_signatures(before, after)
+            log_changes(cursor, generation, changes)
+        print(f"  Generation {generation}: {len(changes)} nodes changed")
+
+        resume_triggers(cursor, trigger_sqls)
+        end_generation(cursor, generation)
+        with _phase(timings, 'commit'):
+            cursor.execute("COMMIT")
+    except BaseException:
+        cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+    for name, seconds in timings:
+        print(f"    {name:14} {seconds:7.3f}s")
+    print(f"    {'total':14} {sum(t for _, t in timings):7.3f}s")
+    print(f"[OK] Saved to {db_path}")
 
-    # 기존 Part 9 데이터 삭제
-    cursor.execute("DELETE FROM nodes WHERE part = 9")
-    cursor.execute("DELETE FROM refs WHERE source_id LIKE '9.%'")
-
-    # nodes 저장
-    for node_id, node in builder.to_dict().items():
-        cursor.execute('''
-            INSERT INTO nodes (id, type, part, parent_id, title, content, page, seq)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            node['id'],
-            node['type'],
-            node['part'],
-            node['parent_id'],
-            node['title'],
-            node['content'],
-            node['page'],
-            node['seq']
-        ))
-
-        # refs 저장
-        refs = node.get('refs', {})
-        for ref_type, ref_list in refs.items():
-            for ref in ref_list:
-                target_type = ref_type.rstrip('s')  # 'tables' -> 'table'
-                cursor.execute('''
-                    INSERT INTO refs (source_id, target_id, target_type)
-                    VALUES (?, ?, ?)
-                ''', (node_id, ref, target_type))
-
-    # === Article에 Clause content 합치기 ===
-    print("  Merging clause content into articles...")
-
-    # Article 타입들
-    article_types = ('article', 'article_suffix', 'article_0a', 'sub_article')
-
-    # 각 Article의 하위 Clause content 합치기
-    cursor.execute(f'''
-        SELECT id FROM nodes
-        WHERE type IN {article_types} AND part = 9
-    ''')
-    articles = cursor.fetchall()
-
-    for (article_id,) in articles:
-        # 해당 Article의 모든 Clause 조회 (순서대로)
-        cursor.execute('''
-            SELECT id, content FROM nodes
-            WHERE parent_id = ? AND type = 'clause'
-            ORDER BY seq
-        ''', (article_id,))
-        clauses = cursor.fetchall()
 
-        if clauses:
-            # Clause content 합치기: "(1) content\n(2) content..."
-            merged_content = '\n'.join([
-                f"({clause_id.split('(')[-1].rstrip(')')}) {content}"
-                for clause_id, content in clauses
-                if content
-            ])
-
-            # Section 헤더 제거 (content 끝에 포함된 경우)
-            # 예: "...coating. Section 9.8. Stairs, Ramps..."
-            merged_content = re.sub(r'\s*Section\s+9\.\d+\.?\s+[A-Z].*$', '', merged_content)
-
-            # Article content 업데이트
-            cursor.execute('''
-                UPDATE nodes SET content = ? WHERE id = ?
-            ''', (merged_content, article_id))
-
-    print(f"    Updated {len(articles)} articles with clause content")
-
-    # 검색 인덱스 업데이트
-    cursor.execute("DELETE FROM search_index WHERE node_id LIKE '9.%'")
-    cursor.execute('''
-        INSERT INTO search_index (node_id, title, content)
-        SELECT id, title, content FROM nodes
-        WHERE part = 9 AND (title IS NOT NULL OR content IS NOT NULL)
-    ''')
+# === 체크포인트 / 증분 재파싱 ===
 
+def flush_pending_clause(builder: TreeBuilder, page_state: dict, page_num: int):
+    """페이지 상태에 남아 있는 clause content 저장 (파싱 범위 끝에서 호출)"""
+    if page_state and page_state.get('type') == 'clause' and page_state.get('content'):
+        full_content = '\n'.join(page_state['content'])
+        parent = builder.context_stack[-1] if builder.context_stack else None
+        if parent and '(' not in parent:
+            clause_id = f"{parent}.({page_state['data']['num']})"
+            builder.add_node('clause', clause_id, content=full_content, page=page_num)
+
+
+def is_checkpoint_page(page_idx: int) -> bool:
+    return (page_idx - PART9_START) % CHECKPOINT_EVERY == 0 or page_idx == PART9_END
+
+
+def checkpoint_path(page_idx: int) -> Path:
+    return CHECKPOINT_DIR / f"page_{page_idx:04d}.pkl"
+
+
+def extract_key(extract_mode: str, bands: tuple = None) -> tuple:
+    """체크포인트에 기록하는 추출 설정: (EXTRACT_MODES 키, geometry 띠 또는 None)
+
+    설정이 다르면 같은 페이지의 텍스트가 달라지므로 그 체크포인트에서 재개하면 안 됨
+    """
+    return tuple(EXTRACT_MODES[extract_mode]), (tuple(bands) if bands else None)
+
+
+def save_checkpoint(page_idx: int, builder: TreeBuilder, page_state: dict, extract: tuple):
+    """page_idx 파싱 직전의 경계 상태 저장 (TreeBuilder 스택/노드 + page_state + extract_key)"""
+    CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = checkpoint_path(page_idx).with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        pickle.dump({'page_idx': page_idx, 'builder': builder, 'page_state': page_state, 'extract': extract},
+                    f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(checkpoint_path(page_idx))
+
+
+def load_checkpoint(page_idx: int) -> tuple:
+    """Returns: (builder, page_state, extract)  # extract: extract_key (이전 체크포인트는 None)"""
+    with open(checkpoint_path(page_idx), 'rb') as f:
+        data = pickle.load(f)
+    return data['builder'], data['page_state'], data.get('extract')
+
+
+def find_checkpoint(page_idx: int) -> int:
+    """page_idx 이하에서 가장 가까운 체크포인트 페이지 (없으면 None)"""
+    if not CHECKPOINT_DIR.exists():
+        return None
+    found = [int(p.stem.split('_')[1]) for p in CHECKPOINT_DIR.glob('page_*.pkl')]
+    found = [p for p in found if p <= page_idx]
+    return max(found) if found else None
+
+
+def same_boundary_state(a: TreeBuilder, a_state: dict, b: TreeBuilder, b_state: dict) -> bool:
+    """두 파싱의 페이지 경계 상태가 같으면 이후 페이지 결과도 같다"""
+    return (
+        (a_state or {}) == (b_state or {})
+        and a.context_stack == b.context_stack
+        and a.seq_counters == b.seq_counters
+        and a.nodes.keys() == b.nodes.keys()
+    )
+
+
+def parse_pages(builder: TreeBuilder, page_state: dict, start: int, end: int,
+                args, cache, on_boundary=None) -> tuple:
+    """[start, end) 페이지 파싱
+
+    on_boundary(page_idx, builder, page_state)가 True를 반환하면 그 경계에서 중단.
+
+    Returns:
+        (page_state, stop_idx)  # stop_idx: 다음에 파싱할 페이지 (중단 지점 또는 end)
+    """
+    for page_idx, text in iter_page_texts(PDF_PATH, start, end, args.workers,
+                                          cache, args.extract_mode):
+        if on_boundary and is_checkpoint_page(page_idx) and on_boundary(page_idx, builder, page_state):
+            return page_state, page_idx
+
+        if text:
+            page_state = parse_page(builder, text, page_idx + 1, page_state)
+
+        # 진행률 표시
+        if (page_idx - PART9_START) % 50 == 0:
+            print(f"  Processed page {page_idx + 1}...")
+
+    return page_state, end
+
+
+def apply_node_changes(builder: TreeBuilder, db_path: Path, first_page: int, last_page: int) -> dict:
+    """[first_page, last_page] (1-indexed) 구간에서 실제로 바뀐 노드만 DB에 반영
+
+    - 노드 ID로 비교: 비교 대상 = 새 트리의 구간 노드 + page 없는 노드 (page 0, 목차 Section 등)
+      + DB의 구간 노드 → 각 ID의 DB 행 (page 무관)과 새 트리 행
+    - 구간 밖으로 옮겨간 노드는 새 page로 UPDATE, 새 트리에 아예 없는 DB 구간 노드만 DELETE
+    - 바뀐 노드만 UPSERT (FTS는 nodes 트리거가 처리)
+    - 바뀐 노드의 refs만 다시 쓰고, 영향받은 Article만 clause content 재병합
+    """
+    builder.resolve_references()
+
+    conn = sqlite3.connect(db_path)
+    ensure_schema(conn)
+    cursor = conn.cursor()
+    generation = begin_generation(cursor, f'parse_part9 pages {first_page}-{last_page}')
+
+    cursor.execute("SELECT id FROM nodes WHERE part = 9 AND page BETWEEN ? AND ?", (first_page, last_page))
+    old_window = {row[0] for row in cursor.fetchall()}
+
+    new_rows = {row[0]: row for row in builder.iter_rows()
+                if not row[6] or first_page <= row[6] <= last_page or row[0] in old_window}
+    ids = list(new_rows.keys() | old_window)
+    old_rows = {}
+    for i in range(0, len(ids), 500):
+        batch = ids[i:i + 500]
+        cursor.execute(f'''
+            SELECT id, type, part, parent_id, title, content, page, seq FROM nodes
+            WHERE id IN ({','.join('?' * len(batch))})
+        ''', batch)
+        old_rows.update((row[0], row) for row in cursor.fetchall())
+
+    def comparable(row: tuple) -> tuple:
+        # Article content는 DB에서 병합된 값이므로 비교에서 제외
+        return row[:5] + row[6:] if row[1] in ARTICLE_TYPES else row
+
+    changed = []
+    for node_id, row in new_rows.items():
+        old = old_rows.get(node_id)
+        if old is None or comparable(old) != comparable(row):
+            changed.append(row)
+    deleted = [node_id for node_id in old_window if node_id not in builder.nodes]
+
+    # 영향받은 Article: 바뀐 Article + 바뀐/삭제된 Clause의 (새/이전) parent
+    affected = {row[0] for row in changed if row[1] in ARTICLE_TYPES}
+    affected |= {row[3] for row in changed if row[1] == 'clause' and row[3]}
+    affected |= {old_rows[n][3] for n in deleted if old_rows[n][1] == 'clause' and old_rows[n][3]}
+    affected |= {old_rows[n][3] for n in (r[0] for r in changed)
+                 if n in old_rows and old_rows[n][1] == 'clause' and old_rows[n][3]}
+
+    touched = [row[0] for row in changed] + deleted
+    cursor.executemany("DELETE FROM refs WHERE source_id = ?", [(n,) for n in touched])
+    cursor.executemany("DELETE FROM nodes WHERE id = ?", [(n,) for n in deleted])
+    cursor.executemany('''
+        INSERT INTO nodes (id, type, part, parent_id, title, content, page, seq, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            type = excluded.type, part = excluded.part, parent_id = excluded.parent_id,
+            title = excluded.title, content = excluded.content,
+            page = excluded.page, seq = excluded.seq, content_hash = excluded.content_hash
+    ''', with_content_hash(changed))
+
+    ref_rows = []
+    for row in changed:
+        for ref_type, ref_list in builder.nodes[row[0]].refs.items():
+            for ref in ref_list:
+                ref_rows.append((row[0], ref, ref_type.rstrip('s')))
+    cursor.executemany('''
+        INSERT INTO refs (source_id, target_id, target_type)
+        VALUES (?, ?, ?)
+    ''', ref_rows)
+
+    affected_articles = [n for n in affected if n in builder.nodes and builder.nodes[n].type in ARTICLE_TYPES]
+    merge_clause_content(cursor, affected_articles)
+    if changed or deleted:
+        number_tree(cursor, 9)
+        build_ref_graph(cursor)
+
+    end_generation(cursor, generation)
     conn.commit()
     conn.close()
-    print(f"[OK] Saved to {db_path}")
+
+    return {'compared': len(new_rows), 'changed': len(changed),
+            'deleted': len(deleted), 'articles_merged': len(affected_articles)}
+
+
+def reparse(args, cache, extract: tuple, first_page: int, last_page: int, stop_on_converge: bool):
+    """체크포인트에서 재개하여 [first_page, last_page] (1-indexed)를 다시 파싱하고 변경분만 저장
+
+    last_page 이후에도 이전 실행의 체크포인트와 경계 상태가 같아질 때까지 계속 파싱
+    (stop_on_converge=False면 Part 끝까지).
+    재개할 체크포인트의 추출 설정 (extract_key)이 이번 실행과 다르면 거부.
+    """
+    resume_idx = find_checkpoint(first_page - 1)
+    if resume_idx is None:
+        print(f"[ERROR] No checkpoint at or before page {first_page}. Run a full parse first.")
+        return
+
+    builder, page_state, saved = load_checkpoint(resume_idx)
+    if saved != extract:
+        print(f"[ERROR] Checkpoint before page {resume_idx + 1} was made with extract settings {saved}, "
+              f"not {extract}. Run a full parse with --extract-mode {args.extract_mode} first.")
+        return
+    range_end = last_page  # 0-indexed exclusive
+    print(f"Resuming from checkpoint before page {resume_idx + 1}")
+
+    def on_boundary(page_idx, builder, page_state):
+        if page_idx == resume_idx:
+            return False
+        converged = False
+        if stop_on_converge and page_idx >= range_end and checkpoint_path(page_idx).exists():
+            old_builder, old_state, old_extract = load_checkpoint(page_idx)
+            converged = old_extract == extract and same_boundary_state(builder, page_state, old_builder, old_state)
+        save_checkpoint(page_idx, builder, page_state, extract)
+        return converged
+
+    t0 = time.perf_counter()
+    page_state, stop_idx = parse_pages(builder, page_state, resume_idx, PART9_END,
+                                       args, cache, on_boundary)
+    if stop_idx == PART9_END:
+        save_checkpoint(PART9_END, builder, page_state, extract)
+        flush_pending_clause(builder, page_state, PART9_END)
+    elapsed = time.perf_counter() - t0
+    print(f"  Reparsed pages {resume_idx + 1} - {stop_idx} in {elapsed:.2f}s")
+
+    stats = apply_node_changes(builder, DB_PATH, resume_idx + 1, stop_idx)
+    print(f"  Compared {stats['compared']} nodes: {stats['changed']} changed, "
+          f"{stats['deleted']} deleted, {stats['articles_merged']} articles re-merged")
+    print(f"[OK] Saved to {DB_PATH}")
+
+
+def parse_page_range(value: str) -> tuple:
+    """'800-820' 또는 '805' → (800, 820) (1-indexed, 양 끝 포함)"""
+    first, _, last = value.partition('-')
+    first, last = int(first), int(last or first)
+    if not (PART9_START + 1 <= first <= last <= PART9_END):
+        raise argparse.ArgumentTypeError(
+            f"page range must be within {PART9_START + 1}-{PART9_END}")
+    return first, last
+
+
+def parse_checkpoint_page(value: str) -> int:
+    """--from-checkpoint PAGE (1-indexed) → --pages와 같은 범위 검사"""
+    page = int(value)
+    if not (PART9_START + 1 <= page <= PART9_END):
+        raise argparse.ArgumentTypeError(
+            f"page must be within {PART9_START + 1}-{PART9_END}")
+    return page
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Part 9 PDF 파싱 → SQLite')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'페이지 추출 워커 프로세스 수 (1 = 직렬, 기본 {DEFAULT_WORKERS})')
+    parser.add_argument('--bench-extract', action='store_true',
+                        help='파싱 없이 직렬/병렬 추출 속도만 비교')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='페이지 텍스트 캐시를 사용하지 않음')
+    parser.add_argument('--extract-mode', choices=sorted(EXTRACT_MODES), default=DEFAULT_EXTRACT_MODE,
+                        help='header/footer 제거 방식: regex (clean_text) 또는 geometry (본문 clip)')
+    parser.add_argument('--pages', type=parse_page_range, metavar='FIRST-LAST',
+                        help='이 페이지 구간만 체크포인트에서 재파싱하고 바뀐 노드만 DB에 반영')
+    parser.add_argument('--from-checkpoint', type=parse_checkpoint_page, nargs='?', const=PART9_END,
+                        metavar='PAGE',
+                        help='PAGE 이하 마지막 체크포인트(생략 시 가장 최근)부터 끝까지 재개')
+    args = parser.parse_args()
+
     print("=== Part 9 PDF 파싱 시작 ===\n")
 
     # PDF 열기
@@ -403,10 +995,38 @@ def main():
         print(f"[ERROR] PDF not found: {PDF_PATH}")
         return
 
+    if args.bench_extract:
+        print("=== 추출 벤치마크 ===")
+        benchmark_extraction(PDF_PATH, PART9_START, PART9_END, args.workers, args.extract_mode)
+        return
+
+    cache = None if args.no_cache else PageTextCache(PDF_PATH, *EXTRACT_MODES[args.extract_mode])
+    bands = None
+    if args.extract_mode == 'geometry':
+        try:
+            bands = page_bands(PDF_PATH, cache)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            return
+    extract = extract_key(args.extract_mode, bands)
+
+    # 증분 모드: 페이지 캐시에서 읽으므로 직렬 추출 (중간 중단 시 워커 풀 대기 없음)
+    if args.pages or args.from_checkpoint is not None:
+        args.workers = 1
+        if args.pages:
+            reparse(args, cache, extract, *args.pages, stop_on_converge=True)
+        else:
+            reparse(args, cache, extract, args.from_checkpoint, PART9_END, stop_on_converge=False)
+        if cache is not None:
+            cache.report()
+            cache.close()
+        return
+
     doc = fitz.open(PDF_PATH)
     print(f"PDF loaded: {PDF_PATH.name}")
     print(f"Total pages: {len(doc)}")
     print(f"Part 9 range: {PART9_START + 1} - {PART9_END}\n")
+    doc.close()
 
     # TreeBuilder 초기화
     builder = TreeBuilder(part_num=9)
@@ -418,30 +1038,27 @@ def main():
     for sec_id, sec_title in SECTIONS:
         builder.add_node('section', sec_id, title=sec_title)
 
-    # 페이지별 파싱 (상태를 페이지 간 유지)
-    page_state = None  # 페이지 간 clause 상태 유지
+    # 페이지별 파싱 (상태를 페이지 간 유지, 체크포인트 페이지마다 경계 상태 저장)
+    mode = 'serial' if args.workers <= 1 else f'parallel x{args.workers}'
+    mode += f', {args.extract_mode}'
+    t0 = time.perf_counter()
 
-    for page_idx in range(PART9_START, PART9_END):
-        page = doc[page_idx]
-        text = extract_text_sorted(page)
-        text = clean_text(text)
+    def on_boundary(page_idx, builder, page_state):
+        save_checkpoint(page_idx, builder, page_state, extract)
+        return False
 
-        if text:
-            page_state = parse_page(builder, text, page_idx + 1, page_state)
+    page_state, _ = parse_pages(builder, None, PART9_START, PART9_END, args, cache, on_boundary)
+    save_checkpoint(PART9_END, builder, page_state, extract)
 
-        # 진행률 표시
-        if (page_idx - PART9_START) % 50 == 0:
-            print(f"  Processed page {page_idx + 1}...")
+    elapsed = time.perf_counter() - t0
+    total_pages = PART9_END - PART9_START
+    print(f"  {total_pages} pages in {elapsed:.2f}s ({total_pages / elapsed:.1f} pages/s, {mode})")
+    if cache is not None:
+        cache.report()
+        cache.close()
 
     # 마지막 남은 clause content 저장
-    if page_state and page_state.get('type') == 'clause' and page_state.get('content'):
-        full_content = '\n'.join(page_state['content'])
-        parent = builder.context_stack[-1] if builder.context_stack else None
-        if parent and '(' not in parent:
-            clause_id = f"{parent}.({page_state['data']['num']})"
-            builder.add_node('clause', clause_id, content=full_content, page=PART9_END)
-
-    doc.close()
+    flush_pending_clause(builder, page_state, PART9_END)
 
     # 결과 출력
     nodes = builder.to_dict()
@@ -5,7 +5,8 @@ OBC PDF 파싱을 위한 정규식 패턴 모음
 """
 
 import re
-from typing import Optional, Tuple, Dict, List
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, List, NamedTuple
 
 # === 구조 감지 패턴 ===
 
@@ -80,100 +81,164 @@ REF_PATTERNS = {
 }
 
 
-def detect_type(line: str) -> Optional[Tuple[str, Dict]]:
+# === 단일 패스 줄 분류기 ===
+# 첫 글자로 분기 → 분기당 compiled regex 1회 match
+#   '9' : 구조 ID 줄 (subsection / article / 특수 타입) - Part 번호의 첫 글자
+#   '(' : clause / subclause / subsubclause
+# 그룹 조합으로 타입 결정 (detect_type의 기존 우선순위와 동일한 결과)
+
+
+def _id_body(part_num: int) -> str:
+    """구조 ID 본문 (9.5.3 / 9.5.3A / 9.5.3A.1 / 9.5.3.1 / 9.5.1.1A)"""
+    return (
+        rf'(?P<id>{part_num}\.\d+\.\d+'
+        r'(?:(?P<alt>[A-Z])(?P<sub>\.\d+)?'      # 9.5.3A / 9.5.3A.1
+        r'|(?P<art>\.\d+)(?P<suf>[A-Z])?)?)'     # 9.5.3.1 / 9.5.1.1A
+    )
+
+
+class PartPatterns:
+    """Part 번호별 줄 분류/참조 패턴 (part_patterns()로 얻어서 재사용)"""
+
+    def __init__(self, part_num: int):
+        p = part_num
+        body = _id_body(p)
+        self.part_num = p
+        self.lead = str(p)[0]                  # 첫 글자 분기용
+        self.section_prefix = f'Section {p}.'
+
+        # ID + Title: "9.5.3.1.  Title", "9.5.1. 0A.  Title"
+        self.id_title = re.compile(
+            r'^' + body + r'(?:\.\s*(?P<zero>0A))?\.\s+(?P<title>[A-Z][^\n]+)$'
+        )
+        # ID만 있는 줄 (Title은 다음 줄): "9.5.3.1."
+        self.id_only = re.compile(r'^' + body + r'\.\s*$')
+
+        # Table 노트 영역 종료 (새 Subsection/Article ID)
+        self.table_notes_end = re.compile(rf'^{p}\.\d+\.\d+(?:\.?\s*$|\.\d+\.?\s)')
+        # Section 헤더: "Section 9.2.  Definitions"
+        self.section_header = re.compile(rf'^Section\s+({p}\.\d+)\.?\s+(.*)')
+        # content 끝에 붙은 Section 헤더: "...coating. Section 9.8. Stairs, Ramps..."
+        self.trailing_section = re.compile(rf'\s*Section\s+{p}\.\d+\.?\s+[A-Z].*$')
+
+        self.refs = {
+            'table': re.compile(rf'Table\s+({p}\.\d+\.\d+\.\d+[A-Z]?)\.?'),
+            'clause': REF_PATTERNS['clause'],
+            'article': re.compile(rf'Article[s]?\s+({p}\.\d+\.\d+\.\d+[A-Z]?)'),
+            'section': re.compile(rf'Section\s+({p}\.\d+)'),
+            'subsection': re.compile(rf'Subsection\s+({p}\.\d+\.\d+[A-Z]?)'),
+        }
+
+
+_PART_PATTERNS: Dict[int, PartPatterns] = {}
+
+
+def part_patterns(part_num: int = 9) -> PartPatterns:
+    """Part별 패턴 (처음 요청 시 compile 후 캐시)"""
+    pp = _PART_PATTERNS.get(part_num)
+    if pp is None:
+        pp = _PART_PATTERNS[part_num] = PartPatterns(part_num)
+    return pp
+
+
+# Part 9 (기존 이름 유지)
+ID_TITLE_LINE = part_patterns(9).id_title
+ID_ONLY_LINE = part_patterns(9).id_only
+
+# (1) / (a) / (ii) 로 시작하는 줄
+PAREN_LINE = re.compile(
+    r'^\((?:(?P<num>\d+)|(?P<letter>[a-z])|(?P<numeral>[ivx]+))\)\s+(?P<content>.+)'
+)
+
+
+def _id_type(m: re.Match) -> str:
+    """ID 그룹 조합 → 노드 타입"""
+    if m.group('alt'):
+        return 'sub_article' if m.group('sub') else 'alt_subsection'
+    if m.group('art'):
+        return 'article_suffix' if m.group('suf') else 'article'
+    return 'subsection'
+
+
+def detect_type(line: str, part: int = 9) -> Optional[Tuple[str, Dict]]:
     """
-    한 줄의 타입을 감지하고 파싱된 데이터 반환
+    한 줄의 타입을 감지하고 파싱된 데이터 반환 (part: 구조 ID의 Part 번호)
 
     Returns:
         ('article', {'id': '9.5.3.1', 'title': 'Title'}) 또는 None
 
-    주의: 특수 패턴을 먼저 체크해야 함!
+    첫 글자 분기 + compiled regex 1회 match
+    (특수 패턴 우선순위는 _id_type의 그룹 판정으로 보장)
     """
     line = line.strip()
     if not line:
         return None
 
-    # 페이지 번호 무시
-    if line.isdigit():
+    pp = part_patterns(part)
+    first = line[0]
+    if first != pp.lead and first != '(':
         return None
 
     # 헤더/푸터 무시
     if 'Building Code' in line or 'Division B' in line:
         return None
 
-    # === 특수 패턴 먼저! (순서 중요) ===
-
-    # Sub-Article: 9.5.3A.1
-    if m := PATTERNS['sub_article'].match(line):
-        return ('sub_article', {
-            'id': m.group(1),
-            'title': m.group(2).strip()
-        })
-
-    # 0A Article: 9.5.1. 0A
-    if m := PATTERNS['article_0a'].match(line):
-        return ('article_0a', {
-            'id': m.group(1) + '.0A',  # 9.5.1.0A 형식으로
-            'title': m.group(2).strip()
-        })
-
-    # Article + Suffix: 9.5.1.1A
-    if m := PATTERNS['article_suffix'].match(line):
-        return ('article_suffix', {
-            'id': m.group(1),
-            'title': m.group(2).strip()
-        })
-
-    # Alternative Subsection: 9.5.3A
-    if m := PATTERNS['alt_subsection'].match(line):
-        return ('alt_subsection', {
-            'id': m.group(1),
-            'title': m.group(2).strip()
-        })
-
-    # === 기본 패턴 ===
-
-    # Article: 9.5.3.1
-    if m := PATTERNS['article'].match(line):
-        return ('article', {
-            'id': m.group(1),
-            'title': m.group(2).strip()
-        })
-
-    # Subsection: 9.5.3
-    if m := PATTERNS['subsection'].match(line):
-        return ('subsection', {
-            'id': m.group(1),
-            'title': m.group(2).strip()
-        })
-
-    # Clause: (1) - OBC에서 "Sentence"라고 부름
-    if m := re.match(r'^\((\d+)\)\s+([A-Z].+)', line):
-        return ('clause', {
-            'num': m.group(1),
-            'content': m.group(2).strip()
-        })
+    if first == pp.lead:
+        m = pp.id_title.match(line)
+        if not m:
+            return None
+
+        node_id = m.group('id')
+        title = m.group('title').strip()
+
+        # 0A Article: 9.5.1. 0A / 9.5.1.0A → 9.5.1.0A 형식으로
+        if m.group('zero'):
+            if m.group('alt') or m.group('art'):
+                return None
+            return ('article_0a', {'id': node_id + '.0A', 'title': title})
+        if m.group('art') == '.0' and m.group('suf') == 'A':
+            return ('article_0a', {'id': node_id, 'title': title})
+
+        return (_id_type(m), {'id': node_id, 'title': title})
+
+    m = PAREN_LINE.match(line)
+    if not m:
+        return None
+
+    content = m.group('content').strip()
+
+    # Clause: (1) - OBC에서 "Sentence"라고 부름 (대문자로 시작해야 함)
+    if m.group('num'):
+        if len(content) < 2 or not 'A' <= content[0] <= 'Z':
+            return None
+        return ('clause', {'num': m.group('num'), 'content': content})
 
     # Sub-clause: (a)
-    if m := re.match(r'^\(([a-z])\)\s+(.+)', line):
-        return ('subclause', {
-            'letter': m.group(1),
-            'content': m.group(2).strip()
-        })
+    if m.group('letter'):
+        return ('subclause', {'letter': m.group('letter'), 'content': content})
 
     # Sub-sub-clause: (i)
-    if m := re.match(r'^\(([ivx]+)\)\s+(.+)', line):
-        return ('subsubclause', {
-            'numeral': m.group(1),
-            'content': m.group(2).strip()
-        })
+    return ('subsubclause', {'numeral': m.group('numeral'), 'content': content})
+
 
-    return None
+def detect_id_only(line: str, part: int = 9) -> Optional[Tuple[str, str]]:
+    """ID만 있는 줄인지 확인 (Title은 다음 줄에)
+
+    Returns:
+        ('article', '9.5.3.1') 또는 None
+    """
+    pp = part_patterns(part)
+    if not line or line[0] != pp.lead:
+        return None
+    m = pp.id_only.match(line)
+    if not m:
+        return None
+    return (_id_type(m), m.group('id'))
 
 
-def extract_references(text: str) -> Dict[str, List[str]]:
+def extract_references(text: str, part: int = 9) -> Dict[str, List[str]]:
     """
-    텍스트에서 모든 참조 추출
+    텍스트에서 모든 참조 추출 (part: 참조 ID의 Part 번호)
 
     Returns:
         {
@@ -183,18 +248,165 @@ def extract_references(text: str) -> Dict[str, List[str]]:
             'sections': ['9.5']
         }
     """
+    refs = part_patterns(part).refs
     return {
-        'tables': REF_PATTERNS['table'].findall(text),
-        'clauses': REF_PATTERNS['clause'].findall(text),
-        'articles': REF_PATTERNS['article'].findall(text),
-        'sections': REF_PATTERNS['section'].findall(text),
-        'subsections': REF_PATTERNS['subsection'].findall(text),
+        'tables': refs['table'].findall(text),
+        'clauses': refs['clause'].findall(text),
+        'articles': refs['article'].findall(text),
+        'sections': refs['section'].findall(text),
+        'subsections': refs['subsection'].findall(text),
     }
 
 
+# === 단일 스캔 참조 추출 (모든 Part) ===
+# 키워드가 서로 겹치지 않으므로 하나의 alternation으로 REF_PATTERNS 5개와 같은 hit를 한 번에 찾음
+# 각 alternative의 마지막 그룹 = 참조 종류 (m.lastgroup)
+_ARTICLE_ID = r'\d+\.\d+\.\d+\.\d+[A-Z]?'
+
+REF_SCANNER = re.compile(
+    r'Table\s+(?P<tables>' + _ARTICLE_ID + r')'
+    r'|Articles?\s+(?P<articles>' + _ARTICLE_ID + r')'
+    r'|Subsection\s+(?P<subsections>\d+\.\d+\.\d+[A-Z]?)'
+    r'|Section\s+(?P<sections>\d+\.\d+)'
+    # Sentence (2) / Sentence 9.10.9.6.(1) / Clauses (3)
+    r'|(?:Sentence|Clause)s?\s+(?:(?P<clause_article>' + _ARTICLE_ID + r')\.)?\((?P<clauses>\d+)\)'
+)
+
+
+def scan_references(text: str) -> List[Tuple[str, str, Optional[str]]]:
+    """content 한 번 스캔 → [(kind, target, clause_article), ...] (텍스트 순서)
+
+    kind: 'tables' / 'articles' / 'subsections' / 'sections' / 'clauses'
+    clause_article: "Sentence 9.10.9.6.(1)"처럼 Article이 명시된 clause 참조의 Article ID
+    (Sentence (2)처럼 번호만 있으면 None → 호출 측에서 문맥 Article로 해석)
+    """
+    hits = []
+    for m in REF_SCANNER.finditer(text):
+        kind = m.lastgroup
+        hits.append((kind, m.group(kind), m.group('clause_article') if kind == 'clauses' else None))
+    return hits
+
+
+# === 구조 ID 파싱 (정규식 없이, ID당 1회 계산 후 캐시) ===
+
+class ParsedId(NamedTuple):
+    """구조 ID 분해 결과
+
+    '9.5.3A.1' → nums (9, 5, 3, 1), suffixes ('', '', 'A', '')
+    '9.5.3.1.(2)' → nums (9, 5, 3, 1), suffixes ('', '', '', ''), parens ('2',)
+    """
+    nums: Tuple[int, ...]
+    suffixes: Tuple[str, ...]
+    parens: Tuple[str, ...]
+    type: str                   # get_node_type() 결과
+    parent: Optional[str]       # ID 구조상 parent (part/section/clause 등은 None)
+    sort_key: Tuple
+
+
+# 타입별 ID 모양 (구성요소별 접미 문자 유무) - parent는 마지막 구성요소를 뺀 ID
+_PARENT_SHAPES = {
+    'subsection': (False, False, False),
+    'alt_subsection': (False, False, True),
+    'article': (False, False, False, False),
+    'sub_article': (False, False, True, False),
+    'article_suffix': (False, False, False, True),
+    'article_0a': (False, False, False, True),
+}
+
+
+def _split_component(comp: str) -> Optional[Tuple[int, str]]:
+    """'3A' → (3, 'A'), '12' → (12, ''), 형식이 아니면 None (접미 문자는 대문자 1개까지)"""
+    end = len(comp)
+    while end and not comp[end - 1].isdigit():
+        end -= 1
+    digits, suffix = comp[:end], comp[end:]
+    if not digits or not digits.isascii() or not digits.isdigit():
+        return None
+    if len(suffix) > 1 or (suffix and not 'A' <= suffix <= 'Z'):
+        return None
+    return int(digits), suffix
+
+
+def _classify(nums: Tuple[int, ...], suffixes: Tuple[str, ...], digits: Tuple[str, ...]) -> str:
+    """get_node_type 규칙 (특수 패턴 우선)"""
+    flags = tuple(bool(x) for x in suffixes)
+    n = len(nums)
+    if n == 4:
+        if flags == (False, False, True, False):
+            return 'sub_article'
+        if flags == (False, False, False, True):
+            # 9.33.6.10A (숫자가 '0'으로 끝나고 2자리 이상 + A)
+            if suffixes[3] == 'A' and len(digits[3]) >= 2 and digits[3].endswith('0'):
+                return 'article_0a'
+            return 'article_suffix'
+        if not any(flags):
+            return 'article'
+    elif n == 3:
+        if flags == (False, False, True):
+            return 'alt_subsection'
+        if not any(flags):
+            return 'subsection'
+    elif n == 2 and not any(flags):
+        return 'section'
+    elif n == 1 and not any(flags):
+        return 'part'
+    return 'unknown'
+
+
+@lru_cache(maxsize=None)
+def parse_id(node_id: str) -> Optional[ParsedId]:
+    """구조 ID 분해 (모든 Part 번호), 구조 ID가 아니면 None"""
+    comps = node_id.split('.')
+    parens = []
+    while comps and comps[-1].startswith('(') and comps[-1].endswith(')') and len(comps[-1]) > 2:
+        parens.append(comps.pop()[1:-1])
+    parens.reverse()
+
+    nums, suffixes, digits = [], [], []
+    for comp in comps:
+        split = _split_component(comp)
+        if split is None:
+            return None
+        nums.append(split[0])
+        suffixes.append(split[1])
+        digits.append(comp[:len(comp) - len(split[1])])
+    nums, suffixes, digits = tuple(nums), tuple(suffixes), tuple(digits)
+
+    node_type = _classify(nums, suffixes, digits) if not parens else 'unknown'
+    parent = node_id[:node_id.rfind('.')] if node_type in _PARENT_SHAPES else None
+
+    # 정렬: 구성요소별 (숫자, 접미 문자) → 9.2 < 9.10, 9.5.3 < 9.5.3A < 9.5.4
+    # paren 구성요소는 숫자면 숫자 순, 아니면 문자열 순 ((1) < (2) < (a))
+    sort_key = tuple(zip(nums, suffixes)) + tuple(
+        (int(p), '') if p.isdigit() else (1 << 30, p) for p in parens
+    )
+    return ParsedId(nums, suffixes, tuple(parens), node_type, parent, sort_key)
+
+
+def parent_from_id(node_type: str, node_id: str) -> Optional[str]:
+    """node_type 모양의 ID에서 parent ID 추출 (9.5.3A.1 → 9.5.3A), 모양이 다르면 None"""
+    shape = _PARENT_SHAPES.get(node_type)
+    if shape is None:
+        return None
+    parsed = parse_id(node_id)
+    if parsed is None or parsed.parens or len(parsed.suffixes) != len(shape):
+        return None
+    if tuple(bool(x) for x in parsed.suffixes) != shape:
+        return None
+    return node_id[:node_id.rfind('.')]
+
+
+def id_sort_key(node_id: str) -> Tuple:
+    """구조 ID 자연 정렬 키 (구조 ID가 아니면 문자열 뒤로)"""
+    parsed = parse_id(node_id)
+    if parsed is None:
+        return ((1 << 30, node_id),)
+    return parsed.sort_key
+
+
 def get_node_type(node_id: str) -> str:
     """
-    ID 패턴으로 노드 타입 판단 (특수 패턴 포함)
+    ID 패턴으로 노드 타입 판단 (특수 패턴 포함, 모든 Part 번호)
 
     Examples:
         '9' -> 'part'
@@ -205,30 +417,5 @@ def get_node_type(node_id: str) -> str:
         '9.5.1.1A' -> 'article_suffix'
         '9.5.3A.1' -> 'sub_article'
     """
-    # 특수 패턴 먼저!
-    if re.match(r'^9\.\d+\.\d+[A-Z]\.\d+$', node_id):
-        return 'sub_article'
-
-    if re.match(r'^9\.\d+\.\d+\.\d+0A$', node_id):
-        return 'article_0a'
-
-    if re.match(r'^9\.\d+\.\d+\.\d+[A-Z]$', node_id):
-        return 'article_suffix'
-
-    if re.match(r'^9\.\d+\.\d+[A-Z]$', node_id):
-        return 'alt_subsection'
-
-    # 기본 패턴
-    if re.match(r'^9\.\d+\.\d+\.\d+$', node_id):
-        return 'article'
-
-    if re.match(r'^9\.\d+\.\d+$', node_id):
-        return 'subsection'
-
-    if re.match(r'^9\.\d+$', node_id):
-        return 'section'
-
-    if node_id == '9':
-        return 'part'
-
-    return 'unknown'
+    parsed = parse_id(node_id)
+    return parsed.type if parsed else 'unknown'
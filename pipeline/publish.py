@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+obc.db → 읽기 전용 스냅샷 (서빙용)
+- 임포트 스크립트가 고치는 obc.db는 그대로 두고 VACUUM INTO로 사본을 만들어 다듬은 뒤 교체
+    1. VACUUM INTO (page_size 조정, freelist 없는 압축 사본 - 읽기 트랜잭션 1개라 쓰는 중에도 일관된 시점)
+    2. 쓰기용 트리거 제거 (스냅샷은 쓰지 않음 → 연결마다 파싱할 스키마도 줄어듦)
+    3. search_index / search_ids 'optimize' (세그먼트 1개로 병합) + ANALYZE
+    4. 다시 VACUUM INTO로 최종 파일 (optimize가 비운 페이지 제거)
+    5. FTS integrity-check: VACUUM은 INTEGER PRIMARY KEY가 없는 nodes의 rowid를 바꿀 수 있음
+       → external content 색인이 어긋났으면 rebuild
+    6. 임시 파일 → 스냅샷 경로로 os.replace (이미 열린 리더는 이전 파일을 계속 읽음)
+- 리더: open_snapshot() / query.NodeStore(..., immutable=True)
+    immutable=1 → 잠금 / 변경 감지 없이 읽음, mmap으로 페이지 캐시 공유
+
+사용법:
+    python publish.py                              # data/obc.db → data/obc_snapshot.db
+    python publish.py --db x.db --out y.db --page-size 8192
+"""
+
+import argparse
+import os
+import sqlite3
+import stat
+import time
+from pathlib import Path
+
+from db_utils import DB_PATH, FTS_TABLES, current_generation
+
+SNAPSHOT_PATH = DB_PATH.with_name("obc_snapshot.db")
+PAGE_SIZE = 4096  # _experiments/bench_snapshot.py: 8192/16384는 파일만 커지고 cold 조회가 느려짐
+
+SNAPSHOT_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    "PRAGMA mmap_size = 268435456",   # 256MB (스냅샷 전체보다 큼)
+    "PRAGMA cache_size = -65536",     # 64MB
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def snapshot_uri(path: Path) -> str:
+    return f"file:{Path(path).resolve().as_posix()}?immutable=1"
+
+
+def open_snapshot(path: Path = SNAPSHOT_PATH, check_same_thread: bool = True) -> sqlite3.Connection:
+    """publish()로 만든 스냅샷 열기 (immutable=1 + mmap)
+
+    파일이 바뀌지 않는다는 전제로 잠금을 건너뜀 → 쓰는 중인 obc.db에는 쓰지 말 것
+    """
+    conn = sqlite3.connect(snapshot_uri(path), uri=True, check_same_thread=check_same_thread)
+    for pragma in SNAPSHOT_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _vacuum_into(src: Path, dest: Path, page_size: int = None):
+    if dest.exists():
+        dest.unlink()
+    conn = sqlite3.connect(f"file:{src.resolve().as_posix()}?mode=ro", uri=True)
+    if page_size:
+        conn.execute(f"PRAGMA page_size = {page_size}")  # 원본은 그대로, VACUUM INTO 결과에만 적용
+    conn.execute("VACUUM INTO ?", (str(dest),))
+    conn.close()
+
+
+def _fts_ok(conn: sqlite3.Connection) -> bool:
+    try:
+        for table in FTS_TABLES:
+            conn.execute(f"INSERT INTO {table} ({table}, rank) VALUES ('integrity-check', 1)")
+    except sqlite3.DatabaseError:
+        return False
+    return True
+
+
+def publish(db_path: Path = DB_PATH, out_path: Path = SNAPSHOT_PATH, page_size: int = PAGE_SIZE) -> dict:
+    """스냅샷 생성 → {'generation', 'source_bytes', 'snapshot_bytes', 'fts_rebuilt', 'seconds'}"""
+    t0 = time.perf_counter()
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    stage = out_path.with_name(out_path.name + '.stage')
+    tmp = out_path.with_name(out_path.name + '.tmp')
+
+    # 1. 압축 사본
+    _vacuum_into(Path(db_path), stage, page_size)
+
+    # 2-3. 트리거 제거, FTS 병합, 통계
+    conn = sqlite3.connect(stage, isolation_level=None)
+    generation = current_generation(conn)
+    conn.execute("BEGIN")
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+        conn.execute(f'DROP TRIGGER "{name}"')
+    for table in FTS_TABLES:
+        conn.execute(f"INSERT INTO {table} ({table}) VALUES ('optimize')")
+    conn.execute("COMMIT")
+    conn.execute("ANALYZE")
+    conn.close()
+
+    # 4. 최종 파일 (page_size는 stage에서 이어받음)
+    _vacuum_into(stage, tmp)
+    stage.unlink()
+
+    # 5. rowid가 바뀌었으면 색인 다시 만들기
+    conn = sqlite3.connect(tmp, isolation_level=None)
+    fts_rebuilt = not _fts_ok(conn)
+    if fts_rebuilt:
+        for table in FTS_TABLES:
+            conn.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+            conn.execute(f"INSERT INTO {table} ({table}) VALUES ('optimize')")
+        if not _fts_ok(conn):
+            conn.close()
+            tmp.unlink()
+            raise RuntimeError(f"FTS index does not match nodes after rebuild: {tmp}")
+    conn.close()
+
+    # 6. 교체 (읽기 전용 파일로)
+    os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    os.replace(tmp, out_path)
+
+    return {
+        'generation': generation,
+        'source_bytes': os.path.getsize(db_path),
+        'snapshot_bytes': os.path.getsize(out_path),
+        'fts_rebuilt': fts_rebuilt,
+        'seconds': time.perf_counter() - t0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='obc.db → 읽기 전용 스냅샷 (VACUUM INTO)')
+    parser.add_argument('--db', type=Path, default=DB_PATH, help=f'원본 DB (기본: {DB_PATH})')
+    parser.add_argument('--out', type=Path, default=SNAPSHOT_PATH, help=f'스냅샷 (기본: {SNAPSHOT_PATH})')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    args = parser.parse_args()
+
+    stats = publish(args.db, args.out, args.page_size)
+    kb = 1024
+    print(f"[OK] {args.out} (generation {stats['generation']}, page_size {args.page_size})")
+    print(f"  {stats['source_bytes'] / kb:8.0f} KB → {stats['snapshot_bytes'] / kb:8.0f} KB "
+          f"in {stats['seconds']:.2f}s" + (" (FTS rebuilt: rowids changed)" if stats['fts_rebuilt'] else ""))
+
+
+if __name__ == '__main__':
+    main()
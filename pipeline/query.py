@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+obc.db 읽기 API (서버 / 검증 / 내보내기 공용)
+- 읽기 전용 연결 풀: 스레드 간 공유, 연결마다 prepared statement 캐시 (SQL 문자열은 모두 모듈 상수)
+- get_node / get_many / get_subtree / get_ancestors / get_table / search
+- get_cited_by / get_dependencies: 해석된 참조 그래프 (ref_graph.py)
+- 하위 트리는 nested set (part, lft) 범위 조회 1번 → 문서 순서 그대로
+    (트리 번호가 없는 이전 DB, 번호 없는 노드가 있는 Part는 재귀 CTE로 같은 결과)
+- LRU 결과 캐시: DB 변경 버전 (db_utils.change_version = 마지막 generation + 마지막 node_changes.id)이 바뀌면 통째로 비움
+    → nodes 쓰기는 begin_generation을 거치지 않아도 로그 트리거가 node_changes에 남기므로 (schema.sql 6절)
+      캐시가 오래된 값을 돌려주지 않음 (tables / refs만 직접 고치는 쓰기는 begin_generation을 거칠 것)
+
+반환값 (dict / list)은 캐시와 공유 → 고치지 말고 복사해서 사용
+
+사용법:
+    python query.py node 9.8.2
+    python query.py subtree 9.8.2 --depth 1
+    python query.py ancestors "9.8.2.1.(1)"
+    python query.py table "Table 9.5.3.1"
+    python query.py search "guard height"
+"""
+
+import argparse
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from db_utils import DB_PATH, PATH_WIDTH, change_version, current_generation
+import ref_graph
+import search as fts_search
+
+POOL_SIZE = 4
+CACHE_SIZE = 4096
+STATEMENT_CACHE = 256   # sqlite3.connect(cached_statements=...)
+BATCH = 500             # get_many IN (...) 한 번에 묶는 ID 수 (SQLite 변수 999개 제한 아래)
+
+READ_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    "PRAGMA cache_size = -65536",     # 64MB (연결마다)
+    "PRAGMA mmap_size = 268435456",   # 256MB
+    "PRAGMA temp_store = MEMORY",
+)
+
+NODE_FIELDS = ('id', 'type', 'part', 'parent_id', 'title', 'content', 'page', 'seq', 'content_hash')
+TABLE_FIELDS = ('id', 'title', 'parent_id', 'page', 'html', 'source')
+
+NODE_SQL = f"SELECT {', '.join(NODE_FIELDS)} FROM nodes WHERE id = ?"
+
+# 트리 번호 확인 (이전 DB: 컬럼 없음 → OperationalError, 번호 없음 → NULL)
+# number_tree 없이 넣은 노드 (lft NULL)가 Part에 하나라도 있으면 범위 조회에서 빠지므로 CTE로 (idx_nodes_lft)
+NUMBERED_SQL = '''
+    SELECT r.lft IS NOT NULL AND NOT EXISTS (SELECT 1 FROM nodes n WHERE n.part = r.part AND n.lft IS NULL)
+    FROM nodes r WHERE r.id = ?
+'''
+
+# nested set: root와 같은 Part에서 lft 범위 (idx_nodes_lft) → lft 순 = 문서 순서
+# depth = root와의 path 단계 차이
+SUBTREE_SQL = f'''
+    SELECT {', '.join('n.' + f for f in NODE_FIELDS)},
+           (length(n.path) - length(r.path)) / {PATH_WIDTH + 1} AS depth
+    FROM nodes r JOIN nodes n ON n.part = r.part AND n.lft BETWEEN r.lft AND r.rgt
+    WHERE r.id = :root
+      AND (:max_depth IS NULL OR length(n.path) - length(r.path) <= :max_depth * {PATH_WIDTH + 1})
+    ORDER BY n.lft
+'''
+
+# 번호 없는 DB용: depth 우선 (ORDER BY depth DESC) CTE 큐에서 꺼내는 순서 = 문서 순서 (형제는 seq 순)
+SUBTREE_CTE_SQL = f'''
+    WITH RECURSIVE subtree({', '.join(NODE_FIELDS)}, depth) AS (
+        SELECT {', '.join(NODE_FIELDS)}, 0 FROM nodes WHERE id = :root
+        UNION ALL
+        SELECT {', '.join('n.' + f for f in NODE_FIELDS)}, s.depth + 1
+        FROM nodes n JOIN subtree s ON n.parent_id = s.id
+        WHERE :max_depth IS NULL OR s.depth < :max_depth
+        ORDER BY 10 DESC, 8, 1
+    )
+    SELECT * FROM subtree
+'''
+
+# node에서 parent_id를 따라 올라감 → depth DESC = 루트부터
+ANCESTORS_SQL = f'''
+    WITH RECURSIVE chain({', '.join(NODE_FIELDS)}, depth) AS (
+        SELECT {', '.join(NODE_FIELDS)}, 0 FROM nodes WHERE id = ?
+        UNION ALL
+        SELECT {', '.join('n.' + f for f in NODE_FIELDS)}, c.depth + 1
+        FROM nodes n JOIN chain c ON n.id = c.parent_id
+    )
+    SELECT * FROM chain ORDER BY depth DESC
+'''
+
+TABLE_SQL = f"SELECT {', '.join(TABLE_FIELDS)} FROM tables WHERE id = ?"
+
+# 하위 트리 노드에 붙은 테이블 (내보내기용)
+SUBTREE_TABLES_SQL = f'''
+    SELECT {', '.join('t.' + f for f in TABLE_FIELDS)}
+    FROM nodes r JOIN nodes n ON n.part = r.part AND n.lft BETWEEN r.lft AND r.rgt
+    JOIN tables t ON t.parent_id = n.id
+    WHERE r.id = ?
+    ORDER BY t.id
+'''
+
+SUBTREE_TABLES_CTE_SQL = f'''
+    WITH RECURSIVE subtree(id) AS (
+        SELECT id FROM nodes WHERE id = ?
+        UNION ALL
+        SELECT n.id FROM nodes n JOIN subtree s ON n.parent_id = s.id
+    )
+    SELECT {', '.join('t.' + f for f in TABLE_FIELDS)}
+    FROM tables t JOIN subtree s ON t.parent_id = s.id
+    ORDER BY t.id
+'''
+
+
+class ReadPool:
+    """읽기 전용 연결 풀 (최대 size개, 스레드 간 공유)
+
+    immutable=True: publish.py 스냅샷 전용 (잠금 / 변경 감지 없음)
+    """
+
+    def __init__(self, db_path: Path = DB_PATH, size: int = POOL_SIZE, immutable: bool = False):
+        self.db_path = Path(db_path)
+        self._uri = f"file:{self.db_path.resolve().as_posix()}?{'immutable=1' if immutable else 'mode=ro'}"
+        self._idle = queue.LifoQueue()    # 최근에 쓴 연결 (페이지 캐시가 따뜻한 쪽) 먼저
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE)
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """연결 하나를 빌려 읽기 트랜잭션 1개 안에서 사용 (모든 SELECT가 같은 스냅샷)"""
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            try:
+                conn.execute("BEGIN")
+                yield conn
+            finally:
+                conn.rollback()
+                self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class _LRUCache:
+    """DB 변경 버전 단위 LRU (버전이 바뀌면 전체 무효화)"""
+
+    MISSING = object()
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.version = None
+        self.hits = self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sync(self, version: tuple):
+        with self._lock:
+            if version != self.version:
+                self._data.clear()
+                self.version = version
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key, self.MISSING)
+            if value is self.MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value, version: tuple):
+        """version: 값을 읽은 스냅샷 (그 사이 캐시가 새 버전으로 넘어갔으면 버림)"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if version != self.version:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self) -> dict:
+        with self._lock:
+            return {'version': self.version, 'size': len(self._data),
+                    'hits': self.hits, 'misses': self.misses}
+
+
+def _node(row) -> dict:
+    return dict(zip(NODE_FIELDS, row))
+
+
+def _tree_node(row) -> dict:
+    node = _node(row)
+    node['depth'] = row[len(NODE_FIELDS)]
+    return node
+
+
+def _table(row) -> dict:
+    return dict(zip(TABLE_FIELDS, row))
+
+
+def _numbered(conn: sqlite3.Connection, node_id: str) -> bool:
+    """node와 같은 Part 노드 전부에 트리 번호가 있으면 True (범위 조회 가능)"""
+    try:
+        row = conn.execute(NUMBERED_SQL, (node_id,)).fetchone()
+    except sqlite3.OperationalError:
+        return False
+    return bool(row and row[0])
+
+
+class NodeStore:
+    """obc.db 읽기 API (스레드 안전)"""
+
+    def __init__(self, db_path: Path = DB_PATH, pool_size: int = POOL_SIZE, cache_size: int = CACHE_SIZE,
+                 immutable: bool = False):
+        self.pool = ReadPool(db_path, pool_size, immutable)
+        self.cache = _LRUCache(cache_size)
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def _read(self):
+        """(연결, 이 스냅샷의 변경 버전)"""
+        with self.pool.connection() as conn:
+            try:
+                version = change_version(conn)
+            except sqlite3.OperationalError:  # 변경 로그 이전 DB → 캐시 안 함
+                version = None
+            self.cache.sync(version)
+            yield conn, version
+
+    def _cached(self, key, fetch):
+        # 변경 버전 확인 (쿼리 1개) 뒤에 캐시 조회 → 바뀌었으면 여기서 이미 빈 캐시
+        with self._read() as (conn, version):
+            value = self.cache.get(key)
+            if value is _LRUCache.MISSING:
+                value = fetch(conn)
+                if version is not None:
+                    self.cache.put(key, value, version)
+        return value
+
+    def generation(self) -> Optional[int]:
+        """닫힌 generation 중 마지막 (db_utils.current_generation, 변경 로그 이전 DB는 None)"""
+        with self._read() as (conn, version):
+            return None if version is None else current_generation(conn)
+
+    def get_node(self, node_id: str) -> Optional[dict]:
+        return self.get_many([node_id]).get(node_id)
+
+    def get_many(self, node_ids: Iterable[str]) -> Dict[str, dict]:
+        """→ {id: node} (없는 ID는 빠짐, 캐시에 없는 것만 IN (...)으로 묶어 조회)"""
+        node_ids = list(dict.fromkeys(node_ids))
+        with self._read() as (conn, version):
+            found, missing = {}, []
+            for node_id in node_ids:
+                value = self.cache.get(('node', node_id))
+                if value is _LRUCache.MISSING:
+                    missing.append(node_id)
+                elif value is not None:
+                    found[node_id] = value
+
+            fetched = {}
+            for i in range(0, len(missing), BATCH):
+                batch = missing[i:i + BATCH]
+                if len(batch) == 1:
+                    rows = conn.execute(NODE_SQL, batch)
+                else:
+                    rows = conn.execute(
+                        f"SELECT {', '.join(NODE_FIELDS)} FROM nodes WHERE id IN ({', '.join('?' * len(batch))})",
+                        batch)
+                fetched.update((row[0], _node(row)) for row in rows)
+
+            if version is not None:
+                for node_id in missing:
+                    self.cache.put(('node', node_id), fetched.get(node_id), version)  # 없음(None)도 캐시
+        found.update(fetched)
+        return {node_id: found[node_id] for node_id in node_ids if node_id in found}
+
+    def get_subtree(self, root_id: str, max_depth: int = None) -> List[dict]:
+        """root 포함 하위 노드 (문서 순서, 각 노드에 'depth': root = 0) → root가 없으면 []"""
+        def fetch(conn):
+            sql = SUBTREE_SQL if _numbered(conn, root_id) else SUBTREE_CTE_SQL
+            return [_tree_node(row) for row in conn.execute(sql, {'root': root_id, 'max_depth': max_depth})]
+        return self._cached(('subtree', root_id, max_depth), fetch)
+
+    def get_children(self, node_id: str) -> List[dict]:
+        return self.get_subtree(node_id, max_depth=1)[1:]
+
+    def get_ancestors(self, node_id: str) -> List[dict]:
+        """루트 → node 자신까지 (breadcrumb)"""
+        return self._cached(
+            ('ancestors', node_id),
+            lambda conn: [_node(row[:len(NODE_FIELDS)]) for row in conn.execute(ANCESTORS_SQL, (node_id,))])
+
+    def get_table(self, table_id: str) -> Optional[dict]:
+        """tables 행 + 'ancestors' (붙어 있는 Article까지의 breadcrumb)"""
+        def fetch(conn):
+            row = conn.execute(TABLE_SQL, (table_id,)).fetchone()
+            if row is None:
+                return None
+            table = _table(row)
+            table['ancestors'] = [_node(r[:len(NODE_FIELDS)])
+                                  for r in conn.execute(ANCESTORS_SQL, (table['parent_id'],))]
+            return table
+        return self._cached(('table', table_id), fetch)
+
+    def get_tables(self, root_id: str) -> List[dict]:
+        """root 하위 트리에 붙은 테이블 (ID 순)"""
+        def fetch(conn):
+            sql = SUBTREE_TABLES_SQL if _numbered(conn, root_id) else SUBTREE_TABLES_CTE_SQL
+            return [_table(row) for row in conn.execute(sql, (root_id,))]
+        return self._cached(('tables', root_id), fetch)
+
+    def get_cited_by(self, article_id: str) -> List[dict]:
+        """article_id를 참조하는 다른 Article의 간선 (ref_edges)"""
+        return self._cached(('cited_by', article_id), lambda conn: ref_graph.cited_by(conn, article_id))
+
+    def get_dependencies(self, article_id: str, hops: int = 1) -> List[tuple]:
+        """article_id가 hops단계 안에서 참조하는 Article → [(article, 최단 hops)]"""
+        return self._cached(('deps', article_id, hops),
+                            lambda conn: ref_graph.dependencies(conn, article_id, hops))
+
+    def search(self, query: str, limit: int = 20) -> List[dict]:
+        """search.search (ID trigram + bm25 본문)"""
+        return self._cached(('search', query, limit),
+                            lambda conn: fts_search.search(conn, query, limit))
+
+    def cache_info(self) -> dict:
+        return self.cache.info()
+
+
+_stores: Dict[Path, NodeStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(db_path: Path = DB_PATH) -> NodeStore:
+    """프로세스에서 DB 파일당 NodeStore 1개 (서버 / 여러 스크립트가 같은 풀과 캐시를 씀)"""
+    key = Path(db_path).resolve()
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = NodeStore(key)
+        return _stores[key]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='obc.db 읽기 API')
+    parser.add_argument('--db', type=Path, default=DB_PATH, help=f'SQLite DB (기본: {DB_PATH})')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('node').add_argument('id')
+    subtree = sub.add_parser('subtree')
+    subtree.add_argument('id')
+    subtree.add_argument('--depth', type=int)
+    sub.add_parser('ancestors').add_argument('id')
+    sub.add_parser('table').add_argument('id')
+    search = sub.add_parser('search')
+    search.add_argument('query')
+    search.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    with NodeStore(args.db, pool_size=1) as store:
+        if args.command == 'node':
+            node = store.get_node(args.id)
+            if node is None:
+                print(f"[ERROR] node not found: {args.id}")
+                return
+            for field in NODE_FIELDS:
+                print(f"  {field:12} {node[field]}")
+        elif args.command in ('subtree', 'ancestors'):
+            nodes = (store.get_subtree(args.id, args.depth) if args.command == 'subtree'
+                     else store.get_ancestors(args.id))
+            for depth, node in enumerate(nodes):
+                indent = node['depth'] if args.command == 'subtree' else depth
+                print(f"  {'  ' * indent}{node['id']:16} {node['type']:14} {node['title'] or ''}")
+            print(f"{len(nodes)} nodes")
+        elif args.command == 'table':
+            table = store.get_table(args.id)
+            if table is None:
+                print(f"[ERROR] table not found: {args.id}")
+                return
+            print(f"  {table['id']}: {table['title']} (page {table['page']}, {table['source']})")
+            print(f"  {' > '.join(n['id'] for n in table['ancestors'])}")
+            print(f"  html: {len(table['html'] or '')} chars")
+        elif args.command == 'search':
+            for r in store.search(args.query, args.limit):
+                print(f"{r['score']:9.2f} [{r['match']:4}] {r['id']:16} {r['title'] or ''}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+해석된 참조 그래프 (schema.sql 3절 ref_edges / ref_closure)
+- refs (파서가 뽑은 원본 참조)를 한 번 읽어 대상 ID를 nodes로 검증한 간선만 ref_edges에 저장
+    Sentence (2) 같은 상대 참조 ("2", "(2)")는 source Article 기준으로 해석
+    Table 참조는 tables.parent_id의 Article로 (같은 번호의 Article이 있어도 parent_id 우선)
+- 간선마다 양 끝의 Article (Clause 이하 노드 → 소속 Article)을 같이 저장
+    → "이 Article을 참조하는 곳" = ref_edges(target_article) 인덱스 조회
+    Section/Subsection 참조는 target_article이 그 노드 자신 (cited-by에는 나오지만 closure/deps에서는 제외)
+- ref_closure: Article → Article 최단 거리 (closure_hops 이내, 0이면 만들지 않음, 양 끝 모두 Article 레벨만)
+    → "이 Article이 N단계 안에서 의존하는 Article" = ref_closure PK 범위 조회
+       (N이 closure_hops보다 크면 ref_edges 재귀 CTE)
+
+임포트/저장 뒤에 build_ref_graph()를 같은 트랜잭션 안에서 1회 호출 (전체 재계산)
+
+사용법:
+    python ref_graph.py build --closure-hops 3
+    python ref_graph.py stats
+    python ref_graph.py cited-by 9.8.2.1
+    python ref_graph.py deps 9.8.2.1 --hops 2
+"""
+
+import argparse
+import re
+import sqlite3
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from db_utils import DB_PATH, ensure_schema, begin_generation, end_generation
+from patterns import id_sort_key
+from tree_builder import TYPE_LEVELS
+
+CLOSURE_HOPS = 3
+ARTICLE_LEVEL = TYPE_LEVELS['article']
+# closure / deps에 들어가는 노드 타입 (Section/Subsection 참조 제외)
+ARTICLE_TYPES = tuple(sorted(t for t, level in TYPE_LEVELS.items() if level == ARTICLE_LEVEL))
+
+# 문맥 없이 저장된 Sentence 참조 ("2", "(2)")
+RELATIVE_CLAUSE = re.compile(r'^\(?(\d+)\)?$')
+# "9.5.3.1.(2)(a)" → "9.5.3.1" (Clause가 별도 노드가 아닌 Part는 Article로)
+CLAUSE_SUFFIX = re.compile(r'(?:\.?\([0-9a-z]+\))+$')
+
+CITED_BY_SQL = '''
+    SELECT source_article, source_id, target_id, target_type FROM ref_edges
+    WHERE target_article = ? AND source_article != target_article
+    ORDER BY source_article, source_id
+'''
+
+CLOSURE_SQL = '''
+    SELECT target_article, hops FROM ref_closure
+    WHERE source_article = ? AND hops <= ?
+'''
+
+REACH_SQL = '''
+    WITH RECURSIVE reach(article, hops) AS (
+        SELECT :article, 0
+        UNION
+        SELECT e.target_article, r.hops + 1
+        FROM ref_edges e JOIN reach r ON e.source_article = r.article
+        JOIN nodes n ON n.id = e.target_article
+        WHERE r.hops < :hops AND n.type IN (%s)
+    )
+    SELECT article, MIN(hops) FROM reach
+    WHERE article != :article
+    GROUP BY article
+''' % ', '.join(f"'{t}'" for t in ARTICLE_TYPES)
+
+
+def article_of(node_id: str, nodes: Dict[str, Tuple[str, str]], memo: Dict[str, str]) -> str:
+    """Clause 이하 노드 → 소속 Article (Article 이상이면 자기 자신)"""
+    found = memo.get(node_id)
+    if found is None:
+        node_type, parent_id = nodes[node_id]
+        if TYPE_LEVELS.get(node_type, ARTICLE_LEVEL) > ARTICLE_LEVEL and parent_id in nodes:
+            found = article_of(parent_id, nodes, memo)
+        else:
+            found = node_id
+        memo[node_id] = found
+    return found
+
+
+def resolve_target(target: str, target_type: str, source_article: str,
+                   nodes: Dict[str, tuple], table_parents: Dict[str, str]):
+    """refs.target_id → nodes ID (해석 못 하면 None)
+
+    Clause 노드가 없으면 (Part 6-8, 10-12 JSON 임포트는 Article까지만 노드) 소속 Article
+    Table 참조는 tables.parent_id만 사용 ("Table 9.10.14.5."가 같은 번호의 Article로 가지 않도록 먼저 확인)
+    """
+    if target_type == 'table':
+        parent = table_parents.get(target) or table_parents.get(f'Table {target}')
+        return parent if parent in nodes else None
+    if target in nodes:
+        return target
+    match = RELATIVE_CLAUSE.match(target)
+    if match:
+        target = f"{source_article}.({match.group(1)})"
+        if target in nodes:
+            return target
+    article = CLAUSE_SUFFIX.sub('', target)
+    if article != target and article in nodes:
+        return article
+    return None
+
+
+def closure(edges: Dict[str, set], max_hops: int) -> List[Tuple[str, str, int]]:
+    """Article 인접 목록 → [(source, target, 최단 hops)] (max_hops 이내, 자기 자신 제외)"""
+    rows = []
+    for source in edges:
+        seen = {source}
+        frontier = [source]
+        for hops in range(1, max_hops + 1):
+            nxt = []
+            for article in frontier:
+                for target in edges.get(article, ()):
+                    if target not in seen:
+                        seen.add(target)
+                        nxt.append(target)
+                        rows.append((source, target, hops))
+            if not nxt:
+                break
+            frontier = nxt
+    return rows
+
+
+def build_ref_graph(cursor, closure_hops: int = CLOSURE_HOPS) -> dict:
+    """refs → ref_edges / ref_closure 전체 재계산 (호출하는 쪽 트랜잭션 안에서)
+
+    Returns:
+        {'refs', 'edges', 'unresolved', 'closure'}
+    """
+    cursor.execute("SELECT id, type, parent_id FROM nodes")
+    nodes = {node_id: (node_type, parent_id) for node_id, node_type, parent_id in cursor}
+    cursor.execute("SELECT id, parent_id FROM tables WHERE parent_id IS NOT NULL")
+    table_parents = dict(cursor.fetchall())
+    memo = {}
+
+    cursor.execute("SELECT source_id, target_id, target_type FROM refs")
+    refs = cursor.fetchall()
+
+    edges = {}
+    unresolved = 0
+    for source_id, target, target_type in refs:
+        if source_id not in nodes:
+            unresolved += 1
+            continue
+        source_article = article_of(source_id, nodes, memo)
+        target_id = resolve_target(target, target_type, source_article, nodes, table_parents)
+        if target_id is None:
+            unresolved += 1
+            continue
+        edges.setdefault((source_id, target_id),
+                         (source_id, target_id, target_type, source_article, article_of(target_id, nodes, memo)))
+
+    cursor.execute("DELETE FROM ref_edges")
+    cursor.executemany('''
+        INSERT INTO ref_edges (source_id, target_id, target_type, source_article, target_article)
+        VALUES (?, ?, ?, ?, ?)
+    ''', edges.values())
+
+    # Article → Article만 (Section/Subsection 참조나 Subsection content의 참조는 closure에서 제외)
+    adjacency = defaultdict(set)
+    for _, _, _, source_article, target_article in edges.values():
+        if source_article != target_article and nodes[source_article][0] in ARTICLE_TYPES \
+                and nodes[target_article][0] in ARTICLE_TYPES:
+            adjacency[source_article].add(target_article)
+    closure_rows = closure(adjacency, closure_hops) if closure_hops > 0 else []
+
+    cursor.execute("DELETE FROM ref_closure")
+    cursor.executemany("INSERT INTO ref_closure (source_article, target_article, hops) VALUES (?, ?, ?)",
+                       closure_rows)
+    cursor.execute("DELETE FROM ref_graph_info")
+    cursor.execute("INSERT INTO ref_graph_info (closure_hops, edges, unresolved) VALUES (?, ?, ?)",
+                   (closure_hops, len(edges), unresolved))
+
+    return {'refs': len(refs), 'edges': len(edges), 'unresolved': unresolved, 'closure': len(closure_rows)}
+
+
+def closure_hops(conn: sqlite3.Connection) -> int:
+    """ref_closure를 만든 최대 거리 (그래프가 없거나 이전 DB면 0)"""
+    try:
+        row = conn.execute("SELECT closure_hops FROM ref_graph_info").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+
+def cited_by(conn: sqlite3.Connection, article_id: str) -> List[dict]:
+    """article_id (또는 그 Clause)를 참조하는 다른 Article의 간선 (Article 순)"""
+    return [{'source_article': a, 'source_id': s, 'target_id': t, 'target_type': tt}
+            for a, s, t, tt in conn.execute(CITED_BY_SQL, (article_id,))]
+
+
+def dependencies(conn: sqlite3.Connection, article_id: str, hops: int = 1) -> List[Tuple[str, int]]:
+    """article_id가 hops단계 안에서 참조하는 Article → [(article, 최단 hops)] (hops, ID 순)"""
+    if hops <= closure_hops(conn):
+        rows = conn.execute(CLOSURE_SQL, (article_id, hops)).fetchall()
+    else:
+        rows = conn.execute(REACH_SQL, {'article': article_id, 'hops': hops}).fetchall()
+    return sorted(rows, key=lambda row: (row[1], id_sort_key(row[0])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='해석된 참조 그래프 (ref_edges / ref_closure)')
+    parser.add_argument('--db', type=Path, default=DB_PATH, help=f'SQLite DB (기본: {DB_PATH})')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help='refs에서 다시 만들기')
+    build.add_argument('--closure-hops', type=int, default=CLOSURE_HOPS, help='0이면 ref_closure 생략')
+    sub.add_parser('stats')
+    sub.add_parser('cited-by').add_argument('article')
+    deps = sub.add_parser('deps')
+    deps.add_argument('article')
+    deps.add_argument('--hops', type=int, default=1)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db, isolation_level=None)
+
+    if args.command == 'build':
+        ensure_schema(conn)
+        t0 = time.perf_counter()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        generation = begin_generation(cursor, 'ref_graph build')  # query.NodeStore 캐시 무효화
+        stats = build_ref_graph(cursor, args.closure_hops)
+        end_generation(cursor, generation)
+        cursor.execute("COMMIT")
+        print(f"[OK] {stats['refs']} refs → {stats['edges']} edges ({stats['unresolved']} unresolved), "
+              f"{stats['closure']} closure rows (≤{args.closure_hops} hops) in {time.perf_counter() - t0:.2f}s")
+    elif args.command == 'stats':
+        row = conn.execute("SELECT closure_hops, edges, unresolved FROM ref_graph_info").fetchone()
+        if row is None:
+            print("[ERROR] ref graph not built. Run: python ref_graph.py build")
+        else:
+            print(f"edges: {row[1]} ({row[2]} unresolved refs), closure: ≤{row[0]} hops")
+            for target_type, count in conn.execute(
+                    "SELECT target_type, COUNT(*) FROM ref_edges GROUP BY target_type ORDER BY 2 DESC"):
+                print(f"  {target_type or '-':12} {count:7}")
+            print("most cited:")
+            for article, count in conn.execute('''
+                SELECT target_article, COUNT(DISTINCT source_article) FROM ref_edges
+                WHERE source_article != target_article
+                GROUP BY target_article ORDER BY 2 DESC LIMIT 10
+            '''):
+                print(f"  {article:16} {count:5}")
+    elif args.command == 'cited-by':
+        rows = cited_by(conn, args.article)
+        for r in rows:
+            print(f"  {r['source_article']:16} {r['source_id']:20} → {r['target_id']} ({r['target_type']})")
+        print(f"{len({r['source_article'] for r in rows})} articles cite {args.article}")
+    elif args.command == 'deps':
+        rows = dependencies(conn, args.article, args.hops)
+        for article, hops in rows:
+            print(f"  {hops}  {article}")
+        print(f"{len(rows)} articles within {args.hops} hops of {args.article}")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -36,6 +36,14 @@ CREATE TABLE IF NOT EXISTS nodes (
     page INTEGER,                   -- PDF 페이지 번호
     seq INTEGER,                    -- 형제 노드 중 순서 (1, 2, 3...)
 
+    content_hash TEXT,              -- title + content 해시 (db_utils.content_hash, 쓰는 쪽에서 계산, NULL = 다시 계산)
+
+    -- 트리 번호 (db_utils.number_tree가 저장 때 Part마다 DFS 1회로 계산)
+    -- number_tree 없이 넣거나 옮긴 노드는 NULL (nodes_tree_* 트리거) → 그 Part는 query.py가 재귀 CTE로 조회
+    path TEXT,                      -- "0009/0001/0008/0002": Part 번호 + 형제 순번(seq 순), 정렬 = 문서 순서
+    lft INTEGER,                    -- nested set (Part 안에서): 하위 노드 = part 같고 lft BETWEEN lft AND rgt
+    rgt INTEGER,
+
     FOREIGN KEY (parent_id) REFERENCES nodes(id)
 );
 
@@ -76,52 +84,190 @@ CREATE TABLE IF NOT EXISTS refs (
     FOREIGN KEY (source_id) REFERENCES nodes(id)
 );
 
+-- 해석된 참조 그래프 (ref_graph.build_ref_graph가 refs에서 전체 재계산, 저장/임포트 후 1회)
+--   ref_edges   : 대상이 nodes에 있는 참조만, 양 끝의 Article (Clause 이하 → 소속 Article) 포함
+--                 (Section/Subsection 참조는 target_article = 그 노드 자신)
+--   ref_closure : Article → Article 최단 거리 (ref_graph_info.closure_hops 이내, Section/Subsection 제외)
+
+CREATE TABLE IF NOT EXISTS ref_edges (
+    source_id TEXT NOT NULL,        -- "9.5.3.1.(1)"
+    target_id TEXT NOT NULL,        -- "9.5.3.2.(2)" - nodes에 있는 ID
+    target_type TEXT,               -- refs.target_type
+    source_article TEXT NOT NULL,   -- "9.5.3.1"
+    target_article TEXT NOT NULL,   -- "9.5.3.2"
+    PRIMARY KEY (source_id, target_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS ref_closure (
+    source_article TEXT NOT NULL,
+    target_article TEXT NOT NULL,
+    hops INTEGER NOT NULL,          -- 1 = 직접 참조
+    PRIMARY KEY (source_article, target_article)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS ref_graph_info (
+    closure_hops INTEGER NOT NULL,  -- 0 = ref_closure 없음
+    edges INTEGER,
+    unresolved INTEGER              -- 대상을 찾지 못해 버린 refs 행 수
+);
+
 -- ============================================================
--- 4. search_index (FTS5 전문 검색)
+-- 4. search_index (FTS5 전문 검색, external content)
 -- ============================================================
+-- 텍스트는 nodes에만 저장하고 FTS에는 역색인만 둠 (content='search_source')
+--   search_source: nodes를 FTS 컬럼 이름(node_id)으로 보여주는 view, rowid = nodes.rowid
+--   SELECT node_id, title, content / snippet() / highlight()는 view에서 읽음
+-- 주의: external content는 nodes와 어긋나도 스스로 알 수 없음
+--   → nodes를 트리거 없이 고친 뒤에는 python fts_index.py rebuild (search_index + search_ids)
+--   → VACUUM은 nodes rowid를 다시 매길 수 있으므로 VACUUM 후에도 rebuild
+
+CREATE VIEW IF NOT EXISTS search_source AS
+    SELECT rowid AS node_rowid, id AS node_id, title, content FROM nodes;
 
 CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
     node_id,
     title,
     content,
-    tokenize='porter unicode61'
+    content='search_source',
+    content_rowid='node_rowid',
+    tokenize='porter unicode61',
+    prefix='2 3'                    -- 2~3글자 접두어 색인: "ve*", "gua*"가 색인 조회 1회 (4글자 이상은 term 범위가 좁음)
+);
+
+-- ID 부분 검색용 trigram 색인 ("9.8.2" → 9.8.2, 9.8.2.1, 9.8.20 ...)
+--   search_ids WHERE node_id LIKE '%9.8.2%'가 nodes 전체 스캔 대신 trigram 조회 (3글자 이상)
+CREATE VIRTUAL TABLE IF NOT EXISTS search_ids USING fts5(
+    node_id,
+    content='search_source',
+    content_rowid='node_rowid',
+    tokenize='trigram'
 );
 
 -- ============================================================
 -- 5. 동기화 트리거 (nodes 변경 시 search_index 자동 업데이트)
 -- ============================================================
+-- external content 삭제는 'delete' 명령 + 색인했던 값 그대로 (old.*)
 
 -- INSERT 트리거
 CREATE TRIGGER IF NOT EXISTS nodes_ai AFTER INSERT ON nodes BEGIN
-    INSERT INTO search_index(node_id, title, content)
-    VALUES (new.id, new.title, new.content);
+    INSERT INTO search_index(rowid, node_id, title, content)
+    VALUES (new.rowid, new.id, new.title, new.content);
+    INSERT INTO search_ids(rowid, node_id) VALUES (new.rowid, new.id);
+END;
+
+-- UPDATE 트리거 (색인 대상 컬럼이 바뀐 경우만)
+CREATE TRIGGER IF NOT EXISTS nodes_au AFTER UPDATE ON nodes
+WHEN old.id IS NOT new.id OR old.title IS NOT new.title OR old.content IS NOT new.content
+BEGIN
+    INSERT INTO search_index(search_index, rowid, node_id, title, content)
+    VALUES ('delete', old.rowid, old.id, old.title, old.content);
+    INSERT INTO search_index(rowid, node_id, title, content)
+    VALUES (new.rowid, new.id, new.title, new.content);
 END;
 
--- UPDATE 트리거
-CREATE TRIGGER IF NOT EXISTS nodes_au AFTER UPDATE ON nodes BEGIN
-    UPDATE search_index
-    SET title = new.title, content = new.content
-    WHERE node_id = new.id;
+CREATE TRIGGER IF NOT EXISTS nodes_id_au AFTER UPDATE OF id ON nodes
+WHEN old.id IS NOT new.id
+BEGIN
+    INSERT INTO search_ids(search_ids, rowid, node_id) VALUES ('delete', old.rowid, old.id);
+    INSERT INTO search_ids(rowid, node_id) VALUES (new.rowid, new.id);
 END;
 
 -- DELETE 트리거
 CREATE TRIGGER IF NOT EXISTS nodes_ad AFTER DELETE ON nodes BEGIN
-    DELETE FROM search_index WHERE node_id = old.id;
+    INSERT INTO search_index(search_index, rowid, node_id, title, content)
+    VALUES ('delete', old.rowid, old.id, old.title, old.content);
+    INSERT INTO search_ids(search_ids, rowid, node_id) VALUES ('delete', old.rowid, old.id);
+END;
+
+-- ============================================================
+-- 6. 변경 로그 (증분 후처리용)
+-- ============================================================
+-- generations : 저장/임포트 1회 = generation 1개 (db_utils.begin_generation ~ end_generation)
+-- node_changes: generation마다 바뀐 노드 (op = 'insert' | 'update' | 'delete')
+--   → FTS 갱신 / validate_part.py / JSON export가 "generation N 이후 바뀐 노드"만 처리
+-- 트리거를 잠시 내리는 대량 저장(save_to_db, import_part_json)은 직접 diff해서 기록
+-- begin_generation 없이 쓰는 경우 (UPDATE 직접 실행, 이전 스크립트): 로그 트리거가 generation을 새로 열고 기록
+--   → 열린 generation (closed_at IS NULL)은 다음 begin_generation이 닫을 때까지 이후 변경도 모음
+--   → db_utils.current_generation은 닫힌 generation까지만 (열린 쪽 변경은 changed_since에 계속 나옴)
+
+CREATE TABLE IF NOT EXISTS generations (
+    generation INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT,                    -- "parse_part9", "import_part_json part8.json", "sql" (트리거가 연 것) ...
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    closed_at TEXT                  -- NULL = 아직 기록 중
+);
+
+CREATE TABLE IF NOT EXISTS node_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    generation INTEGER NOT NULL,
+    node_id TEXT NOT NULL,
+    op TEXT NOT NULL                -- "insert" | "update" | "delete"
+);
+
+CREATE TRIGGER IF NOT EXISTS nodes_log_ai AFTER INSERT ON nodes BEGIN
+    INSERT INTO generations (source) SELECT 'sql' WHERE NOT EXISTS (SELECT 1 FROM generations WHERE closed_at IS NULL);
+    INSERT INTO node_changes(generation, node_id, op)
+    VALUES ((SELECT MAX(generation) FROM generations WHERE closed_at IS NULL), new.id, 'insert');
+END;
+
+-- 내용이나 트리 위치가 실제로 바뀐 UPDATE만 기록
+CREATE TRIGGER IF NOT EXISTS nodes_log_au AFTER UPDATE ON nodes
+WHEN old.title IS NOT new.title OR old.content IS NOT new.content
+  OR old.type IS NOT new.type OR old.parent_id IS NOT new.parent_id
+  OR old.seq IS NOT new.seq OR old.page IS NOT new.page
+BEGIN
+    INSERT INTO generations (source) SELECT 'sql' WHERE NOT EXISTS (SELECT 1 FROM generations WHERE closed_at IS NULL);
+    INSERT INTO node_changes(generation, node_id, op)
+    VALUES ((SELECT MAX(generation) FROM generations WHERE closed_at IS NULL), new.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS nodes_log_ad AFTER DELETE ON nodes BEGIN
+    INSERT INTO generations (source) SELECT 'sql' WHERE NOT EXISTS (SELECT 1 FROM generations WHERE closed_at IS NULL);
+    INSERT INTO node_changes(generation, node_id, op)
+    VALUES ((SELECT MAX(generation) FROM generations WHERE closed_at IS NULL), old.id, 'delete');
+END;
+
+-- content_hash는 Python 쪽 (db_utils.content_hash)에서 계산
+-- → 해시를 같이 쓰지 않고 title/content만 바꾼 UPDATE는 NULL로 (다음 ensure_change_log가 다시 채움)
+CREATE TRIGGER IF NOT EXISTS nodes_hash_au AFTER UPDATE OF title, content ON nodes
+WHEN (old.title IS NOT new.title OR old.content IS NOT new.content)
+  AND new.content_hash IS old.content_hash AND new.content_hash IS NOT NULL
+BEGIN
+    UPDATE nodes SET content_hash = NULL WHERE rowid = new.rowid;
+END;
+
+-- 트리 번호 (path / lft / rgt)는 number_tree만 계산
+-- → 부모 / 순서 / Part를 바꾼 노드, 부모가 지워진 노드는 번호를 지움 (다음 ensure_tree_numbers가 다시 매김)
+CREATE TRIGGER IF NOT EXISTS nodes_tree_au AFTER UPDATE OF parent_id, seq, part ON nodes
+WHEN (old.parent_id IS NOT new.parent_id OR old.seq IS NOT new.seq OR old.part IS NOT new.part)
+  AND new.lft IS NOT NULL
+BEGIN
+    UPDATE nodes SET path = NULL, lft = NULL, rgt = NULL WHERE rowid = new.rowid;
+END;
+
+CREATE TRIGGER IF NOT EXISTS nodes_tree_ad AFTER DELETE ON nodes BEGIN
+    UPDATE nodes SET path = NULL, lft = NULL, rgt = NULL WHERE parent_id = old.id AND lft IS NOT NULL;
 END;
 
 -- ============================================================
--- 6. 인덱스
+-- 7. 인덱스
 -- ============================================================
 
 CREATE INDEX IF NOT EXISTS idx_nodes_parent ON nodes(parent_id);
 CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type);
 CREATE INDEX IF NOT EXISTS idx_nodes_part ON nodes(part);
 CREATE INDEX IF NOT EXISTS idx_nodes_seq ON nodes(parent_id, seq);
+CREATE INDEX IF NOT EXISTS idx_nodes_lft ON nodes(part, lft);
+CREATE INDEX IF NOT EXISTS idx_nodes_path ON nodes(path);
 
 CREATE INDEX IF NOT EXISTS idx_tables_parent ON tables(parent_id);
 
 CREATE INDEX IF NOT EXISTS idx_refs_source ON refs(source_id);
 CREATE INDEX IF NOT EXISTS idx_refs_target ON refs(target_id);
+CREATE INDEX IF NOT EXISTS idx_ref_edges_target ON ref_edges(target_article);
+CREATE INDEX IF NOT EXISTS idx_ref_edges_source ON ref_edges(source_article);
+
+CREATE INDEX IF NOT EXISTS idx_node_changes_generation ON node_changes(generation);
 
 -- ============================================================
 -- 완료
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+obc.db 검색 API (search_index + search_ids, schema.sql 4절)
+- ID처럼 생긴 단어 ("9.8.2", "9.10.17.5A."): nodes PK 범위 조회 (접두어) + search_ids trigram (부분 일치)
+- 나머지 단어: search_index MATCH, 2글자 이상은 접두어 검색 ("gua" → "gua"*, prefix 색인 조회)
+- 순위: 웹 앱 searchCode와 같은 우선순위 id > title > content
+    ID 일치 (정확 > 접두어 > 부분) → 그다음 bm25(search_index, BM25_WEIGHTS)
+
+사용법:
+    python search.py "guard height"
+    python search.py 9.8.2 --limit 20
+    python search.py "smoke ala" --plan      # 실행한 SQL의 query plan 출력 (색인 조회인지 확인)
+"""
+
+import argparse
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, List
+
+from db_utils import DB_PATH
+from patterns import id_sort_key
+
+# bm25 컬럼 가중치 (node_id, title, content) - searchCode의 100 / 30 / 10 비율
+BM25_WEIGHTS = (10.0, 3.0, 1.0)
+
+# ID 일치 점수 (bm25 점수 -bm25()보다 항상 위)
+ID_EXACT_SCORE = 3000.0
+ID_PREFIX_SCORE = 2000.0
+ID_CONTAINS_SCORE = 1000.0
+
+ID_TERM = re.compile(r'^\d+(?:\.[0-9A-Za-z()]+)+\.?$')
+WORD = re.compile(r'\w+')
+
+SNIPPET_TOKENS = 16
+
+
+def split_query(query: str) -> tuple:
+    """→ (ID 단어 목록, 본문 단어 목록)"""
+    ids, words = [], []
+    for term in query.split():
+        if ID_TERM.match(term):
+            ids.append(term.rstrip('.'))
+        else:
+            words.extend(WORD.findall(term))
+    return ids, words
+
+
+def match_expression(words: List[str]) -> str:
+    """본문 단어 → FTS5 MATCH 식 (모든 단어 AND, 2글자 이상은 접두어)"""
+    return ' '.join(f'"{w}"*' if len(w) >= 2 else f'"{w}"' for w in words)
+
+
+class _Plan:
+    """--plan: 실행하는 SQL마다 EXPLAIN QUERY PLAN 출력"""
+
+    def __init__(self, conn: sqlite3.Connection, enabled: bool):
+        self.conn = conn
+        self.enabled = enabled
+
+    def execute(self, sql: str, params=()):
+        if self.enabled:
+            print(f"  plan: {' '.join(sql.split())[:90]}")
+            for row in self.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params):
+                print(f"    {row[-1]}")
+        return self.conn.execute(sql, params)
+
+
+def search_ids(conn: sqlite3.Connection, fragment: str, limit: int = 50, plan: bool = False) -> List[Dict]:
+    """ID 부분 검색 → [{'id', 'title', 'score', 'match'}] (정확 > 접두어 > 부분, 같은 등급은 ID 순)"""
+    db = _Plan(conn, plan)
+    hits: Dict[str, tuple] = {}
+
+    # 정확 + 접두어: nodes PK 범위 ("9.8.2" <= id < "9.8.2\uffff")
+    for node_id, title in db.execute(
+            "SELECT id, title FROM nodes WHERE id >= ? AND id < ? LIMIT ?",
+            (fragment, fragment + '\uffff', limit + 1)):
+        score = ID_EXACT_SCORE if node_id == fragment else ID_PREFIX_SCORE
+        hits[node_id] = (score, title)
+
+    # 부분 일치: trigram 색인 (3글자 미만은 trigram으로 찾을 수 없음)
+    if len(fragment) >= 3 and len(hits) < limit:
+        # ID_TERM에는 %, _가 없으므로 ESCAPE 불필요 (ESCAPE가 붙으면 FTS5가 LIKE를 색인으로 처리하지 못함)
+        # CROSS JOIN: search_ids를 바깥 루프로 고정 (ANALYZE 통계가 있으면 nodes 전체 SCAN을 고르기도 함)
+        for node_id, title in db.execute(
+                "SELECT n.id, n.title FROM search_ids s CROSS JOIN nodes n ON n.rowid = s.rowid "
+                "WHERE s.node_id LIKE ? LIMIT ?",
+                (f'%{fragment}%', limit * 4)):
+            hits.setdefault(node_id, (ID_CONTAINS_SCORE, title))
+
+    ranked = sorted(hits.items(), key=lambda h: (-h[1][0], id_sort_key(h[0])))[:limit]
+    return [{'id': node_id, 'title': title, 'snippet': None, 'score': score, 'match': 'id'}
+            for node_id, (score, title) in ranked]
+
+
+def search_text(conn: sqlite3.Connection, words: List[str], limit: int = 50,
+                plan: bool = False) -> List[Dict]:
+    """본문 검색 (bm25 가중치) → [{'id', 'title', 'snippet', 'score', 'match'}]"""
+    if not words:
+        return []
+    db = _Plan(conn, plan)
+    weights = ', '.join(str(w) for w in BM25_WEIGHTS)
+    rows = db.execute(f'''
+        SELECT node_id, title, snippet(search_index, 2, '**', '**', '...', {SNIPPET_TOKENS}),
+               bm25(search_index, {weights}) AS score
+        FROM search_index WHERE search_index MATCH ?
+        ORDER BY score LIMIT ?
+    ''', (match_expression(words), limit)).fetchall()
+    return [{'id': node_id, 'title': title, 'snippet': snippet, 'score': -score, 'match': 'text'}
+            for node_id, title, snippet, score in rows]
+
+
+def search(conn: sqlite3.Connection, query: str, limit: int = 50, plan: bool = False) -> List[Dict]:
+    """ID 일치 먼저, 그다음 본문 (bm25) - 같은 노드는 한 번만"""
+    ids, words = split_query(query)
+
+    results: Dict[str, Dict] = {}
+    for fragment in ids:
+        for hit in search_ids(conn, fragment, limit, plan):
+            results.setdefault(hit['id'], hit)
+    for hit in search_text(conn, words, limit, plan):
+        results.setdefault(hit['id'], hit)
+
+    return sorted(results.values(), key=lambda r: -r['score'])[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='obc.db 검색 (ID trigram + bm25 본문)')
+    parser.add_argument('query')
+    parser.add_argument('--db', type=Path, default=DB_PATH, help=f'SQLite DB (기본: {DB_PATH})')
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--plan', action='store_true', help='실행한 SQL의 query plan 출력')
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(f'file:{args.db}?mode=ro', uri=True)
+    results = search(conn, args.query, args.limit, args.plan)
+    conn.close()
+
+    for r in results:
+        print(f"{r['score']:9.2f} [{r['match']:4}] {r['id']:16} {r['title'] or ''}")
+        if r['snippet']:
+            print(f"{'':32}{' '.join(r['snippet'].split())[:100]}")
+    print(f"{len(results)} results")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,9 +4,10 @@ OBC 파싱 결과를 계층적 트리로 구축
 특수 패턴 (Alternative Subsection, Article Suffix 등) 처리 포함
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, List
-from patterns import extract_references
+import sys
+from array import array
+from typing import Optional, Dict, List, Iterator, Tuple
+from patterns import scan_references, parent_from_id
 
 # 타입별 레벨 (특수 타입 포함)
 TYPE_LEVELS = {
@@ -23,20 +24,118 @@ TYPE_LEVELS = {
     'subsubclause': 6,
 }
 
+# 참조 종류 (interned, Node.refs 키)
+_REF_KINDS = {k: sys.intern(k) for k in ('tables', 'clauses', 'articles', 'sections', 'subsections')}
+
+# nodes 테이블 컬럼 순서 (iter_rows가 내보내는 튜플 순서)
+NODE_COLUMNS = ('id', 'type', 'part', 'parent_id', 'title', 'content', 'page', 'seq')
+
+
+class TreeIndex:
+    """노드 인덱스 ↔ ID와 parent/children 링크 (정수 배열, -1 = 없음)
+
+    children은 first_child / last_child / next_sibling 연결 리스트
+    → 노드마다 list를 두지 않고 추가 순서 유지
+    """
+    __slots__ = ('ids', 'parent', 'first_child', 'last_child', 'next_sibling')
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.parent = array('i')
+        self.first_child = array('i')
+        self.last_child = array('i')
+        self.next_sibling = array('i')
+
+    def add(self, node_id: str, parent_idx: int) -> int:
+        """새 인덱스 할당 후 parent의 마지막 자식으로 연결"""
+        idx = len(self.ids)
+        self.ids.append(node_id)
+        self.parent.append(parent_idx)
+        self.first_child.append(-1)
+        self.last_child.append(-1)
+        self.next_sibling.append(-1)
+        if parent_idx >= 0:
+            last = self.last_child[parent_idx]
+            if last < 0:
+                self.first_child[parent_idx] = idx
+            else:
+                self.next_sibling[last] = idx
+            self.last_child[parent_idx] = idx
+        return idx
+
+    def children(self, idx: int) -> List[str]:
+        result = []
+        child = self.first_child[idx]
+        while child >= 0:
+            result.append(self.ids[child])
+            child = self.next_sibling[child]
+        return result
+
 
-@dataclass
 class Node:
-    """트리의 노드"""
-    id: str
-    type: str
-    part: int = 9
-    parent_id: Optional[str] = None
-    title: Optional[str] = None
-    content: Optional[str] = None
-    page: int = 0
-    seq: int = 0
-    children: List[str] = field(default_factory=list)
-    refs: Dict = field(default_factory=dict)
+    """트리의 노드
+
+    __slots__ + parent/children은 TreeIndex 배열에 저장 (노드당 dict/list 없음)
+    refs는 (ref_type, target, ref_type, target, ...) 평탄 튜플로 보관 (참조 없으면 None)
+    """
+    __slots__ = ('id', 'type', 'part', 'title', 'content', 'page', 'seq', '_refs', '_tree', '_idx')
+
+    def __init__(self, id: str, type: str, part: int = 9, title: Optional[str] = None,
+                 content: Optional[str] = None, page: int = 0, seq: int = 0,
+                 refs: Optional[Dict] = None, tree: Optional[TreeIndex] = None, idx: int = -1):
+        self.id = id
+        self.type = sys.intern(type)
+        self.part = part
+        self.title = title
+        self.content = content
+        self.page = page
+        self.seq = seq
+        self._refs = None
+        self._tree = tree
+        self._idx = idx
+        if refs:
+            self.refs = refs
+
+    @property
+    def parent_id(self) -> Optional[str]:
+        if self._tree is None:
+            return None
+        parent = self._tree.parent[self._idx]
+        return self._tree.ids[parent] if parent >= 0 else None
+
+    @property
+    def children(self) -> List[str]:
+        if self._tree is None:
+            return []
+        return self._tree.children(self._idx)
+
+    @property
+    def refs(self) -> Dict[str, List[str]]:
+        """{'tables': [...], 'clauses': [...], ...} (참조가 있는 타입만)"""
+        result: Dict[str, List[str]] = {}
+        flat = self._refs or ()
+        for i in range(0, len(flat), 2):
+            result.setdefault(flat[i], []).append(flat[i + 1])
+        return result
+
+    @refs.setter
+    def refs(self, value: Dict[str, List[str]]):
+        flat = []
+        for ref_type, ref_list in value.items():
+            ref_type = sys.intern(ref_type)
+            for ref in ref_list:
+                flat.append(ref_type)
+                flat.append(sys.intern(ref))
+        self._refs = tuple(flat) or None
+
+    def iter_refs(self) -> Iterator[Tuple[str, str]]:
+        """(ref_type, target) 쌍"""
+        flat = self._refs or ()
+        for i in range(0, len(flat), 2):
+            yield flat[i], flat[i + 1]
+
+    def __repr__(self):
+        return f"Node({self.id!r}, {self.type!r}, parent={self.parent_id!r}, seq={self.seq})"
 
 
 class TreeBuilder:
@@ -45,6 +144,7 @@ class TreeBuilder:
     def __init__(self, part_num: int = 9):
         self.part_num = part_num
         self.nodes: Dict[str, Node] = {}
+        self.tree = TreeIndex()
         self.context_stack: List[str] = []
         self.seq_counters: Dict[str, int] = {}
 
@@ -54,7 +154,7 @@ class TreeBuilder:
 
     def _find_parent_from_id(self, node_type: str, node_id: str) -> Optional[str]:
         """
-        ID에서 parent 추출
+        ID에서 parent 추출 (patterns.parse_id 캐시 사용, 모든 Part 번호)
 
         9.1.1 → 9.1 (Section)
         9.1.1.1 → 9.1.1 (Subsection)
@@ -62,45 +162,7 @@ class TreeBuilder:
         9.5.3A.1 → 9.5.3A (Alt Subsection)
         9.5.1.1A → 9.5.1 (Subsection)
         """
-        import re
-
-        # 일반 Subsection: 9.1.1 → 9.1
-        if node_type == 'subsection':
-            m = re.match(r'^(\d+\.\d+)\.\d+$', node_id)
-            if m:
-                return m.group(1)
-
-        # 일반 Article: 9.1.1.1 → 9.1.1
-        elif node_type == 'article':
-            m = re.match(r'^(\d+\.\d+\.\d+)\.\d+$', node_id)
-            if m:
-                return m.group(1)
-
-        # Alt Subsection: 9.5.3A → 9.5
-        elif node_type == 'alt_subsection':
-            m = re.match(r'^(\d+\.\d+)\.\d+[A-Z]$', node_id)
-            if m:
-                return m.group(1)
-
-        # Sub-Article: 9.5.3A.1 → 9.5.3A
-        elif node_type == 'sub_article':
-            m = re.match(r'^(\d+\.\d+\.\d+[A-Z])\.\d+$', node_id)
-            if m:
-                return m.group(1)
-
-        # Article Suffix: 9.5.1.1A → 9.5.1
-        elif node_type == 'article_suffix':
-            m = re.match(r'^(\d+\.\d+\.\d+)\.\d+[A-Z]$', node_id)
-            if m:
-                return m.group(1)
-
-        # 0A Article: 9.33.6.10A → 9.33.6
-        elif node_type == 'article_0a':
-            m = re.match(r'^(\d+\.\d+\.\d+)\.\d+[A-Z]$', node_id)
-            if m:
-                return m.group(1)
-
-        return None
+        return parent_from_id(node_type, node_id)
 
     def _find_parent(self, node_type: str, node_id: str = '') -> Optional[str]:
         """
@@ -185,34 +247,77 @@ class TreeBuilder:
         # 2. 순서 번호 할당
         seq = self._get_next_seq(parent_id)
 
-        # 3. 노드 생성
+        # 3. 노드 생성 (parent/children 링크는 인덱스 배열에)
+        parent_idx = self.nodes[parent_id]._idx if parent_id in self.nodes else -1
         node = Node(
             id=node_id,
             type=node_type,
             part=self.part_num,
-            parent_id=parent_id,
             title=title,
             content=content,
             page=page,
-            seq=seq
+            seq=seq,
+            tree=self.tree,
+            idx=self.tree.add(node_id, parent_idx),
         )
 
-        # 4. 참조 추출
-        if content:
-            node.refs = extract_references(content)
-
-        # 5. 노드 저장
+        # 4. 노드 저장 (참조는 트리 구축 후 resolve_references()에서 한 번에)
         self.nodes[node_id] = node
 
-        # 6. 부모의 children에 추가
-        if parent_id and parent_id in self.nodes:
-            self.nodes[parent_id].children.append(node_id)
-
-        # 7. 스택 업데이트
+        # 5. 스택 업데이트
         self._update_stack(node_type, node_id)
 
         return node
 
+    def _clause_context(self, node: Node) -> Optional[str]:
+        """번호만 있는 clause 참조 "Sentence (2)"의 기준 ID (Article 자신 / clause의 parent)"""
+        level = self._get_level(node.type)
+        if level == 3:
+            return node.id
+        if level > 3:
+            return node.parent_id
+        return None
+
+    def resolve_references(self) -> Dict[str, int]:
+        """모든 노드 content를 한 번씩 스캔해 참조를 구체적인 노드 ID로 해석 (트리 구축 후 1회)
+
+        - Sentence (2) → 문맥 Article 기준 '9.5.3.1.(2)'
+        - Sentence 9.10.9.6.(1) → '9.10.9.6.(1)'
+        - Table / Article / Section / Subsection → ID 그대로 (모든 Part)
+        문맥 Article이 없는 clause 참조는 버림
+
+        Returns:
+            {'refs': 해석된 참조 수, 'unresolved': 버린 clause 참조 수,
+             'external': 이 트리에 없는 노드를 가리키는 참조 수 (다른 Part 등, Table 제외)}
+        """
+        stats = {'refs': 0, 'unresolved': 0, 'external': 0}
+        for node in self.nodes.values():
+            if not node.content:
+                node._refs = None
+                continue
+
+            flat = []
+            context = None
+            for kind, target, clause_article in scan_references(node.content):
+                if kind == 'clauses':
+                    base = clause_article
+                    if base is None:
+                        if context is None:
+                            context = self._clause_context(node) or ''
+                        base = context
+                    if not base:
+                        stats['unresolved'] += 1
+                        continue
+                    target = f"{base}.({target})"
+                if kind != 'tables' and target not in self.nodes:
+                    stats['external'] += 1
+                flat.append(_REF_KINDS[kind])
+                flat.append(sys.intern(target))
+
+            node._refs = tuple(flat) or None
+            stats['refs'] += len(flat) // 2
+        return stats
+
     def get_node(self, node_id: str) -> Optional[Node]:
         """노드 조회"""
         return self.nodes.get(node_id)
@@ -224,8 +329,26 @@ class TreeBuilder:
             return []
         return [self.nodes[child_id] for child_id in node.children if child_id in self.nodes]
 
+    def iter_rows(self, content_overrides: Optional[Dict[str, str]] = None) -> Iterator[Tuple]:
+        """nodes 테이블 행 튜플 (NODE_COLUMNS 순서) - 중간 dict 없이 executemany에 바로 전달
+
+        content_overrides: {node_id: content} - 트리는 그대로 두고 저장할 content만 교체
+        """
+        overrides = content_overrides or {}
+        for node in self.nodes.values():
+            content = overrides.get(node.id, node.content)
+            yield (node.id, node.type, node.part, node.parent_id,
+                   node.title, content, node.page, node.seq)
+
+    def iter_ref_rows(self) -> Iterator[Tuple[str, str, str]]:
+        """refs 테이블 행 튜플 (source_id, target_id, target_type)"""
+        for node in self.nodes.values():
+            if node._refs:
+                for ref_type, ref in node.iter_refs():
+                    yield (node.id, ref, ref_type.rstrip('s'))  # 'tables' -> 'table'
+
     def to_dict(self) -> Dict[str, Dict]:
-        """SQLite INSERT용 딕셔너리로 변환"""
+        """SQLite INSERT용 딕셔너리로 변환 (노드 전체 복사 - 대량 저장은 iter_rows 사용)"""
         result = {}
         for node_id, node in self.nodes.items():
             result[node_id] = {
@@ -6,12 +6,12 @@ Part JSON 검증 스크립트
 사용법:
     python scripts/validate_part.py codevault/public/data/part10.json
     python scripts/validate_part.py obc.db --db --part 10
+    python scripts/validate_part.py obc.db --db --part 10 --since 12   # generation 12 이후 바뀐 노드만
 """
 
 import json
 import re
 import sys
-import sqlite3
 import io
 
 # Windows 콘솔 인코딩 설정
@@ -20,6 +20,9 @@ from pathlib import Path
 from typing import List, Dict, Tuple
 from collections import defaultdict
 
+from db_utils import changed_since
+from query import NodeStore
+
 
 class ParsingValidator:
     def __init__(self):
@@ -44,30 +47,41 @@ class ParsingValidator:
 
         return self._report()
 
-    def validate_db(self, db_path: str, part: str) -> bool:
-        """SQLite DB에서 특정 Part 검증"""
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+    def validate_db(self, db_path: str, part: str, since: int = None) -> bool:
+        """SQLite DB에서 특정 Part 검증 (since: 이 generation 이후 바뀐 노드만)"""
+        store = NodeStore(db_path, pool_size=1)
 
         print(f"\n{'='*60}")
         print(f"Validating Part {part} from: {db_path}")
         print(f"{'='*60}")
 
-        # Part 번호로 시작하는 모든 노드 가져오기
-        cursor.execute(
-            "SELECT id, title, content FROM nodes WHERE id LIKE ?",
-            (f"{part}.%",)
-        )
-
-        for row in cursor.fetchall():
-            node_id, title, content = row
+        if since is None:
+            # Part 번호로 시작하거나 part 열이 같은 모든 노드 (Part 노드 자신 제외)
+            # 트리 순회가 아니라 ID/part로 고름 → 부모가 없거나 parent_id가 깨진 노드도 검증
+            with store.pool.connection() as conn:
+                nodes = [dict(zip(('id', 'title', 'content'), row)) for row in conn.execute(
+                    "SELECT id, title, content FROM nodes WHERE (id LIKE ? OR part = ?) AND id != ?",
+                    (f"{part}.%", int(part), str(part)))]
+            if not nodes:
+                print(f"[ERROR] Part {part}: no nodes in {db_path}")
+                store.close()
+                return False
+        else:
+            with store.pool.connection() as conn:
+                changed = changed_since(conn, since, int(part))
+            nodes = list(store.get_many(
+                node_id for node_id, op in changed.items() if op != 'delete' and node_id != str(part)).values())
+            print(f"Changed since generation {since}: {len(changed)} nodes "
+                  f"({sum(op == 'delete' for op in changed.values())} deleted)")
+
+        for node in nodes:
             self._validate_node({
-                'id': node_id,
-                'title': title or '',
-                'content': content or ''
+                'id': node['id'],
+                'title': node['title'] or '',
+                'content': node['content'] or ''
             })
 
-        conn.close()
+        store.close()
         return self._report()
 
     def _validate_node_recursive(self, node: Dict):
@@ -245,7 +259,7 @@ def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print("  python validate_part.py <json_file>")
-        print("  python validate_part.py <db_file> --db --part <part_number>")
+        print("  python validate_part.py <db_file> --db --part <part_number> [--since <generation>]")
         print("\nExamples:")
         print("  python validate_part.py codevault/public/data/part10.json")
         print("  python validate_part.py obc.db --db --part 11")
@@ -257,7 +271,8 @@ def main():
         db_path = sys.argv[1]
         part_idx = sys.argv.index('--part') + 1
         part = sys.argv[part_idx]
-        success = validator.validate_db(db_path, part)
+        since = int(sys.argv[sys.argv.index('--since') + 1]) if '--since' in sys.argv else None
+        success = validator.validate_db(db_path, part, since)
     else:
         json_path = sys.argv[1]
         success = validator.validate_json(json_path)